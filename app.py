@@ -1,4 +1,5 @@
 from PySide6.QtWidgets import QApplication
+import multiprocessing
 import sys
 # 自訂庫
 from src.app.main_window import ComicInfoEditor
@@ -17,4 +18,5 @@ def main():
     sys.exit(appSysCtl.application.exec())
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support() # 打包後批次處理的行程池需要
     main()
\ No newline at end of file
@@ -0,0 +1,114 @@
+"""
+ComicInfo.xml 寫入量比較：追加寫入（append_comicinfo）vs 原位置重寫（write_comicinfo_in_place）
+
+以 synthetic_library 產生壓縮檔，連續更新 ComicInfo 數次，比較每次寫入的位元組數與耗時
+執行前先檢查中斷的追加寫入不會損壞壓縮檔：
+- 寫入途中發生錯誤：壓縮檔截斷回原內容
+- 程式在寫入途中結束（留下標記檔與寫到一半的資料）：recover_interrupted_append 截斷回原內容
+
+用法：python benchmarks/bench_append_comicinfo.py [--pages 20 200] [--page-size 262144] [--updates 5]
+"""
+# 環境定義
+import sys
+from pathlib import Path
+## 動態添加專案根目錄到模組路徑（以當前檔案位置為基準）
+BASE_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str((BASE_DIR / "../").resolve()))
+sys.path.insert(0, str(BASE_DIR))
+
+# 函式庫導入
+import argparse
+import os
+import random
+import tempfile
+import time
+import zipfile
+## 自訂庫
+from synthetic_library import make_archive, make_comicinfo
+from src.function.zip_process import APPEND_MARKER_SUFFIX, append_comicinfo, read_comicinfo_entry, recover_interrupted_append
+from src.function.archive_writer import write_comicinfo_in_place
+
+def read_bytes(path: str) -> bytes:
+    """ 讀取整個檔案 """
+    with open(path, "rb") as f:
+        return f.read()
+
+def check_interrupted_append(work_dir: str) -> None:
+    """ 中斷的追加寫入（寫入錯誤、程式結束）都能回到追加前的內容 """
+    path = os.path.join(work_dir, "interrupted.cbz")
+    make_archive(path, 5, make_comicinfo(1, 1, 5), 1024, random.Random(0))
+    original = read_bytes(path)
+    # 大於 End of Central Directory 的搜尋範圍（64 KB），寫到一半時只靠搜尋找不到原本的目錄
+    xml = b"<ComicInfo><Summary>" + b"x" * 100000 + b"</Summary></ComicInfo>"
+
+    # 寫入途中發生錯誤（如磁碟已滿），以壓縮檔的 fsync 失敗模擬
+    real_fsync = os.fsync
+    def failing_fsync(fd):
+        if os.fstat(fd).st_size > len(original): # 標記檔的 fsync 照常進行
+            raise OSError(28, "No space left on device")
+        real_fsync(fd)
+    os.fsync = failing_fsync
+    try:
+        append_comicinfo(path, xml)
+        raise AssertionError("寫入錯誤未拋出")
+    except OSError:
+        pass
+    finally:
+        os.fsync = real_fsync
+    assert read_bytes(path) == original and not os.path.exists(path + APPEND_MARKER_SUFFIX)
+
+    # 程式在寫入途中結束：保留標記檔，只留下前半段追加的資料
+    append_comicinfo(path, xml)
+    appended = read_bytes(path)
+    with open(path, "wb") as f:
+        f.write(appended[:len(original) + (len(appended) - len(original)) // 2])
+    with open(path + APPEND_MARKER_SUFFIX, "w", encoding="ascii") as f:
+        f.write(str(len(original)))
+    assert recover_interrupted_append(path)
+    assert read_bytes(path) == original and not os.path.exists(path + APPEND_MARKER_SUFFIX)
+
+    # 復原後可以正常追加
+    append_comicinfo(path, xml)
+    with zipfile.ZipFile(path) as zf:
+        assert zf.testzip() is None
+    assert read_comicinfo_entry(path)[1] == xml
+
+def rewrite_comicinfo(path: str, xml: bytes) -> None:
+    """ 原位置重寫（經由暫存檔複製整個壓縮檔） """
+    write_comicinfo_in_place(path, path, xml)
+
+def measure(path: str, update, updates: int) -> tuple[float, float]:
+    """ 連續更新 ComicInfo，回傳 ( 平均寫入位元組, 平均秒數 ) """
+    written = 0
+    start = time.perf_counter()
+    for number in range(updates):
+        size_before = os.path.getsize(path)
+        update(path, make_comicinfo(1, number + 2, 20))
+        # 追加寫入只寫入增加的部分，重寫則寫入整個檔案
+        written += os.path.getsize(path) - size_before if update is append_comicinfo else os.path.getsize(path)
+    return written / updates, (time.perf_counter() - start) / updates
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[20, 200], help="每個壓縮檔的圖片數量")
+    parser.add_argument("--page-size", type=int, default=256 * 1024, help="每張圖片的位元組數")
+    parser.add_argument("--updates", type=int, default=5, help="連續更新次數")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        check_interrupted_append(work_dir)
+        print(f"{'pages':>6} {'archive (MB)':>13} {'append (KB)':>12} {'rewrite (KB)':>13} {'append (ms)':>12} {'rewrite (ms)':>13}")
+        for pages in args.pages:
+            results = []
+            for update in (append_comicinfo, rewrite_comicinfo):
+                path = os.path.join(work_dir, f"{pages}.cbz")
+                make_archive(path, pages, make_comicinfo(1, 1, 20), args.page_size, random.Random(pages))
+                results.append(measure(path, update, args.updates))
+            (append_bytes, append_time), (rewrite_bytes, rewrite_time) = results
+            print(
+                f"{pages:>6} {pages * args.page_size / (1024 * 1024):>13.1f} {append_bytes / 1024:>12.1f} {rewrite_bytes / 1024:>13.1f}"
+                f" {append_time * 1000:>12.2f} {rewrite_time * 1000:>13.2f}"
+            )
+
+if __name__ == "__main__":
+    main()
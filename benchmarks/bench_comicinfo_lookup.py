@@ -0,0 +1,60 @@
+"""
+ComicInfo.xml 查找效能比較：中央目錄快速路徑 vs zipfile
+
+用法：python benchmarks/bench_comicinfo_lookup.py [--entries 100 1000 5000 20000] [--repeat 20]
+"""
+# 環境定義
+import sys
+from pathlib import Path
+## 動態添加專案根目錄到模組路徑（以當前檔案位置為基準）
+BASE_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str((BASE_DIR / "../").resolve()))
+
+# 函式庫導入
+import argparse
+import os
+import tempfile
+import time
+import zipfile
+## 自訂庫
+from src.function.zip_process import read_comicinfo_entry_fast, read_comicinfo_entry_zipfile
+
+COMICINFO = b'<?xml version="1.0" encoding="utf-8"?>\n<ComicInfo><Title>Bench</Title></ComicInfo>\n'
+
+def make_archive(path: str, entries: int, with_comicinfo: bool) -> None:
+    """ 產生測試壓縮檔（ComicInfo.xml 放在最後，模擬最壞情況） """
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as zf:
+        for i in range(entries):
+            zf.writestr(f"chapter_{i // 100:03d}/page_{i:05d}.webp", b"")
+        if with_comicinfo:
+            zf.writestr("ComicInfo.xml", COMICINFO)
+
+def best_of(func, path: str, repeat: int) -> float:
+    """ 取多次執行中的最短時間（秒） """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, nargs="+", default=[100, 1000, 5000, 20000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'entries':>8} {'ComicInfo':>10} {'zipfile (ms)':>13} {'fast (ms)':>10} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for entries in args.entries:
+            for with_comicinfo in (True, False):
+                path = os.path.join(tmp, f"{entries}_{with_comicinfo}.cbz")
+                make_archive(path, entries, with_comicinfo)
+                # 結果必須一致
+                assert read_comicinfo_entry_fast(path) == read_comicinfo_entry_zipfile(path)
+                slow = best_of(read_comicinfo_entry_zipfile, path, args.repeat)
+                fast = best_of(read_comicinfo_entry_fast, path, args.repeat)
+                print(f"{entries:>8} {'yes' if with_comicinfo else 'no':>10} {slow * 1000:>13.3f} {fast * 1000:>10.3f} {slow / fast:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
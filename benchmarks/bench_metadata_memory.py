@@ -0,0 +1,97 @@
+"""
+file_metadata_cache 記憶體用量比較：parse_comicinfo 的巢狀 dict vs MetadataRecord
+
+以 synthetic_library 的 ComicInfo 模擬書庫（每個系列多本書，出版社、系列、語言等值重複）
+另以 --duplicates 指定內容完全相同的 ComicInfo 比例（例如整個系列共用同一份 ComicInfo）
+以 tracemalloc 量測建立快取後仍存活的記憶體，換算為每本書的位元組數
+
+用法：python benchmarks/bench_metadata_memory.py [--books 20000] [--series-size 50] [--pages 0 20] [--duplicates 0.1]
+"""
+# 環境定義
+import sys
+from pathlib import Path
+## 動態添加專案根目錄到模組路徑（以當前檔案位置為基準）
+BASE_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str((BASE_DIR / "../").resolve()))
+sys.path.insert(0, str(BASE_DIR))
+
+# 函式庫導入
+import argparse
+import gc
+import pickle
+import time
+import tracemalloc
+## 自訂庫
+from synthetic_library import make_comicinfo
+from src.function.comicinfo_process import parse_comicinfo
+from src.classes.metadata_record import MetadataRecord
+
+# 帶預設 namespace（_nsmap 的鍵為 None）與自訂前綴的 ComicInfo
+NAMESPACED = b"""<?xml version="1.0" encoding="utf-8"?>
+<ComicInfo xmlns="https://example.com/comicinfo" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+  <Title>Namespaced</Title>
+  <mylar:Notes xmlns:mylar="https://example.com/mylar">Tagged</mylar:Notes>
+  <Pages>
+    <Page Image="0" Type="FrontCover" />
+  </Pages>
+</ComicInfo>
+"""
+
+def check_round_trip() -> None:
+    """ 帶 namespace 的 ComicInfo 轉為紀錄後內容不變（含序列化） """
+    parsed = parse_comicinfo(NAMESPACED)
+    assert None in parsed['_nsmap']
+    record = MetadataRecord.from_dict(parsed)
+    assert record == parsed and record.to_dict() == parsed
+    assert pickle.loads(pickle.dumps(record)) is record
+
+def make_payloads(books: int, series_size: int, pages: int, duplicates: float) -> list[bytes]:
+    """ 產生各本書的 ComicInfo（前 duplicates 比例的書與同系列第一本內容相同） """
+    duplicated = int(books * duplicates)
+    return [
+        make_comicinfo(i // series_size, 1 if i < duplicated else i % series_size + 1, pages)
+        for i in range(books)
+    ]
+
+def measure(build, parsed: list[dict]) -> tuple[int, dict]:
+    """ 建立快取，回傳 ( 存活位元組, 快取 ) """
+    gc.collect()
+    tracemalloc.start()
+    cache = {f"Series/{i:06d}.cbz": build(data) for i, data in enumerate(parsed)}
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, cache
+
+def build_time(build, parsed: list[dict]) -> float:
+    """ 建立快取所需秒數（不啟用 tracemalloc） """
+    start = time.perf_counter()
+    for data in parsed:
+        build(data)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--books", type=int, default=20000)
+    parser.add_argument("--series-size", type=int, default=50, help="每個系列的書本數")
+    parser.add_argument("--pages", type=int, nargs="+", default=[0, 20], help="Pages 中的 Page 數量")
+    parser.add_argument("--duplicates", type=float, default=0.1, help="內容完全相同的 ComicInfo 比例")
+    args = parser.parse_args()
+    check_round_trip()
+
+    print(f"{args.books} 本書，每系列 {args.series_size} 本，{args.duplicates:.0%} 內容重複")
+    print(f"{'pages':>6} {'dict (B/book)':>14} {'record (B/book)':>16} {'ratio':>7} {'convert (µs/book)':>18}")
+    for pages in args.pages:
+        payloads = make_payloads(args.books, args.series_size, pages, args.duplicates)
+        legacy_bytes, legacy = measure(parse_comicinfo, payloads)
+        record_bytes, records = measure(lambda xml: MetadataRecord.from_dict(parse_comicinfo(xml)), payloads)
+        assert legacy == records # 內容必須一致
+        convert_time = build_time(MetadataRecord.from_dict, list(legacy.values()))
+        del legacy, records
+        print(
+            f"{pages:>6} {legacy_bytes / args.books:>14.0f} {record_bytes / args.books:>16.0f}"
+            f" {legacy_bytes / record_bytes:>6.1f}x {convert_time / args.books * 1e6:>18.1f}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+編輯器輸入套用效能比較：逐欄位 str.replace（舊版）vs 每批次編譯一次的 MetadataTemplate
+
+模擬一次批次：同一組編輯器輸入套用到大量檔案（每個檔案的 fileName / index 不同）
+
+用法：python benchmarks/bench_metadata_template.py [--files 20000] [--fields 20] [--placeholder-ratio 0.25]
+"""
+# 環境定義
+import sys
+from pathlib import Path
+## 動態添加專案根目錄到模組路徑（以當前檔案位置為基準）
+BASE_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str((BASE_DIR / "../").resolve()))
+
+# 函式庫導入
+import argparse
+import time
+## 自訂庫
+from src.classes.metadata_template import MetadataTemplate
+
+def resolve_placeholders_legacy(template: str, context: dict) -> str:
+    """ 舊版實作（對照用） """
+    if not isinstance(template, str):
+        return template
+    for key, value in context.items():
+        placeholder = f"{{{key}}}"
+        template = template.replace(placeholder, str(value))
+    return template
+
+def apply_legacy(editor_input: dict, contexts: list[dict]) -> list[dict]:
+    """ 舊版：每個檔案、每個欄位、每個內容鍵各做一次 str.replace """
+    return [
+        {
+            prefix: {key: resolve_placeholders_legacy(value, context) for key, value in fields.items()}
+            for prefix, fields in editor_input['_fields'].items()
+        }
+        for context in contexts
+    ]
+
+def apply_compiled(editor_input: dict, contexts: list[dict]) -> list[dict]:
+    """ 新版：編譯一次，逐檔單次組合 """
+    template = MetadataTemplate(editor_input)
+    return [template.render(context) for context in contexts]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=20000)
+    parser.add_argument("--fields", type=int, default=20)
+    parser.add_argument("--placeholder-ratio", type=float, default=0.25, help="含佔位符的欄位比例")
+    args = parser.parse_args()
+
+    placeholder_fields = round(args.fields * args.placeholder_ratio)
+    editor_input = {'_fields': {'base': {
+        f"Field{i}": "{fileNameClear} - {index}" if i < placeholder_fields else f"Literal value {i}"
+        for i in range(args.fields)
+    }}}
+    contexts = [
+        {"fileName": f"🔒Series {i // 100} - {i:05d}", "index": i + 1, "fileNameClear": f"Series {i // 100} - {i:05d}"}
+        for i in range(args.files)
+    ]
+
+    start = time.perf_counter()
+    legacy = apply_legacy(editor_input, contexts)
+    legacy_time = time.perf_counter() - start
+    start = time.perf_counter()
+    compiled = apply_compiled(editor_input, contexts)
+    compiled_time = time.perf_counter() - start
+    assert legacy == compiled # 結果必須一致
+
+    print(f"{args.files} 個檔案 × {args.fields} 個欄位（{placeholder_fields} 個含佔位符）")
+    print(f"舊版：{legacy_time * 1000:.1f} ms（{legacy_time / args.files * 1e6:.2f} µs/檔）")
+    print(f"編譯：{compiled_time * 1000:.1f} ms（{compiled_time / args.files * 1e6:.2f} µs/檔）")
+    print(f"加速：{legacy_time / compiled_time:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+parse_comicinfo 解析效能比較：單次走訪（重複使用解析器）vs 舊版（完整走訪兩次，每個元素都建立 QName）
+
+樣本：
+  - synthetic：synthetic_library 產生的 ComicInfo（含 50 個 Page）
+  - minimal：只有少數欄位（多數實際漫畫的情況）
+  - namespaced：帶有自訂 namespace 前綴與註解的 ComicInfo
+  - 也可用 --samples 指定實際的 ComicInfo.xml 檔案
+兩種實作的解析結果必須一致（舊版無法解析的樣本除外）
+
+用法：python benchmarks/bench_parse_comicinfo.py [--samples 檔案 ...] [--count 20000]
+"""
+# 環境定義
+import sys
+from pathlib import Path
+## 動態添加專案根目錄到模組路徑（以當前檔案位置為基準）
+BASE_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str((BASE_DIR / "../").resolve()))
+sys.path.insert(0, str(BASE_DIR))
+
+# 函式庫導入
+import argparse
+import time
+import lxml.etree as ET
+## 自訂庫
+from synthetic_library import make_comicinfo
+from src.function.comicinfo_process import parse_comicinfo
+
+MINIMAL = b"""<?xml version="1.0" encoding="utf-8"?>
+<ComicInfo>
+  <Title>Minimal</Title>
+  <Series>Series</Series>
+  <Number>1</Number>
+  <Writer>Writer</Writer>
+  <PageCount>24</PageCount>
+</ComicInfo>
+"""
+
+NAMESPACED = b"""<?xml version="1.0" encoding="utf-8"?>
+<ComicInfo xmlns:xsd="http://www.w3.org/2001/XMLSchema" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+  <!-- exported by a tagger -->
+  <Title>Namespaced</Title>
+  <Series>Series</Series>
+  <Number>3</Number>
+  <mylar:Notes xmlns:mylar="https://example.com/mylar">Tagged</mylar:Notes>
+  <Web>https://example.com/comic/3</Web>
+  <Pages>
+    <Page Image="0" Type="FrontCover" />
+    <Page Image="1" />
+  </Pages>
+</ComicInfo>
+"""
+
+def parse_comicinfo_legacy(xml_content: bytes) -> dict:
+    """ 舊版實作（對照用） """
+    try:
+        tree = ET.fromstring(xml_content)
+    except Exception as e:
+        return {}
+
+    nsmap = tree.nsmap.copy() if tree.nsmap else {}
+    data = {'_nsmap': nsmap, '_fields': {}, '_complex': {}}
+
+    for elem in tree.iter():
+        prefix = elem.prefix
+        namespace_uri = ET.QName(elem).namespace
+
+        if prefix and namespace_uri and prefix not in data['_nsmap']:
+            data['_nsmap'][prefix] = namespace_uri
+
+    for elem in tree.iterchildren():
+        prefix = elem.prefix or 'base'
+        tag = ET.QName(elem).localname
+        text = elem.text.strip() if elem.text else ''
+
+        if len(elem.attrib) > 0 or len(elem):
+            if prefix not in data['_complex']:
+                data['_complex'][prefix] = {}
+            if tag not in data['_complex'][prefix]:
+                data['_complex'][prefix][tag] = []
+
+            entry = {'_attrs': dict(elem.attrib), '_children': []}
+            for child in elem:
+                child_tag = ET.QName(child).localname
+                child_entry = {
+                    'tag': child_tag,
+                    'text': child.text.strip() if child.text else '',
+                    'attrib': dict(child.attrib)
+                }
+                entry['_children'].append(child_entry)
+
+            data['_complex'][prefix][tag].append(entry)
+        else:
+            if prefix not in data['_fields']:
+                data['_fields'][prefix] = {}
+            data['_fields'][prefix][tag] = text
+
+    return data
+
+def throughput(func, xml: bytes, count: int) -> float:
+    """ 每秒解析次數（取三輪中最快的一輪） """
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(count):
+            func(xml)
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", nargs="*", default=[], help="實際的 ComicInfo.xml 檔案")
+    parser.add_argument("--count", type=int, default=20000)
+    args = parser.parse_args()
+
+    samples = {
+        "synthetic": make_comicinfo(1, 1, 50),
+        "minimal": MINIMAL,
+        "namespaced": NAMESPACED,
+    }
+    for path in args.samples:
+        samples[Path(path).name] = Path(path).read_bytes()
+
+    print(f"{'sample':>16} {'bytes':>7} {'legacy (/s)':>12} {'single-pass (/s)':>17} {'speedup':>8}")
+    for name, xml in samples.items():
+        try:
+            expected = parse_comicinfo_legacy(xml)
+        except ValueError: # 舊版遇到註解等非元素節點時會拋出錯誤
+            expected = None
+        if expected is not None:
+            assert parse_comicinfo(xml) == expected, name
+            legacy = throughput(parse_comicinfo_legacy, xml, args.count)
+        current = throughput(parse_comicinfo, xml, args.count)
+        legacy_text = f"{legacy:>12.0f}" if expected is not None else f"{'error':>12}"
+        speedup_text = f"{current / legacy:>7.2f}x" if expected is not None else f"{'-':>8}"
+        print(f"{name:>16} {len(xml):>7} {legacy_text} {current:>17.0f} {speedup_text}")
+
+if __name__ == "__main__":
+    main()
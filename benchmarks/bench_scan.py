@@ -0,0 +1,148 @@
+"""
+漫畫資料夾掃描效能測試（無介面，可於建置機以 offscreen 平台執行）
+
+產生合成漫畫庫後量測：
+  - FileReadWrite.read_comic_folder 冷啟動（空索引）與熱啟動（索引命中）至 fileReadReady 的時間
+  - parse_comicinfo 解析速度
+結果以 JSON 輸出，可供回歸比較
+
+用法：python benchmarks/bench_scan.py [--archives 1000] [--library 既有資料夾] [--output result.json]
+"""
+# 環境定義
+import os
+import sys
+from pathlib import Path
+## 動態添加專案根目錄到模組路徑（以當前檔案位置為基準）
+BASE_DIR = Path(__file__).resolve().parent
+ROOT_DIR = (BASE_DIR / "../").resolve()
+sys.path.insert(0, str(ROOT_DIR))
+sys.path.insert(0, str(BASE_DIR))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 函式庫導入
+import argparse
+import json
+import platform
+import tempfile
+import time
+from PySide6 import __version__ as PYSIDE_VERSION
+from PySide6.QtCore import QCoreApplication, QEventLoop, QTimer
+## 自訂庫
+from synthetic_library import make_comicinfo, make_library
+from src.classes.metadata_index import MetadataIndex
+from src.core.controller import BackendCore
+from src.function.comicinfo_process import parse_comicinfo
+from src.global_data_store import GLOBAL_DATA_STORE
+from src.signal_bus import SIGNAL_BUS
+
+def peak_rss_mb() -> float | None:
+    """ 取得目前為止的最高常駐記憶體（MB），不支援的平台回傳 None """
+    try:
+        import resource
+    except ImportError:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 單位為 KB，macOS 為 bytes
+    return maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024
+
+def time_scan(backend: BackendCore, library: str, timeout: float) -> dict:
+    """ 量測一次完整掃描（read_comic_folder 至 fileReadReady） """
+    loop = QEventLoop()
+    SIGNAL_BUS.fileReadReady.connect(loop.quit)
+    QTimer.singleShot(int(timeout * 1000), loop.quit)
+    # 確保 source_dir 變更會觸發讀取
+    GLOBAL_DATA_STORE.update({"source_dir": ""})
+    start = time.perf_counter()
+    GLOBAL_DATA_STORE.update({"source_dir": library})
+    loop.exec()
+    elapsed = time.perf_counter() - start
+    SIGNAL_BUS.fileReadReady.disconnect(loop.quit)
+
+    items = len(GLOBAL_DATA_STORE.get("file_list"))
+    if elapsed >= timeout:
+        raise TimeoutError(f"掃描超過 {timeout} 秒")
+    return {
+        "seconds": round(elapsed, 4),
+        "items": items,
+        "files_per_second": round(items / elapsed, 1) if elapsed > 0 else None,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+def time_parse(samples: int, pages: int, repeat: int) -> dict:
+    """ 量測 parse_comicinfo 解析速度 """
+    documents = [make_comicinfo(i % 97, i, pages) for i in range(samples)]
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for document in documents:
+            parse_comicinfo(document)
+        best = min(best, time.perf_counter() - start)
+    return {
+        "documents": samples,
+        "pages_per_document": pages,
+        "seconds": round(best, 4),
+        "documents_per_second": round(samples / best, 1),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--library", help="使用既有的漫畫資料夾（不產生合成資料）")
+    parser.add_argument("--archives", type=int, default=1000)
+    parser.add_argument("--comic-folders", type=int, default=100)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--large-archives", type=int, default=5)
+    parser.add_argument("--large-pages", type=int, default=5000)
+    parser.add_argument("--comicinfo-ratio", type=float, default=0.8)
+    parser.add_argument("--workers", type=int, help="讀取執行緒數（預設使用程式設定）")
+    parser.add_argument("--parse-samples", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=600)
+    parser.add_argument("--output", help="結果 JSON 輸出路徑（預設輸出至標準輸出）")
+    args = parser.parse_args()
+
+    app = QCoreApplication(sys.argv)
+    os.chdir(ROOT_DIR) # 翻譯檔以相對路徑載入
+
+    with tempfile.TemporaryDirectory() as tmp:
+        result = {
+            "python": platform.python_version(),
+            "pyside6": PYSIDE_VERSION,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        }
+        library = args.library
+        if not library:
+            library = os.path.join(tmp, "library")
+            start = time.perf_counter()
+            result["library"] = make_library(
+                library, args.archives, args.comic_folders, args.depth, pages=args.pages,
+                large_archives=args.large_archives, large_pages=args.large_pages,
+                comicinfo_ratio=args.comicinfo_ratio,
+            )
+            result["library"]["generate_seconds"] = round(time.perf_counter() - start, 2)
+
+        backend = BackendCore()
+        # 使用獨立的索引，避免影響使用者快取
+        backend.file_read_write.metadata_index = MetadataIndex(os.path.join(tmp, "metadata_index.sqlite3"))
+        if args.workers:
+            GLOBAL_DATA_STORE.update({"scan_workers": args.workers})
+        result["scan_workers"] = GLOBAL_DATA_STORE.get("scan_workers")
+
+        result["scan_cold"] = time_scan(backend, library, args.timeout)
+        result["scan_warm"] = time_scan(backend, library, args.timeout)
+        result["parse_comicinfo"] = time_parse(args.parse_samples, args.pages, args.repeat)
+        result["peak_rss_mb"] = peak_rss_mb()
+
+        backend.file_read_write.stop_scan()
+
+    output = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    app.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+update_comicinfo_data 效能比較：深層複製後更新的 dict（舊版避免修改快取的作法）vs 寫入時複製的 MetadataRecord
+
+模擬一次批次：同一組編輯器輸入套用到大量快取紀錄，只修改少數欄位
+紀錄越大（Pages 越多），深層複製的成本越高；寫入時複製只重建有變更的 prefix
+
+用法：python benchmarks/bench_update_comicinfo.py [--pages 0 20 50] [--edited 1 5] [--count 20000]
+"""
+# 環境定義
+import sys
+from pathlib import Path
+## 動態添加專案根目錄到模組路徑（以當前檔案位置為基準）
+BASE_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str((BASE_DIR / "../").resolve()))
+sys.path.insert(0, str(BASE_DIR))
+
+# 函式庫導入
+import argparse
+import copy
+import time
+## 自訂庫
+from synthetic_library import make_comicinfo
+from src.classes.metadata_record import MetadataRecord
+from src.classes.metadata_template import MetadataTemplate
+from src.function.comicinfo_process import parse_comicinfo, update_comicinfo_data
+
+EDITABLE_FIELDS = ("Title", "StoryArc", "Genre", "Tags", "AgeRating")
+
+def update_legacy(context: dict, original: dict, template: MetadataTemplate) -> dict:
+    """ 舊版（對照用）：深層複製原資料後直接修改 """
+    data = copy.deepcopy(original)
+    for prefix, fields in template.render(context).items():
+        data['_fields'].setdefault(prefix, {}).update(fields)
+    return data
+
+def per_second(func, count: int) -> float:
+    """ 每秒執行次數（取三輪中最快的一輪） """
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(count):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[0, 20, 50], help="Pages 中的 Page 數量")
+    parser.add_argument("--edited", type=int, nargs="+", default=[1, 5], help="修改的欄位數")
+    parser.add_argument("--count", type=int, default=20000)
+    args = parser.parse_args()
+
+    context = {"fileName": "Book 1", "index": 1, "fileNameClear": "Book 1"}
+    print(f"{'pages':>6} {'edited':>7} {'deepcopy (/s)':>14} {'copy-on-write (/s)':>19} {'speedup':>8}")
+    for pages in args.pages:
+        parsed = parse_comicinfo(make_comicinfo(1, 1, pages))
+        record = MetadataRecord.from_dict(parsed)
+        for edited in args.edited:
+            template = MetadataTemplate({'_fields': {'base': {
+                tag: "{fileNameClear}" for tag in EDITABLE_FIELDS[:edited]
+            }}})
+            result = update_comicinfo_data(context, record, template)
+            assert result == update_legacy(context, parsed, template) # 結果必須一致
+            assert record == parsed # 快取紀錄不可被修改
+            legacy_rate = per_second(lambda: update_legacy(context, parsed, template), args.count)
+            record_rate = per_second(lambda: update_comicinfo_data(context, record, template), args.count)
+            print(f"{pages:>6} {edited:>7} {legacy_rate:>14.0f} {record_rate:>19.0f} {record_rate / legacy_rate:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+合成漫畫庫產生器（供效能測試使用）
+
+用法：python benchmarks/synthetic_library.py 輸出資料夾 [--archives 1000] [--comic-folders 100] [--depth 2] ...
+"""
+# 函式庫導入
+import argparse
+import json
+import os
+import random
+import shutil
+import zipfile
+
+COMICINFO_TEMPLATE = """<?xml version="1.0" encoding="utf-8"?>
+<ComicInfo xmlns:xsd="http://www.w3.org/2001/XMLSchema" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+  <Title>{title}</Title>
+  <Series>{series}</Series>
+  <Number>{number}</Number>
+  <Volume>{volume}</Volume>
+  <Summary>{summary}</Summary>
+  <Year>{year}</Year>
+  <Writer>Writer {series_no}</Writer>
+  <Penciller>Penciller {series_no}</Penciller>
+  <Publisher>Publisher {publisher}</Publisher>
+  <Genre>Action, Comedy</Genre>
+  <Tags>tag_a, tag_b, tag_c</Tags>
+  <LanguageISO>zh</LanguageISO>
+  <PageCount>{pages}</PageCount>
+  <Pages>
+{page_entries}
+  </Pages>
+</ComicInfo>
+"""
+FRONT_COVER = ' Type="FrontCover"'
+
+def make_comicinfo(series_no: int, number: int, pages: int) -> bytes:
+    """ 產生 ComicInfo.xml 內容 """
+    page_entries = "\n".join(
+        f'    <Page Image="{i}" ImageSize="{100000 + i}" ImageWidth="1200" ImageHeight="1800"{FRONT_COVER if i == 0 else ""} />'
+        for i in range(min(pages, 50))
+    )
+    return COMICINFO_TEMPLATE.format(
+        title=f"Chapter {number}",
+        series=f"Series {series_no}",
+        series_no=series_no,
+        number=number,
+        volume=number // 10 + 1,
+        summary=f"Synthetic summary for series {series_no}, chapter {number}. " * 3,
+        year=2000 + series_no % 25,
+        publisher=series_no % 7,
+        pages=pages,
+        page_entries=page_entries,
+    ).encode("utf-8")
+
+def make_archive(path: str, pages: int, comicinfo: bytes | None, page_size: int, rng: random.Random) -> None:
+    """ 產生漫畫壓縮檔（圖片以不可壓縮的隨機資料填充） """
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as zf:
+        if comicinfo is not None:
+            zf.writestr("ComicInfo.xml", comicinfo, zipfile.ZIP_DEFLATED)
+        for i in range(pages):
+            zf.writestr(f"{i:05d}.jpg", rng.randbytes(page_size))
+
+def make_library(
+    root: str,
+    archives: int = 1000,
+    comic_folders: int = 100,
+    depth: int = 2,
+    fanout: int = 8,
+    pages: int = 20,
+    large_archives: int = 5,
+    large_pages: int = 5000,
+    page_size: int = 64,
+    comicinfo_ratio: float = 0.8,
+    seed: int = 0,
+) -> dict:
+    """
+    產生合成漫畫庫，回傳統計資料
+    壓縮檔平均分佈在 depth 層、每層 fanout 個子資料夾的葉節點；另含純圖片的漫畫資料夾與大量項目的壓縮檔
+    """
+    rng = random.Random(seed)
+    shutil.rmtree(root, ignore_errors=True)
+    os.makedirs(root)
+
+    # 建立巢狀資料夾（葉節點放置漫畫）
+    leaves = [""]
+    for level in range(depth):
+        leaves = [os.path.join(parent, f"level{level}_{i:02d}") for parent in leaves for i in range(fanout)]
+    for leaf in leaves:
+        os.makedirs(os.path.join(root, leaf), exist_ok=True)
+
+    stats = {"archives": 0, "with_comicinfo": 0, "comic_folders": 0, "entries": 0, "bytes": 0}
+
+    # 壓縮檔
+    for i in range(archives + large_archives):
+        leaf = leaves[i % len(leaves)]
+        is_large = i >= archives
+        archive_pages = large_pages if is_large else pages
+        comicinfo = make_comicinfo(i % 97, i, archive_pages) if rng.random() < comicinfo_ratio else None
+        path = os.path.join(root, leaf, f"{'large' if is_large else 'chapter'}_{i:06d}.cbz")
+        make_archive(path, archive_pages, comicinfo, page_size, rng)
+        stats["archives"] += 1
+        stats["with_comicinfo"] += comicinfo is not None
+        stats["entries"] += archive_pages + (comicinfo is not None)
+        stats["bytes"] += os.path.getsize(path)
+
+    # 純圖片漫畫資料夾（一半附帶獨立的 ComicInfo.xml）
+    for i in range(comic_folders):
+        folder = os.path.join(root, leaves[i % len(leaves)], f"folder_{i:06d}")
+        os.makedirs(folder)
+        for page in range(pages):
+            with open(os.path.join(folder, f"{page:05d}.png"), "wb") as f:
+                f.write(rng.randbytes(page_size))
+        if i % 2 == 0:
+            with open(os.path.join(folder, "ComicInfo.xml"), "wb") as f:
+                f.write(make_comicinfo(i % 97, i, pages))
+        stats["comic_folders"] += 1
+
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("root")
+    parser.add_argument("--archives", type=int, default=1000)
+    parser.add_argument("--comic-folders", type=int, default=100)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--fanout", type=int, default=8)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--large-archives", type=int, default=5)
+    parser.add_argument("--large-pages", type=int, default=5000)
+    parser.add_argument("--page-size", type=int, default=64)
+    parser.add_argument("--comicinfo-ratio", type=float, default=0.8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    stats = make_library(
+        args.root, args.archives, args.comic_folders, args.depth, args.fanout, args.pages,
+        args.large_archives, args.large_pages, args.page_size, args.comicinfo_ratio, args.seed,
+    )
+    print(json.dumps(stats, indent=2))
+
+if __name__ == "__main__":
+    main()
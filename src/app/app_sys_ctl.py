@@ -1,4 +1,4 @@
-from PySide6.QtCore import QTranslator, QCoreApplication, QObject
+from PySide6.QtCore import QTranslator, QCoreApplication, QObject, QTimer
 from PySide6.QtWidgets import QApplication
 import sys
 # 自訂庫
@@ -21,12 +21,16 @@ class AppSysCtl(QObject):
 
         #訊號連接
         self.signal_connection()
+        # 事件迴圈開始後通知（視窗已顯示）
+        QTimer.singleShot(0, SIGNAL_BUS.appStarted.emit)
 
     ### 初始化函數 ###
 
     def signal_connection(self):
         """ 訊號連接 """
         SIGNAL_BUS.appSetting.langChanged.connect(self.changeLang)
+        # 應用結束前通知（停止背景執行緒）
+        self.application.aboutToQuit.connect(SIGNAL_BUS.aboutToQuit)
 
     ### 功能函式 ###
 
@@ -80,6 +80,7 @@ class ComicInfoEditor(QWidget):
         # 訊息框
         SIGNAL_BUS.ui.sendCritical.connect(self.send_critical)
         SIGNAL_BUS.ui.sendInformation.connect(self.send_information)
+        SIGNAL_BUS.ui.askResumeBatch.connect(self.ask_resume_batch)
         # 語言刷新
         SIGNAL_BUS.ui.retranslateUi.connect(self.retranslateUi)
 
@@ -107,6 +108,15 @@ class ComicInfoEditor(QWidget):
         """ 顯示提示訊息 """
         QMessageBox.information(self, title, text)
 
+    def ask_resume_batch(self, done: int, total: int) -> None:
+        """ 詢問是否接續中斷的批次 """
+        reply = QMessageBox.question(
+            self,
+            TR.SEND_MESSAGE["提示"](),
+            TR.SEND_MESSAGE["上次的批次處理未完成（已完成 {done} / {total} 個檔案），是否繼續處理剩餘的檔案？"]().format(done=done, total=total),
+        )
+        SIGNAL_BUS.resumeBatch.emit(reply == QMessageBox.StandardButton.Yes)
+
     def retranslateUi(self):
         """ UI 語言刷新 """
         self.setWindowTitle(TR.UI_CONSTANTS["ComicInfo 編輯器"]())
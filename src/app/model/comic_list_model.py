@@ -7,8 +7,11 @@ from src.signal_bus import SIGNAL_BUS
 class ComicListModel(QAbstractListModel):
     def __init__(self):
         super().__init__()
+        self._appending = False
         # 信號連結
         SIGNAL_BUS.dataChange.fileListChanged.connect(self.notify_data_changed)
+        SIGNAL_BUS.dataChange.fileListAboutToAppend.connect(self.rows_about_to_append)
+        SIGNAL_BUS.dataChange.fileListAppended.connect(self.rows_appended)
 
     def rowCount(self, parent=QModelIndex()) -> int:
         """ 回覆資料列數 """
@@ -110,4 +113,17 @@ class ComicListModel(QAbstractListModel):
     def notify_data_changed(self, fileList: list):
         """ 通知變更 """
         # 當外部資料改變（但沒有透過 Model 操作），用這個通知 UI 更新
+        if self._appending:
+            return # 追加列已由插入通知處理
         self.layoutChanged.emit()
+
+    def rows_about_to_append(self, count: int):
+        """ 即將在列表尾端追加資料列 """
+        start = self.rowCount()
+        self._appending = True
+        self.beginInsertRows(QModelIndex(), start, start + count - 1)
+
+    def rows_appended(self, count: int):
+        """ 追加資料列完成 """
+        self.endInsertRows()
+        self._appending = False
@@ -2,7 +2,7 @@ from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QListWidget, QFileDialog, QLineEdit,
     QMessageBox, QComboBox, QAbstractItemView, QTabWidget,
-    QTextEdit, QProgressBar, QSpinBox, QScrollArea, QSizePolicy
+    QTextEdit, QProgressBar, QSpinBox, QScrollArea, QSizePolicy, QCheckBox
 )
 from PySide6.QtCore import Qt, QSignalBlocker
 # 自訂庫
@@ -41,9 +41,84 @@ class AppSettingTab(QWidget):
         self.write_mode_combo.addItems([
             TR.UI_CONSTANTS["原位置寫入"](),
             TR.UI_CONSTANTS["鋪平寫入"](),
+            TR.UI_CONSTANTS["追加寫入"](),
         ])
         self.write_mode_combo.setCurrentIndex(GLOBAL_DATA_STORE.get("write_mode")) # 載入初始值
 
+        # 資料夾寫入模式
+        folder_write_mode_layout = QHBoxLayout()
+        self.folder_write_mode_label = QLabel(TR.UI_CONSTANTS["資料夾寫入模式："]())
+        self.folder_write_mode_combo = QComboBox()
+        self.folder_write_mode_combo.addItems([
+            TR.UI_CONSTANTS["打包為壓縮檔"](),
+            TR.UI_CONSTANTS["僅寫入 ComicInfo.xml"](),
+        ])
+        self.folder_write_mode_combo.setCurrentIndex(GLOBAL_DATA_STORE.get("folder_write_mode")) # 載入初始值
+
+        # 資料夾打包壓縮
+        compression_profile_layout = QHBoxLayout()
+        self.compression_profile_label = QLabel(TR.UI_CONSTANTS["打包壓縮："]())
+        self.compression_profile_combo = QComboBox()
+        self.compression_profile_combo.addItems([
+            TR.UI_CONSTANTS["不壓縮"](),
+            TR.UI_CONSTANTS["全部壓縮"](),
+            TR.UI_CONSTANTS["依副檔名壓縮"](),
+        ])
+        self.compression_profile_combo.setCurrentIndex(GLOBAL_DATA_STORE.get("compression_profile")) # 載入初始值
+
+        # 壓縮等級
+        compression_level_layout = QHBoxLayout()
+        self.compression_level_label = QLabel(TR.UI_CONSTANTS["壓縮等級："]())
+        self.compression_level_spin = QSpinBox()
+        self.compression_level_spin.setRange(1, 9)
+        self.compression_level_spin.setValue(GLOBAL_DATA_STORE.get("compression_level")) # 載入初始值
+
+        # 不壓縮副檔名（已壓縮的圖片格式再壓縮幾乎沒有效果）
+        stored_exts_layout = QHBoxLayout()
+        self.stored_exts_label = QLabel(TR.UI_CONSTANTS["不壓縮副檔名："]())
+        self.stored_exts_edit = QLineEdit()
+        self.stored_exts_edit.setText(', '.join(GLOBAL_DATA_STORE.get("stored_exts"))) # 載入初始值
+
+        # 整理門檻（追加寫入的孤立資料比例超過時改為完整重寫，0 為不整理）
+        compact_threshold_layout = QHBoxLayout()
+        self.compact_threshold_label = QLabel(TR.UI_CONSTANTS["整理門檻（%）："]())
+        self.compact_threshold_spin = QSpinBox()
+        self.compact_threshold_spin.setRange(0, 100)
+        self.compact_threshold_spin.setValue(GLOBAL_DATA_STORE.get("compact_threshold")) # 載入初始值
+
+        # 略過未變更的檔案
+        self.skip_unchanged_check = QCheckBox(TR.UI_CONSTANTS["略過未變更的檔案"]())
+        self.skip_unchanged_check.setChecked(GLOBAL_DATA_STORE.get("skip_unchanged")) # 載入初始值
+
+        # 保留 ComicInfo 原始格式（以原始內容為基礎只改寫變更的欄位，保留排列與註解）
+        self.patch_comicinfo_check = QCheckBox(TR.UI_CONSTANTS["保留 ComicInfo 原始格式（只修改有變更的欄位）"]())
+        self.patch_comicinfo_check.setChecked(GLOBAL_DATA_STORE.get("patch_comicinfo")) # 載入初始值
+
+        # 輸出驗證（寫入後重新讀取輸出檔，檢查結構、CRC 與 ComicInfo.xml）
+        verify_mode_layout = QHBoxLayout()
+        self.verify_mode_label = QLabel(TR.UI_CONSTANTS["輸出驗證："]())
+        self.verify_mode_combo = QComboBox()
+        self.verify_mode_combo.addItems([
+            TR.UI_CONSTANTS["關閉"](),
+            TR.UI_CONSTANTS["抽樣檢查"](),
+            TR.UI_CONSTANTS["完整檢查"](),
+        ])
+        self.verify_mode_combo.setCurrentIndex(GLOBAL_DATA_STORE.get("verify_mode")) # 載入初始值
+
+        # 複製緩衝大小
+        copy_buffer_layout = QHBoxLayout()
+        self.copy_buffer_label = QLabel(TR.UI_CONSTANTS["複製緩衝（KB）："]())
+        self.copy_buffer_spin = QSpinBox()
+        self.copy_buffer_spin.setRange(64, 65536)
+        self.copy_buffer_spin.setValue(GLOBAL_DATA_STORE.get("copy_buffer_kb")) # 載入初始值
+
+        # 單一工作記憶體上限
+        job_memory_limit_layout = QHBoxLayout()
+        self.job_memory_limit_label = QLabel(TR.UI_CONSTANTS["單一工作記憶體上限（MB）："]())
+        self.job_memory_limit_spin = QSpinBox()
+        self.job_memory_limit_spin.setRange(16, 4096)
+        self.job_memory_limit_spin.setValue(GLOBAL_DATA_STORE.get("job_memory_limit_mb")) # 載入初始值
+
         # 圖片附檔名
         image_extension_layout = QHBoxLayout()
         self.image_extension_label = QLabel(TR.UI_CONSTANTS["圖片附檔名："]())
@@ -56,6 +131,19 @@ class AppSettingTab(QWidget):
         self.allow_files_edit = QLineEdit()
         self.allow_files_edit.setText(', '.join(GLOBAL_DATA_STORE.get("allow_files"))) # 載入初始值
 
+        # 忽略項目
+        ignore_patterns_layout = QHBoxLayout()
+        self.ignore_patterns_label = QLabel(TR.UI_CONSTANTS["忽略項目："]())
+        self.ignore_patterns_edit = QLineEdit()
+        self.ignore_patterns_edit.setText(', '.join(GLOBAL_DATA_STORE.get("ignore_patterns"))) # 載入初始值
+
+        # 檔名規則（正規表示式，擷取群組可用於編輯欄位的 {match:N} 佔位符）
+        filename_pattern_layout = QHBoxLayout()
+        self.filename_pattern_label = QLabel(TR.UI_CONSTANTS["檔名規則："]())
+        self.filename_pattern_edit = QLineEdit()
+        self.filename_pattern_edit.setPlaceholderText(TR.UI_CONSTANTS["正規表示式，編輯欄位中以 {match:1} 或 {match:名稱} 取用擷取群組"]())
+        self.filename_pattern_edit.setText(GLOBAL_DATA_STORE.get("filename_pattern")) # 載入初始值
+
         # 語言選擇
         lang_select_layout = QHBoxLayout()
         self.lang_select_label = QLabel(TR.UI_CONSTANTS["語言選擇："]())
@@ -63,6 +151,59 @@ class AppSettingTab(QWidget):
         self.lang_select_combo.addItems(GLOBAL_DATA_STORE.get("langFileData").keys())
         self.lang_select_combo.setCurrentText(GLOBAL_DATA_STORE.get("selectedLang")) # 載入預設值
 
+        # 讀取執行緒數
+        scan_workers_layout = QHBoxLayout()
+        self.scan_workers_label = QLabel(TR.UI_CONSTANTS["讀取執行緒數："]())
+        self.scan_workers_spin = QSpinBox()
+        self.scan_workers_spin.setRange(1, 64)
+        self.scan_workers_spin.setValue(GLOBAL_DATA_STORE.get("scan_workers")) # 載入初始值
+
+        # 批次處理執行緒數
+        batch_workers_layout = QHBoxLayout()
+        self.batch_workers_label = QLabel(TR.UI_CONSTANTS["批次處理執行緒數："]())
+        self.batch_workers_spin = QSpinBox()
+        self.batch_workers_spin.setRange(1, 64)
+        self.batch_workers_spin.setValue(GLOBAL_DATA_STORE.get("batch_workers")) # 載入初始值
+
+        # 傳統硬碟並行數
+        hdd_workers_layout = QHBoxLayout()
+        self.hdd_workers_label = QLabel(TR.UI_CONSTANTS["傳統硬碟並行數："]())
+        self.hdd_workers_spin = QSpinBox()
+        self.hdd_workers_spin.setRange(1, 64)
+        self.hdd_workers_spin.setValue(GLOBAL_DATA_STORE.get("hdd_workers")) # 載入初始值
+
+        # 網路磁碟並行數
+        network_workers_layout = QHBoxLayout()
+        self.network_workers_label = QLabel(TR.UI_CONSTANTS["網路磁碟並行數："]())
+        self.network_workers_spin = QSpinBox()
+        self.network_workers_spin.setRange(1, 64)
+        self.network_workers_spin.setValue(GLOBAL_DATA_STORE.get("network_workers")) # 載入初始值
+
+        # 預讀深度
+        read_queue_depth_layout = QHBoxLayout()
+        self.read_queue_depth_label = QLabel(TR.UI_CONSTANTS["預讀深度："]())
+        self.read_queue_depth_spin = QSpinBox()
+        self.read_queue_depth_spin.setRange(1, 64)
+        self.read_queue_depth_spin.setValue(GLOBAL_DATA_STORE.get("read_queue_depth")) # 載入初始值
+
+        # 寫入佇列深度
+        write_queue_depth_layout = QHBoxLayout()
+        self.write_queue_depth_label = QLabel(TR.UI_CONSTANTS["寫入佇列深度："]())
+        self.write_queue_depth_spin = QSpinBox()
+        self.write_queue_depth_spin.setRange(1, 256)
+        self.write_queue_depth_spin.setValue(GLOBAL_DATA_STORE.get("write_queue_depth")) # 載入初始值
+
+        # 監看模式
+        watch_mode_layout = QHBoxLayout()
+        self.watch_mode_label = QLabel(TR.UI_CONSTANTS["監看模式："]())
+        self.watch_mode_combo = QComboBox()
+        self.watch_mode_combo.addItems([
+            TR.UI_CONSTANTS["關閉"](),
+            TR.UI_CONSTANTS["檔案系統通知"](),
+            TR.UI_CONSTANTS["定時輪詢"](),
+        ])
+        self.watch_mode_combo.setCurrentIndex(GLOBAL_DATA_STORE.get("watch_mode")) # 載入初始值
+
         # 結構組合
         layout = QVBoxLayout()
         layout.setAlignment(Qt.AlignmentFlag.AlignTop)
@@ -74,6 +215,42 @@ class AppSettingTab(QWidget):
         write_mode_layout.addWidget(self.write_mode_label, stretch=1)
         write_mode_layout.addWidget(self.write_mode_combo, stretch=4)
         layout.addLayout(write_mode_layout)
+        ## 資料夾寫入模式
+        folder_write_mode_layout.addWidget(self.folder_write_mode_label, stretch=1)
+        folder_write_mode_layout.addWidget(self.folder_write_mode_combo, stretch=4)
+        layout.addLayout(folder_write_mode_layout)
+        ## 資料夾打包壓縮
+        compression_profile_layout.addWidget(self.compression_profile_label, stretch=1)
+        compression_profile_layout.addWidget(self.compression_profile_combo, stretch=4)
+        layout.addLayout(compression_profile_layout)
+        ## 壓縮等級
+        compression_level_layout.addWidget(self.compression_level_label, stretch=1)
+        compression_level_layout.addWidget(self.compression_level_spin, stretch=4)
+        layout.addLayout(compression_level_layout)
+        ## 不壓縮副檔名
+        stored_exts_layout.addWidget(self.stored_exts_label, stretch=1)
+        stored_exts_layout.addWidget(self.stored_exts_edit, stretch=4)
+        layout.addLayout(stored_exts_layout)
+        ## 整理門檻
+        compact_threshold_layout.addWidget(self.compact_threshold_label, stretch=1)
+        compact_threshold_layout.addWidget(self.compact_threshold_spin, stretch=4)
+        layout.addLayout(compact_threshold_layout)
+        ## 略過未變更的檔案
+        layout.addWidget(self.skip_unchanged_check)
+        ## 保留 ComicInfo 原始格式
+        layout.addWidget(self.patch_comicinfo_check)
+        ## 輸出驗證
+        verify_mode_layout.addWidget(self.verify_mode_label, stretch=1)
+        verify_mode_layout.addWidget(self.verify_mode_combo, stretch=4)
+        layout.addLayout(verify_mode_layout)
+        ## 複製緩衝大小
+        copy_buffer_layout.addWidget(self.copy_buffer_label, stretch=1)
+        copy_buffer_layout.addWidget(self.copy_buffer_spin, stretch=4)
+        layout.addLayout(copy_buffer_layout)
+        ## 單一工作記憶體上限
+        job_memory_limit_layout.addWidget(self.job_memory_limit_label, stretch=1)
+        job_memory_limit_layout.addWidget(self.job_memory_limit_spin, stretch=4)
+        layout.addLayout(job_memory_limit_layout)
         # 圖片附檔名
         image_extension_layout.addWidget(self.image_extension_label, stretch=1)
         image_extension_layout.addWidget(self.image_extension_edit, stretch=4)
@@ -82,10 +259,46 @@ class AppSettingTab(QWidget):
         allow_files_layout.addWidget(self.allow_files_label, stretch=1)
         allow_files_layout.addWidget(self.allow_files_edit, stretch=4)
         layout.addLayout(allow_files_layout)
+        # 忽略項目
+        ignore_patterns_layout.addWidget(self.ignore_patterns_label, stretch=1)
+        ignore_patterns_layout.addWidget(self.ignore_patterns_edit, stretch=4)
+        layout.addLayout(ignore_patterns_layout)
+        # 檔名規則
+        filename_pattern_layout.addWidget(self.filename_pattern_label, stretch=1)
+        filename_pattern_layout.addWidget(self.filename_pattern_edit, stretch=4)
+        layout.addLayout(filename_pattern_layout)
         # 選擇語言
         lang_select_layout.addWidget(self.lang_select_label, stretch=1)
         lang_select_layout.addWidget(self.lang_select_combo, stretch=4)
         layout.addLayout(lang_select_layout)
+        # 讀取執行緒數
+        scan_workers_layout.addWidget(self.scan_workers_label, stretch=1)
+        scan_workers_layout.addWidget(self.scan_workers_spin, stretch=4)
+        layout.addLayout(scan_workers_layout)
+        # 批次處理執行緒數
+        batch_workers_layout.addWidget(self.batch_workers_label, stretch=1)
+        batch_workers_layout.addWidget(self.batch_workers_spin, stretch=4)
+        layout.addLayout(batch_workers_layout)
+        # 傳統硬碟並行數
+        hdd_workers_layout.addWidget(self.hdd_workers_label, stretch=1)
+        hdd_workers_layout.addWidget(self.hdd_workers_spin, stretch=4)
+        layout.addLayout(hdd_workers_layout)
+        # 網路磁碟並行數
+        network_workers_layout.addWidget(self.network_workers_label, stretch=1)
+        network_workers_layout.addWidget(self.network_workers_spin, stretch=4)
+        layout.addLayout(network_workers_layout)
+        # 預讀深度
+        read_queue_depth_layout.addWidget(self.read_queue_depth_label, stretch=1)
+        read_queue_depth_layout.addWidget(self.read_queue_depth_spin, stretch=4)
+        layout.addLayout(read_queue_depth_layout)
+        # 寫入佇列深度
+        write_queue_depth_layout.addWidget(self.write_queue_depth_label, stretch=1)
+        write_queue_depth_layout.addWidget(self.write_queue_depth_spin, stretch=4)
+        layout.addLayout(write_queue_depth_layout)
+        # 監看模式
+        watch_mode_layout.addWidget(self.watch_mode_label, stretch=1)
+        watch_mode_layout.addWidget(self.watch_mode_combo, stretch=4)
+        layout.addLayout(watch_mode_layout)
         ## 主要輸出
         self.setLayout(layout)
 
@@ -95,14 +308,52 @@ class AppSettingTab(QWidget):
         SIGNAL_BUS.appSetting.fontSizeChanged.connect(self.font_size_changed_display)
         # 寫入模式變換
         SIGNAL_BUS.appSetting.writeModeChanged.connect(self.write_mode_changed_display)
+        # 資料夾寫入模式變換
+        SIGNAL_BUS.appSetting.folderWriteModeChanged.connect(self.folder_write_mode_changed_display)
+        # 打包壓縮變換
+        SIGNAL_BUS.appSetting.compressionProfileChanged.connect(self.compression_profile_changed_display)
+        # 壓縮等級變換
+        SIGNAL_BUS.appSetting.compressionLevelChanged.connect(self.compression_level_changed_display)
+        # 不壓縮副檔名變換
+        SIGNAL_BUS.appSetting.storedExtsChanged.connect(self.stored_exts_changed_display)
+        # 整理門檻變換
+        SIGNAL_BUS.appSetting.compactThresholdChanged.connect(self.compact_threshold_changed_display)
+        # 略過未變更的檔案變換
+        SIGNAL_BUS.appSetting.skipUnchangedChanged.connect(self.skip_unchanged_changed_display)
+        # 保留 ComicInfo 原始格式變換
+        SIGNAL_BUS.appSetting.patchComicinfoChanged.connect(self.patch_comicinfo_changed_display)
+        # 輸出驗證變換
+        SIGNAL_BUS.appSetting.verifyModeChanged.connect(self.verify_mode_changed_display)
+        # 複製緩衝大小變換
+        SIGNAL_BUS.appSetting.copyBufferSizeChanged.connect(self.copy_buffer_changed_display)
+        # 單一工作記憶體上限變換
+        SIGNAL_BUS.appSetting.jobMemoryLimitChanged.connect(self.job_memory_limit_changed_display)
         # 圖片附檔名變換
         SIGNAL_BUS.appSetting.imageExtChanged.connect(self.image_extension_changed_display)
         # 允許檔案變換
         SIGNAL_BUS.appSetting.allowFilesChanged.connect(self.allow_files_changed_display)
+        # 忽略項目變換
+        SIGNAL_BUS.appSetting.ignorePatternsChanged.connect(self.ignore_patterns_changed_display)
+        # 檔名規則變換
+        SIGNAL_BUS.appSetting.filenamePatternChanged.connect(self.filename_pattern_changed_display)
         # 語言刷新
         # SIGNAL_BUS.ui.retranslateUi.connect(self.retranslateUi)
         # 語言變換顯示
         SIGNAL_BUS.appSetting.langChanged.connect(self.lang_selected_changed_display)
+        # 讀取執行緒數變換
+        SIGNAL_BUS.appSetting.scanWorkersChanged.connect(self.scan_workers_changed_display)
+        # 批次處理執行緒數變換
+        SIGNAL_BUS.appSetting.batchWorkersChanged.connect(self.batch_workers_changed_display)
+        # 傳統硬碟並行數變換
+        SIGNAL_BUS.appSetting.hddWorkersChanged.connect(self.hdd_workers_changed_display)
+        # 網路磁碟並行數變換
+        SIGNAL_BUS.appSetting.networkWorkersChanged.connect(self.network_workers_changed_display)
+        # 預讀深度變換
+        SIGNAL_BUS.appSetting.readQueueDepthChanged.connect(self.read_queue_depth_changed_display)
+        # 寫入佇列深度變換
+        SIGNAL_BUS.appSetting.writeQueueDepthChanged.connect(self.write_queue_depth_changed_display)
+        # 監看模式變換
+        SIGNAL_BUS.appSetting.watchModeChanged.connect(self.watch_mode_changed_display)
 
     def functional_construction(self):
         """ 功能架構 """
@@ -110,12 +361,50 @@ class AppSettingTab(QWidget):
         self.font_size_spin.valueChanged.connect(self.write_font_size)
         # 寫入模式變換
         self.write_mode_combo.currentIndexChanged.connect(self.write_write_mode)
+        # 資料夾寫入模式
+        self.folder_write_mode_combo.currentIndexChanged.connect(self.write_folder_write_mode)
+        # 打包壓縮
+        self.compression_profile_combo.currentIndexChanged.connect(self.write_compression_profile)
+        # 壓縮等級
+        self.compression_level_spin.valueChanged.connect(self.write_compression_level)
+        # 不壓縮副檔名
+        self.stored_exts_edit.textChanged.connect(self.write_stored_exts)
+        # 整理門檻
+        self.compact_threshold_spin.valueChanged.connect(self.write_compact_threshold)
+        # 略過未變更的檔案
+        self.skip_unchanged_check.toggled.connect(self.write_skip_unchanged)
+        # 保留 ComicInfo 原始格式
+        self.patch_comicinfo_check.toggled.connect(self.write_patch_comicinfo)
+        # 輸出驗證
+        self.verify_mode_combo.currentIndexChanged.connect(self.write_verify_mode)
+        # 複製緩衝大小
+        self.copy_buffer_spin.valueChanged.connect(self.write_copy_buffer)
+        # 單一工作記憶體上限
+        self.job_memory_limit_spin.valueChanged.connect(self.write_job_memory_limit)
         # 圖片副檔名
         self.image_extension_edit.textChanged.connect(self.write_image_extension)
         # 允許檔案
         self.allow_files_edit.textChanged.connect(self.write_allow_files)
+        # 忽略項目
+        self.ignore_patterns_edit.textChanged.connect(self.write_ignore_patterns)
+        # 檔名規則
+        self.filename_pattern_edit.textChanged.connect(self.write_filename_pattern)
         # 語言選擇
         self.lang_select_combo.currentTextChanged.connect(self.write_lang_selected)
+        # 讀取執行緒數
+        self.scan_workers_spin.valueChanged.connect(self.write_scan_workers)
+        # 批次處理執行緒數
+        self.batch_workers_spin.valueChanged.connect(self.write_batch_workers)
+        # 傳統硬碟並行數
+        self.hdd_workers_spin.valueChanged.connect(self.write_hdd_workers)
+        # 網路磁碟並行數
+        self.network_workers_spin.valueChanged.connect(self.write_network_workers)
+        # 預讀深度
+        self.read_queue_depth_spin.valueChanged.connect(self.write_read_queue_depth)
+        # 寫入佇列深度
+        self.write_queue_depth_spin.valueChanged.connect(self.write_write_queue_depth)
+        # 監看模式
+        self.watch_mode_combo.currentIndexChanged.connect(self.write_watch_mode)
 
     ### 功能函式 ###
     
@@ -127,6 +416,42 @@ class AppSettingTab(QWidget):
         """ 寫入模式寫入 """
         GLOBAL_DATA_STORE.set("write_mode", write_mode)
 
+    def write_folder_write_mode(self, folder_write_mode: int) -> None:
+        """ 資料夾寫入模式寫入 """
+        GLOBAL_DATA_STORE.set("folder_write_mode", folder_write_mode)
+
+    def write_compression_profile(self, compression_profile: int) -> None:
+        """ 打包壓縮寫入 """
+        GLOBAL_DATA_STORE.set("compression_profile", compression_profile)
+
+    def write_compression_level(self, compression_level: int) -> None:
+        """ 壓縮等級寫入 """
+        GLOBAL_DATA_STORE.set("compression_level", compression_level)
+
+    def write_stored_exts(self, stored_exts: str) -> None:
+        """ 不壓縮副檔名寫入 """
+        GLOBAL_DATA_STORE.set("stored_exts", [item.strip() for item in stored_exts.split(',')])
+
+    def write_compact_threshold(self, compact_threshold: int) -> None:
+        """ 整理門檻寫入 """
+        GLOBAL_DATA_STORE.set("compact_threshold", compact_threshold)
+
+    def write_skip_unchanged(self, skip_unchanged: bool) -> None:
+        """ 略過未變更的檔案寫入 """
+        GLOBAL_DATA_STORE.set("skip_unchanged", skip_unchanged)
+
+    def write_patch_comicinfo(self, patch_comicinfo: bool) -> None:
+        """ 保留 ComicInfo 原始格式寫入 """
+        GLOBAL_DATA_STORE.set("patch_comicinfo", patch_comicinfo)
+
+    def write_copy_buffer(self, copy_buffer_kb: int) -> None:
+        """ 複製緩衝大小寫入 """
+        GLOBAL_DATA_STORE.set("copy_buffer_kb", copy_buffer_kb)
+
+    def write_job_memory_limit(self, job_memory_limit_mb: int) -> None:
+        """ 單一工作記憶體上限寫入 """
+        GLOBAL_DATA_STORE.set("job_memory_limit_mb", job_memory_limit_mb)
+
     def font_size_changed_display(self, font_size: int) -> None:
         """ 字體大小變換顯示 """
         with QSignalBlocker(self.font_size_spin):
@@ -137,6 +462,60 @@ class AppSettingTab(QWidget):
         with QSignalBlocker(self.write_mode_combo):
             self.write_mode_combo.setCurrentIndex(write_mode)
 
+    def folder_write_mode_changed_display(self, folder_write_mode: int) -> None:
+        """ 資料夾寫入模式變換顯示 """
+        with QSignalBlocker(self.folder_write_mode_combo):
+            self.folder_write_mode_combo.setCurrentIndex(folder_write_mode)
+
+    def compression_profile_changed_display(self, compression_profile: int) -> None:
+        """ 打包壓縮變換顯示 """
+        with QSignalBlocker(self.compression_profile_combo):
+            self.compression_profile_combo.setCurrentIndex(compression_profile)
+
+    def compression_level_changed_display(self, compression_level: int) -> None:
+        """ 壓縮等級變換顯示 """
+        with QSignalBlocker(self.compression_level_spin):
+            self.compression_level_spin.setValue(compression_level)
+
+    def stored_exts_changed_display(self, stored_exts: list[str]) -> None:
+        """ 不壓縮副檔名變換顯示 """
+        with QSignalBlocker(self.stored_exts_edit):
+            self.stored_exts_edit.setText(', '.join(stored_exts))
+
+    def compact_threshold_changed_display(self, compact_threshold: int) -> None:
+        """ 整理門檻變換顯示 """
+        with QSignalBlocker(self.compact_threshold_spin):
+            self.compact_threshold_spin.setValue(compact_threshold)
+
+    def skip_unchanged_changed_display(self, skip_unchanged: bool) -> None:
+        """ 略過未變更的檔案變換顯示 """
+        with QSignalBlocker(self.skip_unchanged_check):
+            self.skip_unchanged_check.setChecked(skip_unchanged)
+
+    def patch_comicinfo_changed_display(self, patch_comicinfo: bool) -> None:
+        """ 保留 ComicInfo 原始格式變換顯示 """
+        with QSignalBlocker(self.patch_comicinfo_check):
+            self.patch_comicinfo_check.setChecked(patch_comicinfo)
+
+    def write_verify_mode(self, verify_mode: int) -> None:
+        """ 輸出驗證寫入 """
+        GLOBAL_DATA_STORE.set("verify_mode", verify_mode)
+
+    def verify_mode_changed_display(self, verify_mode: int) -> None:
+        """ 輸出驗證變換顯示 """
+        with QSignalBlocker(self.verify_mode_combo):
+            self.verify_mode_combo.setCurrentIndex(verify_mode)
+
+    def copy_buffer_changed_display(self, copy_buffer_kb: int) -> None:
+        """ 複製緩衝大小變換顯示 """
+        with QSignalBlocker(self.copy_buffer_spin):
+            self.copy_buffer_spin.setValue(copy_buffer_kb)
+
+    def job_memory_limit_changed_display(self, job_memory_limit_mb: int) -> None:
+        """ 單一工作記憶體上限變換顯示 """
+        with QSignalBlocker(self.job_memory_limit_spin):
+            self.job_memory_limit_spin.setValue(job_memory_limit_mb)
+
     def image_extension_changed_display(self, image_exts: list[str]) -> None:
         """ 圖片附檔名變換顯示 """
         with QSignalBlocker(self.image_extension_edit):
@@ -155,6 +534,24 @@ class AppSettingTab(QWidget):
         """ 允許檔案寫入 """
         GLOBAL_DATA_STORE.set("allow_files", [item.strip() for item in allow_files.split(',')])
 
+    def ignore_patterns_changed_display(self, ignore_patterns: list[str]) -> None:
+        """ 忽略項目變換顯示 """
+        with QSignalBlocker(self.ignore_patterns_edit):
+            self.ignore_patterns_edit.setText(', '.join(ignore_patterns))
+
+    def write_ignore_patterns(self, ignore_patterns: str) -> None:
+        """ 忽略項目寫入 """
+        GLOBAL_DATA_STORE.set("ignore_patterns", [item.strip() for item in ignore_patterns.split(',')])
+
+    def filename_pattern_changed_display(self, filename_pattern: str) -> None:
+        """ 檔名規則變換顯示 """
+        with QSignalBlocker(self.filename_pattern_edit):
+            self.filename_pattern_edit.setText(filename_pattern)
+
+    def write_filename_pattern(self, filename_pattern: str) -> None:
+        """ 檔名規則寫入 """
+        GLOBAL_DATA_STORE.set("filename_pattern", filename_pattern)
+
     def lang_selected_changed_display(self, selectedLang: str) -> None:
         """ 語言選擇變換顯示 """
         with QSignalBlocker(self.lang_select_combo):
@@ -164,6 +561,69 @@ class AppSettingTab(QWidget):
         """ 寫入語言選擇 """
         GLOBAL_DATA_STORE.set("selectedLang", selectedLang)
 
+    def write_scan_workers(self, scan_workers: int) -> None:
+        """ 讀取執行緒數寫入 """
+        GLOBAL_DATA_STORE.set("scan_workers", scan_workers)
+
+    def scan_workers_changed_display(self, scan_workers: int) -> None:
+        """ 讀取執行緒數變換顯示 """
+        with QSignalBlocker(self.scan_workers_spin):
+            self.scan_workers_spin.setValue(scan_workers)
+
+    def write_batch_workers(self, batch_workers: int) -> None:
+        """ 批次處理執行緒數寫入 """
+        GLOBAL_DATA_STORE.set("batch_workers", batch_workers)
+
+    def batch_workers_changed_display(self, batch_workers: int) -> None:
+        """ 批次處理執行緒數變換顯示 """
+        with QSignalBlocker(self.batch_workers_spin):
+            self.batch_workers_spin.setValue(batch_workers)
+
+    def write_hdd_workers(self, hdd_workers: int) -> None:
+        """ 傳統硬碟並行數寫入 """
+        GLOBAL_DATA_STORE.set("hdd_workers", hdd_workers)
+
+    def hdd_workers_changed_display(self, hdd_workers: int) -> None:
+        """ 傳統硬碟並行數變換顯示 """
+        with QSignalBlocker(self.hdd_workers_spin):
+            self.hdd_workers_spin.setValue(hdd_workers)
+
+    def write_network_workers(self, network_workers: int) -> None:
+        """ 網路磁碟並行數寫入 """
+        GLOBAL_DATA_STORE.set("network_workers", network_workers)
+
+    def network_workers_changed_display(self, network_workers: int) -> None:
+        """ 網路磁碟並行數變換顯示 """
+        with QSignalBlocker(self.network_workers_spin):
+            self.network_workers_spin.setValue(network_workers)
+
+    def write_read_queue_depth(self, read_queue_depth: int) -> None:
+        """ 預讀深度寫入 """
+        GLOBAL_DATA_STORE.set("read_queue_depth", read_queue_depth)
+
+    def read_queue_depth_changed_display(self, read_queue_depth: int) -> None:
+        """ 預讀深度變換顯示 """
+        with QSignalBlocker(self.read_queue_depth_spin):
+            self.read_queue_depth_spin.setValue(read_queue_depth)
+
+    def write_write_queue_depth(self, write_queue_depth: int) -> None:
+        """ 寫入佇列深度寫入 """
+        GLOBAL_DATA_STORE.set("write_queue_depth", write_queue_depth)
+
+    def write_queue_depth_changed_display(self, write_queue_depth: int) -> None:
+        """ 寫入佇列深度變換顯示 """
+        with QSignalBlocker(self.write_queue_depth_spin):
+            self.write_queue_depth_spin.setValue(write_queue_depth)
+
+    def write_watch_mode(self, watch_mode: int) -> None:
+        """ 監看模式寫入 """
+        GLOBAL_DATA_STORE.set("watch_mode", watch_mode)
+
+    def watch_mode_changed_display(self, watch_mode: int) -> None:
+        """ 監看模式變換顯示 """
+        with QSignalBlocker(self.watch_mode_combo):
+            self.watch_mode_combo.setCurrentIndex(watch_mode)
+
     def retranslateUi(self):
         """ UI 語言刷新 """
         self.font_size_label.setText(TR.UI_CONSTANTS["字體大小："]())
@@ -175,12 +635,87 @@ class AppSettingTab(QWidget):
         self.write_mode_combo.addItems([
             TR.UI_CONSTANTS["原位置寫入"](),
             TR.UI_CONSTANTS["鋪平寫入"](),
+            TR.UI_CONSTANTS["追加寫入"](),
         ])
         with QSignalBlocker(self.write_mode_combo):
             self.write_mode_combo.setCurrentIndex(current_index)
         #
+        self.folder_write_mode_label.setText(TR.UI_CONSTANTS["資料夾寫入模式："]())
+        current_index = self.folder_write_mode_combo.currentIndex()
+        with QSignalBlocker(self.folder_write_mode_combo): # 清空時的索引變動不寫入設定
+            self.folder_write_mode_combo.clear()
+            self.folder_write_mode_combo.addItems([
+                TR.UI_CONSTANTS["打包為壓縮檔"](),
+                TR.UI_CONSTANTS["僅寫入 ComicInfo.xml"](),
+            ])
+            self.folder_write_mode_combo.setCurrentIndex(current_index)
+        #
+        self.compression_profile_label.setText(TR.UI_CONSTANTS["打包壓縮："]())
+        current_index = self.compression_profile_combo.currentIndex()
+        with QSignalBlocker(self.compression_profile_combo): # 清空時的索引變動不寫入設定
+            self.compression_profile_combo.clear()
+            self.compression_profile_combo.addItems([
+                TR.UI_CONSTANTS["不壓縮"](),
+                TR.UI_CONSTANTS["全部壓縮"](),
+                TR.UI_CONSTANTS["依副檔名壓縮"](),
+            ])
+            self.compression_profile_combo.setCurrentIndex(current_index)
+        #
+        self.compression_level_label.setText(TR.UI_CONSTANTS["壓縮等級："]())
+        #
+        self.stored_exts_label.setText(TR.UI_CONSTANTS["不壓縮副檔名："]())
+        #
+        self.compact_threshold_label.setText(TR.UI_CONSTANTS["整理門檻（%）："]())
+        #
+        self.skip_unchanged_check.setText(TR.UI_CONSTANTS["略過未變更的檔案"]())
+        #
+        self.patch_comicinfo_check.setText(TR.UI_CONSTANTS["保留 ComicInfo 原始格式（只修改有變更的欄位）"]())
+        #
+        self.verify_mode_label.setText(TR.UI_CONSTANTS["輸出驗證："]())
+        current_index = self.verify_mode_combo.currentIndex()
+        with QSignalBlocker(self.verify_mode_combo): # 清空時的索引變動不寫入設定
+            self.verify_mode_combo.clear()
+            self.verify_mode_combo.addItems([
+                TR.UI_CONSTANTS["關閉"](),
+                TR.UI_CONSTANTS["抽樣檢查"](),
+                TR.UI_CONSTANTS["完整檢查"](),
+            ])
+            self.verify_mode_combo.setCurrentIndex(current_index)
+        #
+        self.copy_buffer_label.setText(TR.UI_CONSTANTS["複製緩衝（KB）："]())
+        #
+        self.job_memory_limit_label.setText(TR.UI_CONSTANTS["單一工作記憶體上限（MB）："]())
+        #
         self.image_extension_label.setText(TR.UI_CONSTANTS["圖片附檔名："]())
         #
         self.allow_files_label.setText(TR.UI_CONSTANTS["允許檔案："]())
         #
-        self.lang_select_label.setText(TR.UI_CONSTANTS["語言選擇："]())
\ No newline at end of file
+        self.ignore_patterns_label.setText(TR.UI_CONSTANTS["忽略項目："]())
+        #
+        self.filename_pattern_label.setText(TR.UI_CONSTANTS["檔名規則："]())
+        self.filename_pattern_edit.setPlaceholderText(TR.UI_CONSTANTS["正規表示式，編輯欄位中以 {match:1} 或 {match:名稱} 取用擷取群組"]())
+        #
+        self.lang_select_label.setText(TR.UI_CONSTANTS["語言選擇："]())
+        #
+        self.scan_workers_label.setText(TR.UI_CONSTANTS["讀取執行緒數："]())
+        #
+        self.batch_workers_label.setText(TR.UI_CONSTANTS["批次處理執行緒數："]())
+        #
+        self.hdd_workers_label.setText(TR.UI_CONSTANTS["傳統硬碟並行數："]())
+        #
+        self.network_workers_label.setText(TR.UI_CONSTANTS["網路磁碟並行數："]())
+        #
+        self.read_queue_depth_label.setText(TR.UI_CONSTANTS["預讀深度："]())
+        #
+        self.write_queue_depth_label.setText(TR.UI_CONSTANTS["寫入佇列深度："]())
+        #
+        self.watch_mode_label.setText(TR.UI_CONSTANTS["監看模式："]())
+        current_index = self.watch_mode_combo.currentIndex()
+        with QSignalBlocker(self.watch_mode_combo): # 清空時的索引變動不寫入設定
+            self.watch_mode_combo.clear()
+            self.watch_mode_combo.addItems([
+                TR.UI_CONSTANTS["關閉"](),
+                TR.UI_CONSTANTS["檔案系統通知"](),
+                TR.UI_CONSTANTS["定時輪詢"](),
+            ])
+            self.watch_mode_combo.setCurrentIndex(current_index)
\ No newline at end of file
@@ -12,6 +12,10 @@ from src.global_data_store import GLOBAL_DATA_STORE
 from src.signal_bus import SIGNAL_BUS
 from src.app.model.comic_list_model import ComicListModel
 from src.classes.ui.numbered_item_delegate import NumberedItemDelegate
+from src.function.archive_writer import (
+    WRITE_APPEND, WRITE_FLATTEN, WRITE_FOLDER_TO_ZIP, WRITE_IN_PLACE, WRITE_SIDECAR,
+)
+from src.function.batch_planner import PLAN_COPIED, PLAN_SKIPPED
 ## 翻譯
 from src.translations import TR
 
@@ -62,9 +66,11 @@ class ComicsListTab(QWidget):
                 selected=0,
                 total=0
         ))
+        ## 掃描進度
+        self.scan_status = QLabel("")
         ## 構建
         action_layout_0.addLayout(list_sort_layout, stretch=1)
-        action_layout_0.addStretch(5) # 間隔
+        action_layout_0.addWidget(self.scan_status, stretch=5)
         action_layout_0.addWidget(self.selection_status, stretch=1)
        
 
@@ -106,11 +112,20 @@ class ComicsListTab(QWidget):
         action_layout_2 = QHBoxLayout()
         ## 開始按鈕
         self.run_btn = QPushButton(TR.UI_CONSTANTS["開始處理"]())
+        ## 預估按鈕
+        self.dry_run_btn = QPushButton(TR.UI_CONSTANTS["預估"]())
         ## 進度條
         self.progress_bar = QProgressBar()
         ## 構建
         action_layout_2.addWidget(self.run_btn, stretch=1)
-        action_layout_2.addWidget(self.progress_bar, stretch=7)
+        action_layout_2.addWidget(self.dry_run_btn, stretch=1)
+        action_layout_2.addWidget(self.progress_bar, stretch=6)
+
+        # 預估結果
+        self.plan_status = QLabel("")
+        self.plan_status.setWordWrap(True)
+        self.plan_status.hide()
+        self.last_plan = None
 
         # 結構組合
         layout = QVBoxLayout()
@@ -119,6 +134,7 @@ class ComicsListTab(QWidget):
         layout.addWidget(self.comic_list)
         layout.addLayout(action_layout_1)
         layout.addLayout(action_layout_2)
+        layout.addWidget(self.plan_status)
         self.setLayout(layout)
 
     def signal_connection(self):
@@ -141,6 +157,19 @@ class ComicsListTab(QWidget):
         # SIGNAL_BUS.ui.retranslateUi.connect(self.retranslateUi)
         # 重新選擇選中項
         SIGNAL_BUS.ui.comicListSelectRows.connect(self.select_rows)
+        # 掃描進度顯示
+        SIGNAL_BUS.scanProgress.connect(self.scan_progress_display)
+        # 預估結果顯示
+        SIGNAL_BUS.batch.planned.connect(self.plan_display)
+        SIGNAL_BUS.batch.started.connect(lambda total: self.plan_display(None)) # 開始處理後預估已過時
+        SIGNAL_BUS.fileReadReady.connect(lambda: self.scan_status.setText(""))
+        # 列表變更（掃描追加、監看刷新），更新總數顯示
+        SIGNAL_BUS.dataChange.fileListChanged.connect(
+            lambda file_list: self.selection_status_change(len(self.comic_list.selectionModel().selectedIndexes()))
+        )
+        SIGNAL_BUS.dataChange.fileListAppended.connect(
+            lambda count: self.selection_status_change(len(self.comic_list.selectionModel().selectedIndexes()))
+        )
 
     def functional_construction(self):
         """ 功能建構 """
@@ -160,6 +189,10 @@ class ComicsListTab(QWidget):
         self.run_btn.clicked.connect(
             lambda: SIGNAL_BUS.startProcess.emit()
         )
+        # 預估
+        self.dry_run_btn.clicked.connect(
+            lambda: SIGNAL_BUS.startDryRun.emit()
+        )
 
 
     ### 功能函式 ###
@@ -230,6 +263,53 @@ class ComicsListTab(QWidget):
             selected_comic_data[path] = index.row()
         SIGNAL_BUS.returnSelectedComic.emit(selected_comic_data)
 
+    def scan_progress_display(self, stats: dict) -> None:
+        """ 掃描進度顯示 """
+        self.scan_status.setText(
+            TR.UI_CONSTANTS["掃描中… 資料夾 {dirs} / 壓縮檔 {archives}（共 {size} MB）"]().format(
+                dirs=stats.get("dirs", 0),
+                archives=stats.get("archives", 0),
+                size=f"{stats.get('archive_size', 0) / 1048576:.1f}",
+        ))
+
+    def plan_display(self, plan: dict | None) -> None:
+        """ 預估結果顯示 """
+        self.last_plan = plan
+        if plan is None:
+            self.plan_status.hide()
+            return
+        path_names = {
+            WRITE_FOLDER_TO_ZIP: TR.UI_CONSTANTS["打包為壓縮檔"](),
+            WRITE_SIDECAR: TR.UI_CONSTANTS["僅寫入 ComicInfo.xml"](),
+            WRITE_IN_PLACE: TR.UI_CONSTANTS["原位置寫入"](),
+            WRITE_FLATTEN: TR.UI_CONSTANTS["鋪平寫入"](),
+            WRITE_APPEND: TR.UI_CONSTANTS["追加寫入"](),
+            PLAN_COPIED: TR.UI_CONSTANTS["直接複製"](),
+            PLAN_SKIPPED: TR.UI_CONSTANTS["略過"](),
+        }
+        if plan["estimate"] is None:
+            estimate = TR.UI_CONSTANTS["未知"]()
+        else:
+            seconds = round(plan["estimate"])
+            estimate = f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+        lines = [TR.UI_CONSTANTS["預估：{paths}｜讀取 {read} MB，寫入 {written} MB，約需 {time}"]().format(
+            paths=" / ".join(f"{path_names.get(path, path)} {count}" for path, count in plan["paths"].items()),
+            read=f"{plan['bytes_read'] / 1048576:.1f}",
+            written=f"{plan['bytes_written'] / 1048576:.1f}",
+            time=estimate,
+        )]
+        for device in plan["devices"]:
+            if device["required"] > device["free"]:
+                lines.append("⚠️ " + TR.UI_CONSTANTS["{device} 空間不足：需要 {required} MB，剩餘 {free} MB"]().format(
+                    device=device["device"],
+                    required=f"{device['required'] / 1048576:.1f}",
+                    free=f"{device['free'] / 1048576:.1f}",
+                ))
+        if plan["errors"]:
+            lines.append("❌ " + TR.UI_CONSTANTS["{errors} 個檔案無法讀取"]().format(errors=len(plan["errors"])))
+        self.plan_status.setText("\n".join(lines))
+        self.plan_status.show()
+
     def set_progress_bar(self, value: int, max: int) -> None:
         """ 設置進度條顯示 """
         self.progress_bar.setMaximum(max)
@@ -264,6 +344,8 @@ class ComicsListTab(QWidget):
         self.ext_label.setText(TR.UI_CONSTANTS["輸出副檔名："]())
         #
         self.run_btn.setText(TR.UI_CONSTANTS["開始處理"]())
+        self.dry_run_btn.setText(TR.UI_CONSTANTS["預估"]())
+        self.plan_display(self.last_plan)
 
     def select_rows(self, rows: list[int]):
         """ 重新選擇選中項 """
@@ -0,0 +1,166 @@
+from PySide6.QtCore import QStandardPaths
+from dataclasses import fields
+import json
+import os
+import time
+# 自訂庫
+from src.classes.metadata_record import MetadataRecord
+from src.classes.write_job import WriteJob
+from src.function.zip_process import recover_interrupted_append
+
+class BatchJournal:
+    """
+    批次日誌（僅追加寫入）
+    記錄工作內容與逐檔的開始／完成標記，程式中斷後可接續未完成的工作
+    每筆標記都交給作業系統（程式當機不會遺失），累積一定數量或時間後才 fsync（系統斷電時最多遺失最後一段），避免拖慢批次
+    """
+    SYNC_EVERY = 64 # 累積筆數
+    SYNC_INTERVAL = 1.0 # 秒
+
+    def __init__(self, journal_path: str = ""):
+        self.journal_path = journal_path
+        self._file = None
+        self._unsynced = 0
+        self._last_sync = 0.0
+
+    ### 內部函式 ###
+
+    def _path(self) -> str:
+        """ 延遲取得日誌路徑（QApplication 建立後才能取得快取路徑） """
+        if not self.journal_path:
+            cache_dir = os.path.join(
+                QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericCacheLocation),
+                "comic_info_editor",
+            )
+            os.makedirs(cache_dir, exist_ok=True)
+            self.journal_path = os.path.join(cache_dir, "batch_journal.jsonl")
+        return self.journal_path
+
+    def _write(self, record: dict, sync: bool = False) -> None:
+        """ 寫入一筆紀錄（依累積量批次 fsync） """
+        if self._file is None:
+            return
+        try:
+            self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            self._file.flush()
+            self._unsynced += 1
+            if sync or self._unsynced >= self.SYNC_EVERY or time.monotonic() - self._last_sync >= self.SYNC_INTERVAL:
+                self.sync()
+        except OSError as e:
+            print(f"❌ 批次日誌寫入錯誤：{e}")
+            self.close()
+
+    @staticmethod
+    def _dump_job(job: WriteJob) -> dict:
+        """ 工作 → 可寫入 JSON 的 dict（ComicInfo 資料轉為 parse_comicinfo 格式） """
+        record = {field.name: getattr(job, field.name) for field in fields(job)}
+        record["data"] = MetadataRecord.from_dict(job.data).to_dict()
+        return record
+
+    @staticmethod
+    def _load_job(record: dict) -> WriteJob:
+        """ _dump_job 的反向轉換 """
+        job = WriteJob(**record)
+        job.manifest = tuple(job.manifest) if job.manifest else None # JSON 陣列轉回 tuple
+        if "_nsmap" in job.data: # JSON 會將預設 namespace 的 None 鍵轉為 "null"（保留原順序）
+            job.data["_nsmap"] = {None if prefix == "null" else prefix: uri for prefix, uri in job.data["_nsmap"].items()}
+        job.data = MetadataRecord.from_dict(job.data)
+        return job
+
+    ### 功能函式 ###
+
+    def begin(self, jobs: list[WriteJob]) -> None:
+        """ 開始新的批次日誌（覆蓋舊日誌） """
+        self.close()
+        try:
+            self._file = open(self._path(), "w", encoding="utf-8")
+        except OSError as e:
+            print(f"❌ 批次日誌建立錯誤：{e}")
+            return
+        self._write({"type": "batch", "jobs": [self._dump_job(job) for job in jobs]}, sync=True)
+
+    def mark_start(self, rel_path: str) -> None:
+        """ 工作開始 """
+        self._write({"type": "start", "rel_path": rel_path})
+
+    def mark_commit(self, rel_path: str, ok: bool) -> None:
+        """ 工作完成 """
+        self._write({"type": "commit", "rel_path": rel_path, "ok": ok})
+
+    def sync(self) -> None:
+        """ 將紀錄寫入磁碟 """
+        if self._file is None:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """ 關閉日誌（保留檔案，下次啟動可接續） """
+        if self._file is None:
+            return
+        try:
+            self.sync()
+            self._file.close()
+        except OSError as e:
+            print(f"❌ 批次日誌寫入錯誤：{e}")
+        self._file = None
+
+    def finish(self) -> None:
+        """ 批次正常結束，移除日誌 """
+        self.close()
+        try:
+            os.remove(self._path())
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"❌ 批次日誌移除錯誤：{e}")
+
+    def load(self) -> tuple[list[WriteJob], set[str]] | None:
+        """
+        讀取中斷的批次 ( 工作清單, 已完成的相對路徑 )，沒有日誌時回傳 None
+        最後一行可能因中斷而不完整，略過無法解析的紀錄
+        """
+        path = self._path()
+        if self._file is not None or not os.path.exists(path):
+            return None
+        jobs = []
+        committed = set()
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if record.get("type") == "batch":
+                        jobs = [self._load_job(job) for job in record["jobs"]]
+                    elif record.get("type") == "commit" and record.get("ok"):
+                        committed.add(record["rel_path"])
+        except (OSError, TypeError, KeyError, AttributeError) as e:
+            print(f"❌ 批次日誌讀取錯誤：{e}")
+            return None
+        return jobs, committed
+
+    @staticmethod
+    def clean_temp_files(jobs: list[WriteJob]) -> int:
+        """
+        移除中斷時留下的暫存檔（寫入皆使用「輸出路徑.tmp」），並將中斷的追加寫入截斷回原長度
+        回傳處理的檔案數量
+        """
+        removed = 0
+        for job in jobs:
+            temp_path = job.dst_path + ".tmp"
+            try:
+                os.remove(temp_path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"❌ 暫存檔移除錯誤：{temp_path}：{e}")
+            try:
+                removed += recover_interrupted_append(job.dst_path)
+            except OSError as e:
+                print(f"❌ 追加寫入復原錯誤：{job.dst_path}：{e}")
+        return removed
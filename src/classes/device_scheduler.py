@@ -0,0 +1,158 @@
+import os
+import time
+from collections import deque
+from itertools import chain, zip_longest
+# 自訂庫
+from src.classes.write_job import WriteJob, WriteResult
+from src.function.archive_writer import ACTION_SKIPPED
+from src.function.device_info import DEVICE_HDD, describe_devices, device_id
+
+class DeviceScheduler:
+    """
+    依裝置排程批次工作
+    工作依來源裝置分組，每個裝置各自限制並行數（來源與輸出裝置都要有空位才派送），
+    傳統硬碟依目錄順序處理以減少尋軌，其他裝置大檔優先以縮短尾端等待
+    工作需先標記為就緒（管線前段已完成讀取與轉換）才會派送
+    """
+    def __init__(self, jobs: list[WriteJob], total_limit: int, limits: dict[str, int]):
+        self.total_limit = max(1, total_limit)
+        self._dir_devices: dict[str, int] = {}
+        self.job_devices: dict[int, tuple[int, int]] = {} # id(工作): (來源裝置, 輸出裝置)
+        device_paths: dict[int, str] = {}
+        job_sizes: dict[int, int] = {}
+        for job in jobs:
+            src_dev = self._device_of(job.src_path)
+            dst_dev = self._device_of(job.dst_path)
+            self.job_devices[id(job)] = (src_dev, dst_dev)
+            device_paths.setdefault(src_dev, job.src_path)
+            device_paths.setdefault(dst_dev, job.dst_path)
+            try:
+                job_sizes[id(job)] = os.path.getsize(job.src_path)
+            except OSError:
+                job_sizes[id(job)] = 0
+
+        self.devices = describe_devices(device_paths) # { 裝置: (名稱, 類型) }
+        self.limits = {
+            dev: max(1, min(limits.get(kind, self.total_limit), self.total_limit))
+            for dev, (_, kind) in self.devices.items()
+        }
+
+        # 各來源裝置的待處理佇列
+        grouped: dict[int, list[WriteJob]] = {}
+        for job in jobs:
+            grouped.setdefault(self.job_devices[id(job)][0], []).append(job)
+        self.queues: dict[int, deque[WriteJob]] = {}
+        for dev, dev_jobs in grouped.items():
+            if self.devices[dev][1] == DEVICE_HDD:
+                dev_jobs.sort(key=lambda job: (os.path.dirname(job.src_path), job.src_path))
+            else:
+                dev_jobs.sort(key=lambda job: job_sizes[id(job)], reverse=True)
+            self.queues[dev] = deque(dev_jobs)
+
+        self.ready: set[int] = set() # 已就緒的工作 id
+        self.ready_counts: dict[int, int] = {dev: 0 for dev in self.queues} # 各佇列已就緒的數量
+        self.running_total = 0
+        self.running: dict[int, int] = {dev: 0 for dev in self.devices}
+        self.job_sizes = job_sizes
+        # 統計
+        self.stats = {
+            dev: {"jobs": 0, "bytes_read": 0, "bytes_written": 0, "busy": 0.0, "busy_since": 0.0}
+            for dev in self.devices
+        }
+
+    ### 內部函式 ###
+
+    def _device_of(self, path: str) -> int:
+        """ 取得路徑所在裝置（以上層資料夾快取，避免每個檔案都查詢） """
+        parent = os.path.dirname(os.path.abspath(path))
+        dev = self._dir_devices.get(parent)
+        if dev is None:
+            dev = self._dir_devices[parent] = device_id(parent)
+        return dev
+
+    def _devices_of(self, job: WriteJob) -> set[int]:
+        """ 工作使用的裝置（來源與輸出相同時只算一次） """
+        return set(self.job_devices[id(job)])
+
+    def _acquire(self, dev: int) -> None:
+        if self.running[dev] == 0:
+            self.stats[dev]["busy_since"] = time.perf_counter()
+        self.running[dev] += 1
+
+    def _release(self, dev: int) -> None:
+        self.running[dev] -= 1
+        if self.running[dev] == 0:
+            self.stats[dev]["busy"] += time.perf_counter() - self.stats[dev]["busy_since"]
+
+    ### 功能函式 ###
+
+    def planned_order(self) -> list[WriteJob]:
+        """ 預計的處理順序（各裝置佇列輪流），管線前段依此順序讀取 """
+        return [job for job in chain.from_iterable(zip_longest(*self.queues.values())) if job is not None]
+
+    def mark_ready(self, job: WriteJob) -> None:
+        """ 標記工作已就緒，可以派送 """
+        if id(job) not in self.ready:
+            self.ready.add(id(job))
+            self.ready_counts[self.job_devices[id(job)][0]] += 1
+
+    def next_jobs(self) -> list[WriteJob]:
+        """
+        取出目前可派送的工作（各裝置輪流，避免單一裝置佔滿全部並行數）
+        各佇列取第一個已就緒的工作（讀取依預計順序進行，就緒的工作集中在佇列前端）
+        """
+        ready = []
+        progressed = True
+        while progressed and self.running_total < self.total_limit:
+            progressed = False
+            for src_dev, queue in self.queues.items():
+                if not self.ready_counts[src_dev] or self.running_total >= self.total_limit:
+                    continue
+                index = next(i for i, job in enumerate(queue) if id(job) in self.ready)
+                job = queue[index]
+                devices = self._devices_of(job)
+                if all(self.running[dev] < self.limits[dev] for dev in devices):
+                    del queue[index]
+                    self.ready.discard(id(job))
+                    self.ready_counts[src_dev] -= 1
+                    for dev in devices:
+                        self._acquire(dev)
+                    self.running_total += 1
+                    ready.append(job)
+                    progressed = True
+        return ready
+
+    def job_done(self, job: WriteJob, result: WriteResult) -> None:
+        """ 工作完成，釋放裝置並記錄流量 """
+        src_dev, dst_dev = self.job_devices[id(job)]
+        for dev in self._devices_of(job):
+            self._release(dev)
+        self.running_total -= 1
+        self.stats[src_dev]["jobs"] += 1
+        if result.ok and result.action != ACTION_SKIPPED:
+            self.stats[src_dev]["bytes_read"] += self.job_sizes[id(job)]
+            self.stats[dst_dev]["bytes_written"] += result.bytes_written
+
+    def has_pending(self) -> bool:
+        """ 是否仍有未派送的工作 """
+        return any(self.queues.values())
+
+    def device_stats(self) -> list[dict]:
+        """ 各裝置統計（名稱、類型、並行上限、讀寫量與忙碌時間內的吞吐量 MB/s） """
+        now = time.perf_counter()
+        stats = []
+        for dev, (name, kind) in self.devices.items():
+            stat = self.stats[dev]
+            busy = stat["busy"] + (now - stat["busy_since"] if self.running[dev] else 0.0)
+            total_bytes = stat["bytes_read"] + stat["bytes_written"]
+            stats.append({
+                "device": name,
+                "kind": kind,
+                "limit": self.limits[dev],
+                "jobs": stat["jobs"],
+                "bytes_read": stat["bytes_read"],
+                "bytes_written": stat["bytes_written"],
+                "busy": busy,
+                "throughput": total_bytes / busy / (1024 * 1024) if busy > 0 else 0.0,
+            })
+        return stats
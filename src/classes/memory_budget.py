@@ -0,0 +1,49 @@
+from contextlib import contextmanager
+import threading
+
+_MB = 1024 * 1024
+
+class MemoryLimitError(Exception):
+    """ 緩衝需求超過單一工作記憶體上限 """
+
+class MemoryBudget:
+    """
+    單一寫入工作的緩衝記憶體帳本
+    各緩衝路徑（複製緩衝、壓縮視窗、讀入記憶體的 ComicInfo）配置前先登記，登記總量不超過上限，並記錄峰值
+    可由同一工作的多個執行緒共用
+    """
+    def __init__(self, limit: int = 0):
+        self.limit = limit # 位元組，0 為不限制
+        self.used = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def try_reserve(self, size: int) -> bool:
+        """ 登記 size 位元組，超過上限時不登記並回傳 False """
+        with self._lock:
+            if self.limit and self.used + size > self.limit:
+                return False
+            self.used += size
+            self.peak = max(self.peak, self.used)
+            return True
+
+    def reserve(self, size: int, purpose: str) -> None:
+        """ 登記 size 位元組，超過上限時拋出 MemoryLimitError """
+        if not self.try_reserve(size):
+            raise MemoryLimitError(
+                f"{purpose} 需要 {size / _MB:.1f} MB，超過單一工作記憶體上限 {self.limit / _MB:.0f} MB（已使用 {self.used / _MB:.1f} MB）"
+            )
+
+    def release(self, size: int) -> None:
+        """ 釋放登記 """
+        with self._lock:
+            self.used -= size
+
+    @contextmanager
+    def hold(self, size: int, purpose: str):
+        """ 在區塊內保留 size 位元組 """
+        self.reserve(size, purpose)
+        try:
+            yield
+        finally:
+            self.release(size)
@@ -0,0 +1,120 @@
+from PySide6.QtCore import QStandardPaths
+import os
+import pickle
+import sqlite3
+import threading
+# 自訂庫
+from src.classes.metadata_record import MetadataRecord
+
+class MetadataIndex:
+    """
+    漫畫 metadata 持久化索引
+    以 ( 來源資料夾, 相對路徑 ) 為鍵，配合檔案大小與修改時間判斷是否需要重新讀取
+    """
+    def __init__(self, db_path: str = ""):
+        self.db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    ### 內部函式 ###
+
+    def _connect(self) -> sqlite3.Connection:
+        """ 延遲開啟資料庫（QApplication 建立後才能取得快取路徑） """
+        if self._conn is not None:
+            return self._conn
+        if not self.db_path:
+            cache_dir = os.path.join(
+                QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericCacheLocation),
+                "comic_info_editor",
+            )
+            os.makedirs(cache_dir, exist_ok=True)
+            self.db_path = os.path.join(cache_dir, "metadata_index.sqlite3")
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS comic_index (
+                root TEXT NOT NULL,
+                rel_path TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                data BLOB NOT NULL,
+                PRIMARY KEY (root, rel_path)
+            )
+        """)
+        self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def _norm_root(root: str) -> str:
+        """ 正規化來源資料夾路徑 """
+        return os.path.normcase(os.path.abspath(root))
+
+    @staticmethod
+    def norm_rel_path(rel_path: str) -> str:
+        """ 正規化相對路徑（索引鍵） """
+        return os.path.normcase(rel_path)
+
+    ### 功能函式 ###
+
+    def load(self, root: str) -> dict[str, tuple[int, int, bytes]]:
+        """ 取得來源資料夾下所有索引項目 { 正規化相對路徑: (大小, 修改時間, 資料) } """
+        try:
+            with self._lock:
+                conn = self._connect()
+                rows = conn.execute(
+                    "SELECT rel_path, size, mtime_ns, data FROM comic_index WHERE root = ?",
+                    (self._norm_root(root),),
+                ).fetchall()
+        except (sqlite3.Error, OSError) as e:
+            print(f"❌ 索引讀取錯誤：{e}")
+            return {}
+        return {rel_path: (size, mtime_ns, data) for rel_path, size, mtime_ns, data in rows}
+
+    @staticmethod
+    def unpack(data: bytes) -> MetadataRecord | None:
+        """ 還原索引中儲存的 parse_comicinfo 結果（舊版索引儲存的是 dict），資料損毀或格式不符時回傳 None """
+        try:
+            return MetadataRecord.from_dict(pickle.loads(data))
+        except Exception:
+            return None
+
+    def store(self, root: str, entries: dict[str, tuple[int, int, MetadataRecord]], removed: set[str] = frozenset()) -> None:
+        """ 批次寫入索引項目 { 相對路徑: (大小, 修改時間, metadata) }，並移除已不存在的項目 """
+        norm_root = self._norm_root(root)
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO comic_index (root, rel_path, size, mtime_ns, data) VALUES (?, ?, ?, ?, ?)",
+                        (
+                            (norm_root, self.norm_rel_path(rel_path), size, mtime_ns, pickle.dumps(data, pickle.HIGHEST_PROTOCOL))
+                            for rel_path, (size, mtime_ns, data) in entries.items()
+                        ),
+                    )
+                    conn.executemany(
+                        "DELETE FROM comic_index WHERE root = ? AND rel_path = ?",
+                        ((norm_root, self.norm_rel_path(rel_path)) for rel_path in removed),
+                    )
+        except (sqlite3.Error, OSError) as e:
+            print(f"❌ 索引寫入錯誤：{e}")
+
+    def invalidate(self, root: str, path: str) -> None:
+        """ 使來源資料夾 root 下指定檔案的索引失效（寫入檔案後呼叫，不在 root 下的檔案不處理） """
+        if not root:
+            return
+        norm_root = self._norm_root(root)
+        norm_path = self._norm_root(path)
+        if not norm_path.startswith(norm_root + os.sep):
+            return
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "DELETE FROM comic_index WHERE root = ? AND rel_path = ?",
+                        (norm_root, os.path.relpath(norm_path, norm_root)),
+                    )
+        except (sqlite3.Error, OSError) as e:
+            print(f"❌ 索引更新錯誤：{e}")
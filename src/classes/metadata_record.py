@@ -0,0 +1,278 @@
+from collections.abc import Mapping
+import sys
+import threading
+import weakref
+# 自訂庫
+from src.setting import schema_config
+
+class FieldTable:
+    """
+    欄位編號表（欄位名稱 → 編號）
+    以 schema_config 的欄位順序為初始編號，未知欄位依出現順序追加（編號只在同一行程內有效）
+    """
+    def __init__(self, tags):
+        self.tags: list[str] = []
+        self.ids: dict[str, int] = {}
+        self._lock = threading.Lock()
+        for tag in tags:
+            self.id_of(tag)
+
+    def id_of(self, tag: str) -> int:
+        """ 取得欄位編號（未知欄位會新增編號） """
+        field_id = self.ids.get(tag)
+        if field_id is None:
+            with self._lock:
+                field_id = self.ids.get(tag)
+                if field_id is None:
+                    field_id = len(self.tags)
+                    self.tags.append(sys.intern(tag))
+                    self.ids[self.tags[field_id]] = field_id
+        return field_id
+
+FIELD_TABLE = FieldTable(cfg["info_key"] for fields in schema_config.values() for cfg in fields.values())
+
+class FieldLayout:
+    """
+    單值欄位的排列（欄位編號序列與欄位 → 位置的對照）
+    相同欄位組合的紀錄共用同一個排列，紀錄本身只保存對齊的值
+    """
+    __slots__ = ("ids", "tags", "index")
+    _layouts: dict[tuple[int, ...], "FieldLayout"] = {}
+
+    def __init__(self, ids: tuple[int, ...]):
+        self.ids = ids
+        self.tags = tuple(FIELD_TABLE.tags[field_id] for field_id in ids)
+        self.index = {tag: position for position, tag in enumerate(self.tags)}
+
+    @classmethod
+    def of(cls, tags) -> "FieldLayout":
+        """ 取得欄位序列對應的共用排列 """
+        ids = tuple(FIELD_TABLE.id_of(tag) for tag in tags)
+        layout = cls._layouts.get(ids)
+        if layout is None:
+            layout = cls._layouts.setdefault(ids, cls(ids))
+        return layout
+
+class FieldsView(Mapping):
+    """ 單一 prefix 的唯讀欄位檢視（dict 相容） """
+    __slots__ = ("_layout", "_values")
+
+    def __init__(self, layout: FieldLayout, values: tuple):
+        self._layout = layout
+        self._values = values
+
+    def __getitem__(self, tag: str):
+        return self._values[self._layout.index[tag]]
+
+    def __iter__(self):
+        return iter(self._layout.tags)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, tag) -> bool:
+        return tag in self._layout.index
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+class PrefixesView(Mapping):
+    """ _fields 的唯讀檢視 { prefix: FieldsView } """
+    __slots__ = ("_fields",)
+
+    def __init__(self, fields: tuple):
+        self._fields = fields
+
+    def __getitem__(self, prefix: str) -> FieldsView:
+        for name, layout, values in self._fields:
+            if name == prefix:
+                return FieldsView(layout, values)
+        raise KeyError(prefix)
+
+    def __iter__(self):
+        return (name for name, _, _ in self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __repr__(self) -> str:
+        return repr({prefix: dict(fields) for prefix, fields in self.items()})
+
+def _intern(value):
+    """ 字串去重（其他型別原樣保留，如 _nsmap 中預設 namespace 的 None 鍵） """
+    return sys.intern(value) if type(value) is str else value
+
+_key_sets: dict[tuple, tuple] = {} # 共用的小型 tuple（屬性名稱序列、頂層鍵、namespace 宣告）
+_EMPTY_PAIRS = ((), ())
+
+def _shared(payload: tuple) -> tuple:
+    """ 取得內容相同的共用 tuple（僅用於種類很少的小型內容） """
+    return _key_sets.setdefault(payload, payload)
+
+def _freeze_pairs(mapping: dict) -> tuple[tuple[str, ...], tuple]:
+    """ dict → ( 共用的鍵序列, 對齊的值 )（如 Page 的屬性名稱在所有頁面間共用） """
+    if not mapping:
+        return _EMPTY_PAIRS
+    keys = _shared(tuple(_intern(key) for key in mapping)) # 預設 namespace 的前綴為 None
+    return (keys, tuple(_intern(value) for value in mapping.values()))
+
+def _thaw_pairs(pairs: tuple[tuple[str, ...], tuple]) -> dict:
+    """ _freeze_pairs 的反向轉換 """
+    return dict(zip(*pairs))
+
+class MetadataRecord(Mapping):
+    """
+    精簡的 parse_comicinfo 結果（file_metadata_cache 的值）
+    - 單值欄位：共用的 FieldLayout + 對齊的值 tuple，不再每本書各自保存欄位名稱
+    - 字串一律 intern，常見的出版社、系列、語言等值在所有紀錄間共用
+    - 內容完全相同的 ComicInfo（含 _nsmap、_complex）共用同一個紀錄
+    以唯讀 Mapping 提供與原本 dict 相同的存取方式：
+      record['_fields']['base'].get('Title')、record.get('_nsmap', {}) …
+    _nsmap 與 _complex 每次取用都回傳新的 dict，呼叫端可以自由修改
+    """
+    __slots__ = ("_data", "__weakref__")
+    _records: "weakref.WeakValueDictionary[tuple, MetadataRecord]" = weakref.WeakValueDictionary()
+    EMPTY: "MetadataRecord"
+
+    def __init__(self, data: tuple):
+        # ( 頂層鍵, _fields, _nsmap, _complex, 其他頂層項目 )
+        self._data = data
+
+    @classmethod
+    def from_dict(cls, parsed: Mapping) -> "MetadataRecord":
+        """ 由 parse_comicinfo 的結果建立（相同內容回傳既有的紀錄） """
+        if isinstance(parsed, MetadataRecord):
+            return parsed
+        fields = tuple(
+            (_intern(prefix), FieldLayout.of(values), tuple(_intern(value) for value in values.values()))
+            for prefix, values in parsed.get('_fields', {}).items()
+        )
+        complex_fields = tuple(
+            (_intern(prefix), tuple(
+                (_intern(tag), tuple(
+                    (
+                        _freeze_pairs(entry.get('_attrs', {})),
+                        tuple(
+                            (_intern(child['tag']), _intern(child['text']), _freeze_pairs(child['attrib']))
+                            for child in entry.get('_children', [])
+                        ),
+                    )
+                    for entry in entries
+                ))
+                for tag, entries in groups.items()
+            ))
+            for prefix, groups in parsed.get('_complex', {}).items()
+        )
+        extra = tuple(
+            (_intern(key), _intern(value)) for key, value in parsed.items()
+            if key not in ('_fields', '_nsmap', '_complex')
+        )
+        data = (
+            _shared(tuple(_intern(key) for key in parsed)),
+            fields,
+            _shared(_freeze_pairs(parsed.get('_nsmap', {}))), # 幾乎所有書的 namespace 宣告都相同
+            complex_fields,
+            extra,
+        )
+        try:
+            record = cls._records.get(data)
+            if record is None:
+                record = cls._records.setdefault(data, cls(data))
+        except TypeError: # 含有無法雜湊的值，不共用
+            record = cls(data)
+        return record
+
+    def updated(self, changes: Mapping[str, Mapping]) -> "MetadataRecord":
+        """
+        回傳套用單值欄位變更 { prefix: { 欄位: 值 } } 後的新紀錄（寫入時複製，原紀錄不變）
+        未變更的 prefix、_nsmap、_complex 與其他頂層項目直接與原紀錄共用，只重建有變更的 prefix 的值 tuple
+        既有欄位保留原本位置，新欄位依序加在最後（與 dict.update 相同）
+        """
+        keys, fields, nsmap, complex_fields, extra = self._data
+        fields = list(fields)
+        positions = {prefix: position for position, (prefix, _, _) in enumerate(fields)}
+        for prefix, values in changes.items():
+            position = positions.get(prefix)
+            if position is None:
+                positions[prefix] = len(fields)
+                fields.append((prefix, FieldLayout.of(values), tuple(values.values())))
+                continue
+            if not values:
+                continue
+            _, layout, old_values = fields[position]
+            new_tags = tuple(tag for tag in values if tag not in layout.index)
+            merged = list(old_values)
+            if new_tags:
+                layout = FieldLayout.of(layout.tags + new_tags)
+                merged.extend([None] * len(new_tags))
+            index = layout.index
+            for tag, value in values.items():
+                merged[index[tag]] = value
+            fields[position] = (prefix, layout, tuple(merged))
+        missing = tuple(key for key in ('_fields', '_complex', '_nsmap') if key not in keys)
+        if missing:
+            keys = _shared(keys + missing)
+        # 批次中的暫時紀錄，不 intern 也不登錄共用
+        return MetadataRecord((keys, tuple(fields), nsmap, complex_fields, extra))
+
+    def to_dict(self) -> dict:
+        """ 轉回 parse_comicinfo 格式的 dict（全部為新物件） """
+        return {key: self._thaw(key) for key in self._data[0]}
+
+    def _thaw(self, key: str):
+        """ 還原單一頂層項目 """
+        _, fields, nsmap, complex_fields, extra = self._data
+        if key == '_fields':
+            return {prefix: dict(zip(layout.tags, values)) for prefix, layout, values in fields}
+        if key == '_nsmap':
+            return _thaw_pairs(nsmap)
+        if key == '_complex':
+            return {
+                prefix: {
+                    tag: [
+                        {
+                            '_attrs': _thaw_pairs(attrs),
+                            '_children': [
+                                {'tag': child_tag, 'text': text, 'attrib': _thaw_pairs(attrib)}
+                                for child_tag, text, attrib in children
+                            ],
+                        }
+                        for attrs, children in entries
+                    ]
+                    for tag, entries in groups
+                }
+                for prefix, groups in complex_fields
+            }
+        return dict(extra)[key]
+
+    def __getitem__(self, key: str):
+        if key not in self._data[0]:
+            raise KeyError(key)
+        if key == '_fields':
+            return PrefixesView(self._data[1]) # 單值欄位最常讀取，以檢視取代複製
+        return self._thaw(key)
+
+    def __iter__(self):
+        return iter(self._data[0])
+
+    def __len__(self) -> int:
+        return len(self._data[0])
+
+    def __contains__(self, key) -> bool:
+        return key in self._data[0]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, MetadataRecord):
+            return self is other or self._data == other._data
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # 以 dict 格式序列化（欄位編號只在同一行程內有效）
+        return (MetadataRecord.from_dict, (self.to_dict(),))
+
+    def __repr__(self) -> str:
+        return f"MetadataRecord({self.to_dict()!r})"
+
+MetadataRecord.EMPTY = MetadataRecord.from_dict({})
@@ -0,0 +1,98 @@
+import re
+
+# 佔位符：{名稱} 或 {名稱:格式}，例如 {index:03} 補零、{match:1} 取檔名規則的第 1 個群組
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)(?::([^{}]*))?\}")
+MATCH_KEY = "match" # 檔名規則的擷取群組
+
+class PlaceholderTemplate:
+    """
+    編譯後的佔位符模板
+    編譯時拆分為文字與佔位符片段，套用時單次組合
+    未知的佔位符保留原文字，沒有可用的檔名規則時 {match} 也保留原文字
+    """
+    def __init__(self, source: str):
+        self.source = source
+        # 文字與佔位符交錯：literals[0] placeholders[0] literals[1] … literals[-1]
+        self.literals: list[str] = []
+        self.placeholders: list[tuple[str, str | None, str]] = [] # ( 名稱, 格式, 原文字 )
+        position = 0
+        for match in _PLACEHOLDER_RE.finditer(source):
+            self.literals.append(source[position:match.start()])
+            self.placeholders.append((match.group(1), match.group(2), match.group(0)))
+            position = match.end()
+        self.literals.append(source[position:])
+        self.uses_match = any(key == MATCH_KEY for key, _, _ in self.placeholders)
+
+    @property
+    def is_literal(self) -> bool:
+        """ 是否沒有佔位符 """
+        return not self.placeholders
+
+    def render(self, context: dict, match: re.Match | None = None, use_match: bool = False) -> str:
+        """ 套用內容（use_match 表示有可用的檔名規則，match 為其比對結果） """
+        literals = self.literals
+        parts = [literals[0]]
+        for index, (key, spec, raw) in enumerate(self.placeholders, 1):
+            if key == MATCH_KEY:
+                parts.append(self._match_group(match, spec) if use_match else raw)
+            elif key not in context:
+                parts.append(raw)
+            elif spec is None:
+                parts.append(str(context[key]))
+            else:
+                try:
+                    parts.append(format(context[key], spec))
+                except (TypeError, ValueError):
+                    parts.append(raw) # 格式不適用於此值
+            parts.append(literals[index])
+        return "".join(parts)
+
+    @staticmethod
+    def _match_group(match: re.Match | None, group: str | None) -> str:
+        """ 取得擷取群組（群組編號或名稱，未指定為整段比對；未比對到時為空字串） """
+        if match is None:
+            return ""
+        try:
+            value = match.group(int(group) if group and group.isdigit() else (group or 0))
+        except IndexError: # 沒有此群組
+            return ""
+        return value or ""
+
+class MetadataTemplate:
+    """
+    編輯器輸入編譯後的模板（每批次編譯一次，逐檔套用）
+    檔名規則（正規表示式）也只編譯一次，且只有模板用到 {match} 時才比對
+    """
+    def __init__(self, updated: dict, filename_pattern: str = ""):
+        self.fields: dict[str, dict[str, object]] = {} # { prefix: { 欄位: 值或 PlaceholderTemplate } }
+        uses_match = False
+        for prefix, fields in updated.get('_fields', {}).items():
+            compiled = self.fields[prefix] = {}
+            for key, value in fields.items():
+                if isinstance(value, str):
+                    template = PlaceholderTemplate(value)
+                    if not template.is_literal:
+                        compiled[key] = template
+                        uses_match |= template.uses_match
+                        continue
+                compiled[key] = value # 文字欄位直接使用
+        self.pattern: re.Pattern | None = None
+        if uses_match and not filename_pattern:
+            print("⚠️ 編輯欄位使用了 {match}，但未設定檔名規則，佔位符將保留原文字")
+        elif uses_match:
+            try:
+                self.pattern = re.compile(filename_pattern)
+            except re.error as e:
+                print(f"❌ 檔名規則錯誤：{filename_pattern}：{e}，{{match}} 佔位符將保留原文字")
+
+    def render(self, context: dict) -> dict[str, dict[str, object]]:
+        """ 套用單一檔案的內容，回傳 { prefix: { 欄位: 值 } } """
+        use_match = self.pattern is not None
+        match = self.pattern.search(context.get("fileName", "")) if use_match else None
+        return {
+            prefix: {
+                key: value.render(context, match, use_match) if isinstance(value, PlaceholderTemplate) else value
+                for key, value in fields.items()
+            }
+            for prefix, fields in self.fields.items()
+        }
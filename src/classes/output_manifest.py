@@ -0,0 +1,100 @@
+from PySide6.QtCore import QStandardPaths
+import os
+import sqlite3
+import threading
+
+class OutputManifest:
+    """
+    批次輸出紀錄
+    記錄每個輸出檔的 ( 來源簽章, 輸出簽章, ComicInfo 雜湊, 輸出方式 )，供重新執行時略過未變更的檔案
+    """
+    def __init__(self, db_path: str = ""):
+        self.db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    ### 內部函式 ###
+
+    def _connect(self) -> sqlite3.Connection:
+        """ 延遲開啟資料庫（QApplication 建立後才能取得快取路徑） """
+        if self._conn is not None:
+            return self._conn
+        if not self.db_path:
+            cache_dir = os.path.join(
+                QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericCacheLocation),
+                "comic_info_editor",
+            )
+            os.makedirs(cache_dir, exist_ok=True)
+            self.db_path = os.path.join(cache_dir, "output_manifest.sqlite3")
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS output_manifest (
+                dst_path TEXT PRIMARY KEY,
+                src_size INTEGER NOT NULL,
+                src_mtime_ns INTEGER NOT NULL,
+                dst_size INTEGER NOT NULL,
+                dst_mtime_ns INTEGER NOT NULL,
+                xml_hash TEXT NOT NULL,
+                profile TEXT NOT NULL DEFAULT ''
+            )
+        """)
+        # 舊版紀錄沒有輸出方式欄位（空字串，不會與任何輸出方式相符，下次執行時重新寫入）
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(output_manifest)")}
+        if "profile" not in columns:
+            self._conn.execute("ALTER TABLE output_manifest ADD COLUMN profile TEXT NOT NULL DEFAULT ''")
+        self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def norm_path(path: str) -> str:
+        """ 正規化輸出路徑（紀錄鍵） """
+        return os.path.normcase(os.path.abspath(path))
+
+    ### 功能函式 ###
+
+    def load(self, dst_paths: list[str]) -> dict[str, tuple[int, int, int, int, str, str]]:
+        """ 取得輸出檔紀錄 { 輸出路徑: (來源大小, 來源修改時間, 輸出大小, 輸出修改時間, 雜湊, 輸出方式) } """
+        entries = {}
+        try:
+            with self._lock:
+                conn = self._connect()
+                for path in dst_paths:
+                    row = conn.execute(
+                        "SELECT src_size, src_mtime_ns, dst_size, dst_mtime_ns, xml_hash, profile FROM output_manifest WHERE dst_path = ?",
+                        (self.norm_path(path),),
+                    ).fetchone()
+                    if row is not None:
+                        entries[path] = tuple(row)
+        except (sqlite3.Error, OSError) as e:
+            print(f"❌ 輸出紀錄讀取錯誤：{e}")
+            return {}
+        return entries
+
+    def store(self, entries: dict[str, tuple[int, int, int, int, str, str]]) -> None:
+        """ 批次寫入輸出檔紀錄 """
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO output_manifest"
+                        " (dst_path, src_size, src_mtime_ns, dst_size, dst_mtime_ns, xml_hash, profile) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        ((self.norm_path(path), *entry) for path, entry in entries.items()),
+                    )
+        except (sqlite3.Error, OSError) as e:
+            print(f"❌ 輸出紀錄寫入錯誤：{e}")
+
+    def remove(self, dst_paths: list[str]) -> None:
+        """ 移除輸出檔紀錄（下次執行時重新寫入） """
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.executemany(
+                        "DELETE FROM output_manifest WHERE dst_path = ?",
+                        ((self.norm_path(path),) for path in dst_paths),
+                    )
+        except (sqlite3.Error, OSError) as e:
+            print(f"❌ 輸出紀錄寫入錯誤：{e}")
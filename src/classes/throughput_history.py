@@ -0,0 +1,62 @@
+from PySide6.QtCore import QStandardPaths
+import json
+import os
+
+class ThroughputHistory:
+    """
+    各裝置的批次吞吐量紀錄（MB/s，指數移動平均）
+    供預估批次時間使用，以裝置名稱（掛載點）為鍵
+    """
+    SMOOTHING = 0.5 # 新量測值的權重
+    MIN_BUSY = 0.5 # 忙碌時間過短的量測不列入（秒）
+
+    def __init__(self, history_path: str = ""):
+        self.history_path = history_path
+        self._history: dict[str, float] | None = None
+
+    ### 內部函式 ###
+
+    def _path(self) -> str:
+        """ 延遲取得紀錄路徑（QApplication 建立後才能取得快取路徑） """
+        if not self.history_path:
+            cache_dir = os.path.join(
+                QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericCacheLocation),
+                "comic_info_editor",
+            )
+            os.makedirs(cache_dir, exist_ok=True)
+            self.history_path = os.path.join(cache_dir, "throughput_history.json")
+        return self.history_path
+
+    ### 功能函式 ###
+
+    def load(self) -> dict[str, float]:
+        """ 取得各裝置吞吐量 { 裝置名稱: MB/s } """
+        if self._history is None:
+            try:
+                with open(self._path(), encoding="utf-8") as f:
+                    self._history = {str(name): float(value) for name, value in json.load(f).items()}
+            except FileNotFoundError:
+                self._history = {}
+            except (OSError, ValueError, AttributeError) as e:
+                print(f"❌ 吞吐量紀錄讀取錯誤：{e}")
+                self._history = {}
+        return dict(self._history)
+
+    def record(self, devices: list[dict]) -> None:
+        """ 記錄批次結束時的各裝置統計（見 DeviceScheduler.device_stats） """
+        history = self.load()
+        for stat in devices:
+            if stat["busy"] < self.MIN_BUSY or stat["throughput"] <= 0:
+                continue
+            previous = history.get(stat["device"])
+            history[stat["device"]] = stat["throughput"] if previous is None else (
+                previous * (1 - self.SMOOTHING) + stat["throughput"] * self.SMOOTHING
+            )
+        self._history = history
+        try:
+            temp_path = self._path() + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(history, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self._path())
+        except OSError as e:
+            print(f"❌ 吞吐量紀錄寫入錯誤：{e}")
@@ -0,0 +1,58 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+@dataclass
+class WriteJob:
+    """ 批次寫入工作（需可序列化以傳入子行程） """
+    rel_path: str
+    kind: str # 寫入方式（見 archive_writer.WRITE_*）
+    src_path: str
+    dst_path: str
+    data: Mapping # 更新後的 ComicInfo 資料（MetadataRecord）
+    buffer_size: int
+    compact_threshold: int = 0
+    compress_level: int = 0 # 資料夾打包的 deflate 等級（0 為不壓縮）
+    stored_exts: tuple = () # 資料夾打包時不壓縮的副檔名
+    compress_workers: int = 1 # 資料夾打包的壓縮執行緒數（批次並行數分攤 CPU 核心數）
+    memory_limit: int = 0 # 單一工作的記憶體上限（位元組，0 為不限制）
+    cpu_bound: bool = False # 以 CPU 為主的工作（如重新壓縮）交給行程池
+    skip_unchanged: bool = False # ComicInfo 未變更時略過或直接複製
+    patch_comicinfo: bool = False # 以來源的 ComicInfo.xml 為基礎只改寫變更的欄位
+    manifest: tuple | None = None # 上次輸出紀錄 (來源大小, 來源修改時間, 輸出大小, 輸出修改時間, 雜湊, 輸出方式)
+
+@dataclass
+class JobState:
+    """ 寫入前讀取的檔案狀態（管線讀取階段的輸出） """
+    src_signature: tuple | None # (大小, 修改時間)
+    dst_signature: tuple | None
+    src_comicinfo_hash: str | None = None # 來源中既有 ComicInfo.xml 的雜湊（需要時才讀取）
+    dst_comicinfo_hash: str | None = None
+    src_comicinfo: bytes | None = None # 來源的 ComicInfo.xml 內容（修補模式才讀取）
+
+@dataclass
+class WriteResult:
+    """ 批次寫入結果 """
+    rel_path: str
+    kind: str
+    dst_path: str
+    ok: bool
+    error: str
+    elapsed: float # 秒
+    bytes_written: int
+    action: str = "written" # 見 archive_writer.ACTION_*
+    xml_hash: str = ""
+    src_signature: tuple | None = None # (大小, 修改時間)
+    dst_signature: tuple | None = None
+    profile: str = "" # 輸出方式（見 archive_writer.output_profile）
+    peak_memory: int = 0 # 登記的緩衝記憶體峰值（位元組，見 MemoryBudget）
+
+@dataclass
+class VerifyResult:
+    """ 輸出驗證結果 """
+    rel_path: str
+    dst_path: str
+    ok: bool
+    error: str
+    elapsed: float # 秒
+    entries_checked: int # 檢查 CRC 的項目數
+    sha256: str = "" # 整個輸出檔的校驗碼（僅完整檢查時計算）
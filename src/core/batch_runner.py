@@ -0,0 +1,323 @@
+from PySide6.QtCore import QObject, Signal
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+import multiprocessing
+import time
+# 自訂庫
+from src.global_data_store import GLOBAL_DATA_STORE
+from src.signal_bus import SIGNAL_BUS
+from src.classes.write_job import JobState, VerifyResult, WriteJob, WriteResult
+from src.classes.device_scheduler import DeviceScheduler
+from src.function.device_info import DEVICE_HDD, DEVICE_NETWORK
+from src.function.archive_writer import ACTION_SKIPPED, build_comicinfo, read_job_state, run_write_job
+from src.function.archive_verifier import VERIFY_OFF, verify_output
+from src.function.zip_process import COPY_BUFFER_SIZE
+
+class BatchRunner(QObject):
+    """
+    批次寫入執行器
+    工作分為讀取 → 轉換 → 寫入三段管線，各段以有限佇列銜接，彼此重疊進行：
+    - 讀取：依預計順序讀取檔案狀態與既有 ComicInfo（並請作業系統預讀來源），同時進行的數量由預讀深度限制
+    - 轉換：產生 ComicInfo.xml（修補模式以讀取階段取得的原始內容為基礎）
+    - 寫入：依裝置排程後交給工作池執行（I/O 為主的工作用執行緒池，CPU 為主的工作用行程池），逐檔結果透過 SIGNAL_BUS.batch 回報
+    已讀取但尚未寫入的工作數由寫入佇列深度限制，避免讀取遠遠超前寫入
+    開啟驗證時，寫入完成的輸出交給另一個執行緒池驗證，與後續檔案的寫入同時進行
+    """
+    STAGE_READ = "read"
+    STAGE_TRANSFORM = "transform"
+    STAGE_WRITE = "write"
+    STAGE_NAMES = {STAGE_READ: "讀取", STAGE_TRANSFORM: "轉換", STAGE_WRITE: "寫入"}
+
+    # 工作池執行緒 → 主執行緒
+    _stageDone = Signal(int, str, object, object) # (批次代號, 階段, 工作, 結果)
+    _jobDone = Signal(int, object, object) # (批次代號, 工作, 結果)
+    _jobVerified = Signal(int, object) # (批次代號, 驗證結果)
+
+    def __init__(self):
+        super().__init__()
+        self.batch_generation = 0
+        self.thread_pool: ThreadPoolExecutor | None = None
+        self.process_pool: ProcessPoolExecutor | None = None
+        self.verify_pool: ThreadPoolExecutor | None = None # 驗證與後續檔案的寫入同時進行
+        self.read_pool: ThreadPoolExecutor | None = None
+        self.transform_pool: ThreadPoolExecutor | None = None
+        # 管線狀態
+        self.read_queue: deque[WriteJob] = deque() # 尚未讀取
+        self.reading = 0
+        self.transforming = 0
+        self.states: dict[int, JobState | None] = {} # id(工作): 讀取階段的檔案狀態，等待轉換
+        self.prepared: dict[int, tuple[JobState | None, bytes | None]] = {} # id(工作): (檔案狀態, ComicInfo)，等待寫入
+        self.read_queue_depth = 4
+        self.write_queue_depth = 8
+        self.stage_busy: dict[str, float] = {} # 各階段累計忙碌秒數
+        self.verify_mode = VERIFY_OFF
+        self.verify_pending = 0
+        self.verify_failed = 0
+        self.total = 0
+        self.pending = 0
+        self.failed = 0
+        self.skipped = 0
+        self.bytes_written = 0
+        self.peak_memory = 0 # 單一工作登記的緩衝記憶體峰值
+        self.start_time = 0.0
+        self.workers = 1
+        self.scheduler: DeviceScheduler | None = None
+        self.copy_buffer_size = COPY_BUFFER_SIZE
+        self.job_memory_limit = 0
+        self.update_copy_buffer_size()
+        # 訊號綁定
+        self._stageDone.connect(self.on_stage_done)
+        self._jobDone.connect(self.on_job_done)
+        self._jobVerified.connect(self.on_job_verified)
+        SIGNAL_BUS.aboutToQuit.connect(self.cancel)
+        SIGNAL_BUS.appSetting.copyBufferSizeChanged.connect(self.update_copy_buffer_size)
+        SIGNAL_BUS.appSetting.jobMemoryLimitChanged.connect(self.update_copy_buffer_size)
+
+    def update_copy_buffer_size(self, *_) -> None:
+        """ 依設定計算串流複製緩衝大小（不超過單一工作記憶體上限的四分之一，保留解壓縮與 zipfile 內部緩衝的空間） """
+        buffer_size = GLOBAL_DATA_STORE.get("copy_buffer_kb", COPY_BUFFER_SIZE // 1024) * 1024
+        job_memory_limit = GLOBAL_DATA_STORE.get("job_memory_limit_mb", 256) * 1024 * 1024
+        self.copy_buffer_size = max(64 * 1024, min(buffer_size, job_memory_limit // 4))
+        self.job_memory_limit = job_memory_limit
+        if self.copy_buffer_size != buffer_size:
+            print(f"⚠️ 複製緩衝 {buffer_size // 1024} KB 超過單一工作記憶體上限 {job_memory_limit // (1024 * 1024)} MB，改用 {self.copy_buffer_size // 1024} KB")
+        print(f"ℹ️ 串流複製緩衝 {self.copy_buffer_size // 1024} KB，單一工作記憶體上限 {job_memory_limit // (1024 * 1024)} MB")
+
+    def is_running(self) -> bool:
+        """ 是否有批次執行中 """
+        return self.pending > 0 or self.verify_pending > 0
+
+    def start(self, jobs: list[WriteJob]) -> None:
+        """ 開始批次（依裝置排程，各裝置有空位時才送入工作池） """
+        self.cancel()
+        self.batch_generation += 1
+        self.total = len(jobs)
+        self.pending = len(jobs)
+        self.failed = 0
+        self.skipped = 0
+        self.bytes_written = 0
+        self.peak_memory = 0
+        self.verify_mode = GLOBAL_DATA_STORE.get("verify_mode", VERIFY_OFF)
+        self.verify_pending = 0
+        self.verify_failed = 0
+        self.stage_busy = {self.STAGE_READ: 0.0, self.STAGE_TRANSFORM: 0.0, self.STAGE_WRITE: 0.0}
+        self.start_time = time.perf_counter()
+        SIGNAL_BUS.batch.started.emit(self.total)
+        if not jobs:
+            self.scheduler = None
+            self.finish()
+            return
+
+        self.workers = max(1, int(GLOBAL_DATA_STORE.get("batch_workers", 1)))
+        self.scheduler = DeviceScheduler(jobs, self.workers, {
+            DEVICE_HDD: GLOBAL_DATA_STORE.get("hdd_workers", 1),
+            DEVICE_NETWORK: GLOBAL_DATA_STORE.get("network_workers", 2),
+        })
+        for dev, (name, kind) in self.scheduler.devices.items():
+            print(f"ℹ️ 裝置 {name}（{kind}）並行上限 {self.scheduler.limits[dev]}")
+
+        self.read_queue_depth = max(1, int(GLOBAL_DATA_STORE.get("read_queue_depth", 4)))
+        self.write_queue_depth = max(self.read_queue_depth, int(GLOBAL_DATA_STORE.get("write_queue_depth", 8)))
+        self.read_queue = deque(self.scheduler.planned_order())
+        self.reading = 0
+        self.transforming = 0
+        self.states = {}
+        self.prepared = {}
+        print(f"ℹ️ 管線預讀深度 {self.read_queue_depth}，寫入佇列深度 {self.write_queue_depth}")
+        self.pump()
+
+    @staticmethod
+    def _timed(func, *args) -> tuple[object, float]:
+        """ 執行並計時（於工作池執行緒呼叫），回傳 ( 結果, 秒數 ) """
+        start = time.perf_counter()
+        return func(*args), time.perf_counter() - start
+
+    def pump(self) -> None:
+        """ 推進管線：已讀取未寫入的工作不超過寫入佇列深度，同時讀取的數量不超過預讀深度 """
+        self.dispatch() # 先送出已就緒的工作，空出寫入佇列
+        generation = self.batch_generation
+        while (
+            self.read_queue
+            and self.reading < self.read_queue_depth
+            and self.reading + self.transforming + len(self.prepared) < self.write_queue_depth
+        ):
+            job = self.read_queue.popleft()
+            if self.read_pool is None:
+                self.read_pool = ThreadPoolExecutor(max_workers=self.read_queue_depth, thread_name_prefix="read")
+            self.reading += 1
+            future = self.read_pool.submit(self._timed, read_job_state, job, None, True)
+            future.add_done_callback(lambda f, job=job: self.on_stage_future_done(generation, self.STAGE_READ, job, f))
+
+    def on_stage_future_done(self, generation: int, stage: str, job: WriteJob, future: Future) -> None:
+        """ 讀取或轉換完成（於工作池執行緒呼叫，轉交主執行緒），失敗時交由寫入階段重新處理並回報錯誤 """
+        if future.cancelled():
+            return
+        try:
+            value = future.result()
+        except Exception as e:
+            print(f"⚠️ {job.rel_path} {self.STAGE_NAMES[stage]}階段錯誤，於寫入時重試：{e}")
+            value = (None, 0.0)
+        self._stageDone.emit(generation, stage, job, value)
+
+    def on_stage_done(self, generation: int, stage: str, job: WriteJob, value: tuple[object, float]) -> None:
+        """ 讀取或轉換完成（主執行緒） """
+        if generation != self.batch_generation or self.pending == 0:
+            return # 已取消的批次
+        result, elapsed = value
+        self.stage_busy[stage] += elapsed
+        if stage == self.STAGE_READ:
+            self.reading -= 1
+            self.transforming += 1
+            self.states[id(job)] = result
+            if self.transform_pool is None:
+                self.transform_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="transform") # 純 Python 運算，多執行緒無益
+            future = self.transform_pool.submit(self._timed, build_comicinfo, job, result)
+            future.add_done_callback(lambda f, job=job: self.on_stage_future_done(generation, self.STAGE_TRANSFORM, job, f))
+        else:
+            self.transforming -= 1
+            self.prepared[id(job)] = (self.states.pop(id(job), None), result)
+            self.scheduler.mark_ready(job)
+        self.pump()
+
+    def dispatch(self) -> None:
+        """ 將排程器中可執行的工作送入工作池 """
+        generation = self.batch_generation
+        for job in self.scheduler.next_jobs():
+            state, xml = self.prepared.pop(id(job), (None, None))
+            if job.cpu_bound:
+                if self.process_pool is None:
+                    # 以 spawn 建立子行程：fork 會複製介面行程中執行中的執行緒、鎖與開啟的資料庫連線
+                    self.process_pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+                future = self.process_pool.submit(run_write_job, job, state, xml)
+            else:
+                if self.thread_pool is None:
+                    self.thread_pool = ThreadPoolExecutor(max_workers=self.workers)
+                future = self.thread_pool.submit(run_write_job, job, state, xml)
+            future.add_done_callback(lambda f, job=job: self.on_future_done(generation, job, f))
+            SIGNAL_BUS.batch.jobStarted.emit(job)
+
+    def on_future_done(self, generation: int, job: WriteJob, future: Future) -> None:
+        """ 工作完成（於工作池執行緒呼叫，轉交主執行緒） """
+        if future.cancelled():
+            return
+        try:
+            result = future.result()
+        except Exception as e: # 行程池中斷等工作以外的錯誤
+            result = WriteResult(job.rel_path, job.kind, job.dst_path, False, str(e), 0.0, 0)
+        self._jobDone.emit(generation, job, result)
+
+    def on_job_done(self, generation: int, job: WriteJob, result: WriteResult) -> None:
+        """ 工作完成（主執行緒） """
+        if generation != self.batch_generation or self.pending == 0:
+            return # 已取消的批次
+        self.pending -= 1
+        self.scheduler.job_done(job, result)
+        self.stage_busy[self.STAGE_WRITE] += result.elapsed
+        self.peak_memory = max(self.peak_memory, result.peak_memory)
+        if result.ok:
+            self.bytes_written += result.bytes_written
+            self.skipped += result.action == ACTION_SKIPPED
+        else:
+            self.failed += 1
+        SIGNAL_BUS.batch.jobFinished.emit(result)
+        SIGNAL_BUS.ui.setProgressBar.emit(self.total - self.pending, self.total)
+        # 驗證有寫入的輸出
+        if self.verify_mode != VERIFY_OFF and result.ok and result.action != ACTION_SKIPPED:
+            if self.verify_pool is None:
+                self.verify_pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="verify")
+            self.verify_pending += 1
+            future = self.verify_pool.submit(verify_output, result, self.verify_mode, self.copy_buffer_size, not job.patch_comicinfo)
+            future.add_done_callback(lambda f, result=result: self.on_verify_future_done(generation, result, f))
+        if self.pending == 0:
+            if self.verify_pending == 0:
+                self.finish()
+        else:
+            self.pump()
+
+    def on_verify_future_done(self, generation: int, result: WriteResult, future: Future) -> None:
+        """ 驗證完成（於驗證執行緒呼叫，轉交主執行緒） """
+        if future.cancelled():
+            return
+        try:
+            verify_result = future.result()
+        except Exception as e:
+            verify_result = VerifyResult(result.rel_path, result.dst_path, False, str(e), 0.0, 0)
+        self._jobVerified.emit(generation, verify_result)
+
+    def on_job_verified(self, generation: int, verify_result: VerifyResult) -> None:
+        """ 驗證完成（主執行緒） """
+        if generation != self.batch_generation or self.verify_pending == 0:
+            return # 已取消的批次
+        self.verify_pending -= 1
+        self.verify_failed += not verify_result.ok
+        SIGNAL_BUS.batch.jobVerified.emit(verify_result)
+        if self.pending == 0 and self.verify_pending == 0:
+            self.finish()
+
+    def finish(self) -> None:
+        """ 批次結束 """
+        self.shutdown_pools(wait=False)
+        elapsed = time.perf_counter() - self.start_time
+        devices = self.scheduler.device_stats() if self.scheduler else []
+        for stat in devices:
+            print(
+                f"📊 {stat['device']}（{stat['kind']}）：{stat['jobs']} 個工作，"
+                f"讀取 {stat['bytes_read'] / (1024 * 1024):.1f} MB，寫入 {stat['bytes_written'] / (1024 * 1024):.1f} MB，"
+                f"{stat['throughput']:.1f} MB/s"
+            )
+        stages = self.stage_stats(elapsed)
+        for stage in stages:
+            print(f"📊 {self.STAGE_NAMES[stage['stage']]}階段：忙碌 {stage['busy']:.1f} 秒，使用率 {stage['utilisation'] * 100:.0f}%")
+        if self.total:
+            print(f"📊 單一工作緩衝記憶體峰值 {self.peak_memory / (1024 * 1024):.1f} MB（上限 {self.job_memory_limit // (1024 * 1024)} MB）")
+        SIGNAL_BUS.batch.finished.emit({
+            "total": self.total,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "bytes_written": self.bytes_written,
+            "elapsed": elapsed,
+            "devices": devices,
+            "stages": stages,
+            "verify_failed": self.verify_failed,
+            "peak_memory": self.peak_memory,
+        })
+
+    def stage_stats(self, elapsed: float) -> list[dict]:
+        """ 各階段統計（忙碌秒數與使用率＝忙碌時間 /（經過時間 × 並行數）），使用率低的階段表示在等待其他階段 """
+        if not self.stage_busy:
+            return []
+        workers = {
+            self.STAGE_READ: self.read_queue_depth,
+            self.STAGE_TRANSFORM: 1,
+            self.STAGE_WRITE: self.workers,
+        }
+        return [
+            {
+                "stage": stage,
+                "busy": busy,
+                "utilisation": min(1.0, busy / (elapsed * workers[stage])) if elapsed > 0 else 0.0,
+            }
+            for stage, busy in self.stage_busy.items()
+        ]
+
+    def cancel(self) -> None:
+        """ 取消批次（尚未開始的工作不再執行，執行中的工作會完成） """
+        self.pending = 0
+        self.verify_pending = 0
+        self.read_queue.clear()
+        self.reading = 0
+        self.transforming = 0
+        self.states.clear()
+        self.prepared.clear()
+        self.shutdown_pools(wait=False)
+
+    def shutdown_pools(self, wait: bool) -> None:
+        """ 關閉工作池 """
+        for pool in (self.read_pool, self.transform_pool, self.thread_pool, self.process_pool, self.verify_pool):
+            if pool is not None:
+                pool.shutdown(wait=wait, cancel_futures=True)
+        self.read_pool = None
+        self.transform_pool = None
+        self.thread_pool = None
+        self.process_pool = None
+        self.verify_pool = None
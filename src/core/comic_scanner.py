@@ -0,0 +1,187 @@
+from PySide6.QtCore import QThread, Signal
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+import os
+import time
+# 自訂庫
+from src.function.comicinfo_process import parse_comicinfo
+from src.function.scan_walker import (
+    FILE_ARCHIVE, FILE_COMICINFO, FILE_OTHER,
+    FileClassifier, compile_ignore_patterns, walk_comic_tree,
+)
+from src.classes.metadata_index import MetadataIndex
+from src.classes.metadata_record import MetadataRecord
+
+class ComicScanner(QThread):
+    """
+    漫畫資料夾掃描執行緒
+    於背景走訪資料夾，分批回報掃描結果與進度；可透過 requestInterruption() 取消
+    """
+    # 掃描結果分批發佈條件（滿足其一即發佈）
+    BATCH_SIZE = 200
+    BATCH_INTERVAL = 0.1 # 秒
+
+    # 跨執行緒傳遞時 dict 會被轉為 QVariantMap（鍵排序、不接受 None 鍵），故以 object 原樣傳遞
+    batchReady = Signal(int, object, object) # (掃描代號, 相對路徑列表, metadata)
+    progress = Signal(int, object) # (掃描代號, 進度)
+    scanDone = Signal(int, object) # (掃描代號, 走訪過的資料夾；取消或發生錯誤時為 None)
+
+    def __init__(
+        self,
+        generation: int,
+        source_dir: str,
+        image_exts: tuple[str, ...],
+        allow_files: tuple[str, ...],
+        ignore_patterns: tuple[str, ...],
+        scan_workers: int,
+        metadata_index: MetadataIndex,
+        read_archive: Callable[[str], MetadataRecord],
+    ):
+        super().__init__()
+        self.generation = generation
+        self.source_dir = source_dir
+        self.classifier = FileClassifier(image_exts, allow_files)
+        self.is_ignored = compile_ignore_patterns(ignore_patterns)
+        self.scan_workers = scan_workers
+        self.metadata_index = metadata_index
+        self.read_archive = read_archive
+
+    def run(self) -> None:
+        """ 執行掃描（無論完成、取消或發生錯誤都會發送 scanDone） """
+        visited_dirs = None
+        try:
+            visited_dirs = self.scan()
+        except Exception as e:
+            print(f"❌ 掃描錯誤：{e}")
+        finally:
+            self.scanDone.emit(self.generation, visited_dirs)
+
+    def scan(self) -> list[str] | None:
+        """ 走訪並讀取漫畫資料夾，回傳走訪過的資料夾（取消時回傳 None） """
+        source_dir = self.source_dir
+        file_list = []
+        file_metadata_cache = {}
+        archive_futures = {}
+        index_updates = {}
+        published = 0 # 已發佈至列表的項目數
+        last_publish = time.monotonic()
+        stats = {"dirs": 0, "archives": 0, "archive_size": 0} # archive_size 為壓縮檔大小總和（含索引命中，非實際讀取量）
+        visited_dirs = []
+
+        # 載入索引，僅重新讀取大小或修改時間有變動的壓縮檔
+        index_entries = self.metadata_index.load(source_dir)
+        index_seen = set()
+        index_invalid = 0 # 無法還原的索引項目數
+
+        def publish(wait: bool = False) -> None:
+            """ 依 file_list 順序發佈已讀取完成的項目 """
+            nonlocal published, last_publish
+            now = time.monotonic()
+            if (
+                not wait and published > 0
+                and len(file_list) - published < self.BATCH_SIZE
+                and now - last_publish < self.BATCH_INTERVAL
+            ):
+                return
+            batch_end = published
+            while batch_end < len(file_list):
+                future = archive_futures.get(file_list[batch_end])
+                if future is not None:
+                    if not wait and not future.done():
+                        break
+                    file_metadata_cache[file_list[batch_end]] = future.result()
+                    stats["archives"] += 1
+                batch_end += 1
+                if wait and batch_end - published >= self.BATCH_SIZE:
+                    break
+            last_publish = now
+            self.progress.emit(self.generation, stats.copy())
+            if batch_end == published:
+                return
+            self.batchReady.emit(
+                self.generation,
+                file_list[published:batch_end],
+                {rel_path: file_metadata_cache[rel_path] for rel_path in file_list[published:batch_end]},
+            )
+            published = batch_end
+
+        # 壓縮檔讀取交給執行緒池（zip 目錄讀取與 lxml 解析大多不佔 GIL）
+        executor = ThreadPoolExecutor(max_workers=self.scan_workers)
+        try:
+            for rel_root, has_subdirs, files in walk_comic_tree(source_dir, self.classifier, self.is_ignored):
+                if self.isInterruptionRequested():
+                    return None
+                stats["dirs"] += 1
+                visited_dirs.append(rel_root)
+                # 若包含任何子資料夾，就不是漫畫資料夾
+                is_comic_folder = not has_subdirs
+                independent_comic_info_path = ""
+
+                # 處理檔案
+                for entry, kind in files:
+                    # 壓縮檔
+                    if kind == FILE_ARCHIVE:
+                        rel_path = os.path.join(rel_root, entry.name) if rel_root != "." else entry.name
+                        file_list.append(rel_path)
+                        index_key = MetadataIndex.norm_rel_path(rel_path)
+                        index_seen.add(index_key)
+                        try:
+                            stat = entry.stat()
+                            stat_key = (stat.st_size, stat.st_mtime_ns)
+                            stats["archive_size"] += stat.st_size
+                        except OSError:
+                            stat_key = None
+                        cached = index_entries.get(index_key)
+                        metadata = None
+                        if stat_key and cached and cached[:2] == stat_key:
+                            metadata = MetadataIndex.unpack(cached[2])
+                            if metadata is None:
+                                index_invalid += 1
+                        if metadata is not None:
+                            file_metadata_cache[rel_path] = metadata # 索引命中
+                            stats["archives"] += 1
+                        else: # 未命中或索引資料損毀，重新讀取
+                            archive_futures[rel_path] = executor.submit(self.read_archive, entry.path) # 載入 metadata 快取
+                            if stat_key:
+                                index_updates[rel_path] = stat_key
+                        is_comic_folder = False
+                        publish()
+                    elif kind == FILE_COMICINFO:
+                        independent_comic_info_path = entry.path
+                    elif kind == FILE_OTHER:
+                        is_comic_folder = False
+
+                # 漫畫資料夾處理
+                if is_comic_folder:
+                    file_list.append(rel_root)
+                    file_metadata_cache[rel_root] = self.read_sidecar(independent_comic_info_path)
+                publish()
+
+            # 等待剩餘項目（依 file_list 順序，與完成順序無關）
+            while published < len(file_list):
+                if self.isInterruptionRequested():
+                    return None
+                publish(wait=True)
+        finally:
+            executor.shutdown(wait=not self.isInterruptionRequested(), cancel_futures=True)
+
+        if index_invalid:
+            print(f"⚠️ {index_invalid} 個索引項目無法還原，已重新讀取")
+        # 更新索引
+        self.metadata_index.store(
+            source_dir,
+            {rel_path: (*stat_key, file_metadata_cache[rel_path]) for rel_path, stat_key in index_updates.items()},
+            set(index_entries) - index_seen,
+        )
+        return visited_dirs
+
+    @staticmethod
+    def read_sidecar(comic_info_path: str) -> MetadataRecord:
+        """ 讀取漫畫資料夾內的 ComicInfo.xml（無法讀取時視為沒有 ComicInfo，與壓縮檔相同） """
+        if not comic_info_path:
+            return MetadataRecord.EMPTY
+        try:
+            with open(comic_info_path, "rb") as f:
+                return MetadataRecord.from_dict(parse_comicinfo(f.read()))
+        except Exception:
+            return MetadataRecord.EMPTY
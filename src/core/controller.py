@@ -2,6 +2,7 @@ from PySide6.QtCore import QObject, Signal
 from typing import Any, Dict, Optional, Set, Callable
 from natsort import natsorted
 from pathlib import Path
+import os
 # 自訂庫
 from src.signal_bus import SIGNAL_BUS
 from src.global_data_store import GLOBAL_DATA_STORE
@@ -21,7 +22,32 @@ class BackendCore(QObject):
             "file_list": [],
             "file_metadata_cache": {},
             "write_mode": 0,
+            "folder_write_mode": 0,
+            "compression_profile": 0,
+            "compression_level": 6,
+            "stored_exts": [
+                ".jpg",
+                ".jpeg",
+                ".png",
+                ".webp",
+                ".gif",
+                ".avif",
+                ".jxl",
+            ],
+            "compact_threshold": 10,
+            "skip_unchanged": True,
+            "patch_comicinfo": False,
+            "verify_mode": 0,
+            "copy_buffer_kb": 1024,
+            "job_memory_limit_mb": 256,
             "font_size": 10,
+            "scan_workers": min(32, (os.cpu_count() or 1) + 4),
+            "watch_mode": 0,
+            "batch_workers": os.cpu_count() or 1,
+            "hdd_workers": 1,
+            "network_workers": 2,
+            "read_queue_depth": 4,
+            "write_queue_depth": 8,
             "image_exts": [
                 ".jpg",
                 ".jpeg",
@@ -33,6 +59,12 @@ class BackendCore(QObject):
             "allow_files": [
                 ".nomedia",
             ],
+            "ignore_patterns": [
+                "@eaDir",
+                "#recycle",
+                ".thumbnails",
+            ],
+            "filename_pattern": "",
             "langFileData": langFileData,
             "selectedLang": "zh_TW" if ("zh_TW" in langFileData.keys()) else langFileData.keys()[0],
         })
@@ -69,6 +101,57 @@ class BackendCore(QObject):
         # 寫入模式改變
         if "write_mode" in keys:
             SIGNAL_BUS.appSetting.writeModeChanged.emit(GLOBAL_DATA_STORE.get("write_mode"))
+        # 略過未變更檔案改變
+        if "skip_unchanged" in keys:
+            SIGNAL_BUS.appSetting.skipUnchangedChanged.emit(GLOBAL_DATA_STORE.get("skip_unchanged"))
+        # 保留 ComicInfo 原始格式改變
+        if "patch_comicinfo" in keys:
+            SIGNAL_BUS.appSetting.patchComicinfoChanged.emit(GLOBAL_DATA_STORE.get("patch_comicinfo"))
+        # 輸出驗證改變
+        if "verify_mode" in keys:
+            SIGNAL_BUS.appSetting.verifyModeChanged.emit(GLOBAL_DATA_STORE.get("verify_mode"))
+        # 資料夾寫入模式改變
+        if "folder_write_mode" in keys:
+            SIGNAL_BUS.appSetting.folderWriteModeChanged.emit(GLOBAL_DATA_STORE.get("folder_write_mode"))
+        # 壓縮設定改變
+        if "compression_profile" in keys:
+            SIGNAL_BUS.appSetting.compressionProfileChanged.emit(GLOBAL_DATA_STORE.get("compression_profile"))
+        # 壓縮等級改變
+        if "compression_level" in keys:
+            SIGNAL_BUS.appSetting.compressionLevelChanged.emit(GLOBAL_DATA_STORE.get("compression_level"))
+        # 不壓縮副檔名改變
+        if "stored_exts" in keys:
+            SIGNAL_BUS.appSetting.storedExtsChanged.emit(GLOBAL_DATA_STORE.get("stored_exts").copy())
+        # 整理門檻改變
+        if "compact_threshold" in keys:
+            SIGNAL_BUS.appSetting.compactThresholdChanged.emit(GLOBAL_DATA_STORE.get("compact_threshold"))
+        # 複製緩衝大小改變
+        if "copy_buffer_kb" in keys:
+            SIGNAL_BUS.appSetting.copyBufferSizeChanged.emit(GLOBAL_DATA_STORE.get("copy_buffer_kb"))
+        # 單一工作記憶體上限改變
+        if "job_memory_limit_mb" in keys:
+            SIGNAL_BUS.appSetting.jobMemoryLimitChanged.emit(GLOBAL_DATA_STORE.get("job_memory_limit_mb"))
+        # 讀取執行緒數改變
+        if "scan_workers" in keys:
+            SIGNAL_BUS.appSetting.scanWorkersChanged.emit(GLOBAL_DATA_STORE.get("scan_workers"))
+        # 批次處理執行緒數改變
+        if "batch_workers" in keys:
+            SIGNAL_BUS.appSetting.batchWorkersChanged.emit(GLOBAL_DATA_STORE.get("batch_workers"))
+        # 傳統硬碟並行數改變
+        if "hdd_workers" in keys:
+            SIGNAL_BUS.appSetting.hddWorkersChanged.emit(GLOBAL_DATA_STORE.get("hdd_workers"))
+        # 網路磁碟並行數改變
+        if "network_workers" in keys:
+            SIGNAL_BUS.appSetting.networkWorkersChanged.emit(GLOBAL_DATA_STORE.get("network_workers"))
+        # 預讀深度改變
+        if "read_queue_depth" in keys:
+            SIGNAL_BUS.appSetting.readQueueDepthChanged.emit(GLOBAL_DATA_STORE.get("read_queue_depth"))
+        # 寫入佇列深度改變
+        if "write_queue_depth" in keys:
+            SIGNAL_BUS.appSetting.writeQueueDepthChanged.emit(GLOBAL_DATA_STORE.get("write_queue_depth"))
+        # 監看模式改變
+        if "watch_mode" in keys:
+            SIGNAL_BUS.appSetting.watchModeChanged.emit(GLOBAL_DATA_STORE.get("watch_mode"))
         # 漫畫資料夾變更
         if "source_dir" in keys:
             SIGNAL_BUS.dataChange.sourceDirChanged.emit(GLOBAL_DATA_STORE.get("source_dir"))
@@ -90,6 +173,12 @@ class BackendCore(QObject):
         # 允許檔案變更
         if "allow_files" in keys:
             SIGNAL_BUS.appSetting.allowFilesChanged.emit(GLOBAL_DATA_STORE.get("allow_files").copy())
+        # 忽略項目變更
+        if "ignore_patterns" in keys:
+            SIGNAL_BUS.appSetting.ignorePatternsChanged.emit(GLOBAL_DATA_STORE.get("ignore_patterns").copy())
+        # 檔名規則變更
+        if "filename_pattern" in keys:
+            SIGNAL_BUS.appSetting.filenamePatternChanged.emit(GLOBAL_DATA_STORE.get("filename_pattern"))
         # 語言變更
         if "selectedLang" in keys:
             SIGNAL_BUS.appSetting.langChanged.emit(GLOBAL_DATA_STORE.get("selectedLang")) # 傳遞檔案絕對路徑
@@ -1,28 +1,68 @@
-from PySide6.QtCore import QObject, Signal, QEventLoop
-from PySide6.QtWidgets import (
-    QMessageBox, QApplication
-)
+from PySide6.QtCore import QObject, Signal
+from concurrent.futures import Future, ThreadPoolExecutor
 import os
-import zipfile
-from typing import Any
 # 自訂庫
 from src.global_data_store import GLOBAL_DATA_STORE
 from src.signal_bus import SIGNAL_BUS
 from src.function.comicinfo_process import update_comicinfo_data
+from src.function.archive_writer import (
+    COMPRESS_WORKERS, WRITE_APPEND, WRITE_FLATTEN, WRITE_FOLDER_TO_ZIP, WRITE_IN_PLACE, WRITE_SIDECAR,
+    sidecar_path,
+)
+from src.classes.write_job import VerifyResult, WriteJob, WriteResult
+from src.classes.output_manifest import OutputManifest
+from src.classes.batch_journal import BatchJournal
+from src.classes.throughput_history import ThroughputHistory
+from src.classes.metadata_template import MetadataTemplate
+from src.function.batch_planner import plan_jobs
+from src.function.archive_verifier import write_checksum_manifest
+from src.core.batch_runner import BatchRunner
 ## 翻譯
 from src.translations import TR
 
 class DataProcess(QObject):
+    # 預估執行緒 → 主執行緒
+    _planReady = Signal(object)
+
     def __init__(self):
         super().__init__()
+        self.dry_run = False
         # 訊號綁定
         SIGNAL_BUS.startProcess.connect(
-            lambda: SIGNAL_BUS.requireInfoEditorInput.emit() # 啟動第一步 - 取得編輯器輸入值
+            lambda: self.request_process(dry_run=False) # 啟動第一步 - 取得編輯器輸入值
+        )
+        SIGNAL_BUS.startDryRun.connect(
+            lambda: self.request_process(dry_run=True)
         )
         # 編輯器輸入值回傳
         SIGNAL_BUS.returnInfoEditorInput.connect(self.get_info_editor_input)
         # 選中漫畫回傳
         SIGNAL_BUS.returnSelectedComic.connect(self.get_selected_comic)
+        # 批次執行器
+        self.batch_runner = BatchRunner()
+        self.output_manifest = OutputManifest()
+        SIGNAL_BUS.batch.jobFinished.connect(self.on_batch_job_finished)
+        SIGNAL_BUS.batch.finished.connect(self.on_batch_finished)
+        # 輸出驗證
+        self.checksums = {}
+        SIGNAL_BUS.batch.jobVerified.connect(self.on_batch_job_verified)
+        # 批次日誌（中斷後接續）
+        self.batch_journal = BatchJournal()
+        self.interrupted_jobs: list[WriteJob] = []
+        SIGNAL_BUS.batch.jobStarted.connect(lambda job: self.batch_journal.mark_start(job.rel_path))
+        SIGNAL_BUS.appStarted.connect(self.check_interrupted_batch)
+        SIGNAL_BUS.resumeBatch.connect(self.resume_batch)
+        SIGNAL_BUS.aboutToQuit.connect(self.batch_journal.close)
+        # 預估（不寫入檔案）
+        self.throughput_history = ThroughputHistory()
+        self.planner_pool: ThreadPoolExecutor | None = None
+        self._planReady.connect(self.on_plan_ready)
+        SIGNAL_BUS.aboutToQuit.connect(self.shutdown_planner)
+
+    def request_process(self, dry_run: bool) -> None:
+        """ 開始處理或預估，先取得編輯器輸入值 """
+        self.dry_run = dry_run
+        SIGNAL_BUS.requireInfoEditorInput.emit()
 
     def get_info_editor_input(self, data) -> None:
         """ 取得編輯器資料 """
@@ -34,32 +74,65 @@ class DataProcess(QObject):
         """ 取得選中漫畫 """
         self.selected_comic = data
         # 下一步 - 啟動執行
-        self.start_process()
-        
-    def start_process(self) -> None:
-        # 開始處理
-        ## 確保可以執行
+        if self.dry_run:
+            self.start_dry_run()
+        else:
+            self.start_process()
+
+    def check_ready(self) -> bool:
+        """ 確保可以執行 """
         if not GLOBAL_DATA_STORE.get("output_dir"):
             SIGNAL_BUS.ui.sendCritical.emit(TR.SEND_MESSAGE["錯誤"](), TR.SEND_MESSAGE["請選擇輸出資料夾"]())
-            return
+            return False
         if not GLOBAL_DATA_STORE.get("source_dir"):
             SIGNAL_BUS.ui.sendCritical.emit(TR.SEND_MESSAGE["錯誤"](), TR.SEND_MESSAGE["請選擇漫畫資料夾"]())
-            return
+            return False
         if not self.selected_comic:
             SIGNAL_BUS.ui.sendInformation.emit(TR.SEND_MESSAGE["提示"](), TR.SEND_MESSAGE["請至少選擇一個檔案進行處理"]())
+            return False
+        return True
+
+    def start_process(self) -> None:
+        # 開始處理
+        ## 確保可以執行
+        if not self.check_ready():
+            return
+        if self.batch_runner.is_running():
+            SIGNAL_BUS.ui.sendInformation.emit(TR.SEND_MESSAGE["提示"](), TR.SEND_MESSAGE["批次處理進行中"]())
             return
         ## 初始化進度條
         SIGNAL_BUS.ui.setProgressBar.emit(0, len(self.selected_comic))
-        ## 處理漫畫
-        progress_rate = 0
+        ## 建立工作清單，記錄日誌後交給批次執行器
+        jobs = self.build_jobs()
+        self.batch_journal.begin(jobs)
+        self.batch_runner.start(jobs)
+
+    def build_jobs(self) -> list[WriteJob]:
+        """ 依選中漫畫建立寫入工作 """
+        source_dir = GLOBAL_DATA_STORE.get("source_dir")
+        output_dir = GLOBAL_DATA_STORE.get("output_dir")
+        output_ext = GLOBAL_DATA_STORE.get("output_ext")
+        write_mode = GLOBAL_DATA_STORE.get("write_mode")
+        folder_write_mode = GLOBAL_DATA_STORE.get("folder_write_mode", 0)
+        file_metadata_cache = GLOBAL_DATA_STORE.get("file_metadata_cache", {})
+        skip_unchanged = GLOBAL_DATA_STORE.get("skip_unchanged", True)
+        patch_comicinfo = GLOBAL_DATA_STORE.get("patch_comicinfo", False)
+        # 資料夾打包壓縮（0 不壓縮、1 全部壓縮、2 依副檔名壓縮）
+        compression_profile = GLOBAL_DATA_STORE.get("compression_profile", 0)
+        compress_level = GLOBAL_DATA_STORE.get("compression_level", 6) if compression_profile else 0
+        stored_exts = tuple(GLOBAL_DATA_STORE.get("stored_exts", [])) if compression_profile == 2 else ()
+        # 同時執行的工作分攤壓縮執行緒，總數不超過 CPU 核心數
+        compress_workers = max(1, COMPRESS_WORKERS // max(1, int(GLOBAL_DATA_STORE.get("batch_workers", 1))))
+        # 編輯器輸入每批次只編譯一次
+        template = MetadataTemplate(self.info_editor_input, GLOBAL_DATA_STORE.get("filename_pattern", ""))
+        jobs = []
         for rel_path, idx in self.selected_comic.items():
-            src_path = os.path.join(GLOBAL_DATA_STORE.get("source_dir"), rel_path)
-            out_rel_path = os.path.splitext(rel_path)[0] + f".{GLOBAL_DATA_STORE.get('output_ext')}"
-            dst_path = os.path.join(GLOBAL_DATA_STORE.get("output_dir"), out_rel_path)
-            os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+            src_path = os.path.join(source_dir, rel_path)
+            out_rel_path = os.path.splitext(rel_path)[0] + f".{output_ext}"
+            dst_path = os.path.join(output_dir, out_rel_path)
 
             # 讀取原始 comicInfo（如果存在）
-            orig_comic_info = GLOBAL_DATA_STORE.get("file_metadata_cache", {}).get(rel_path, {})
+            orig_comic_info = file_metadata_cache.get(rel_path, {})
 
             # 修改 comicInfo
             file_name: str = os.path.basename(rel_path).split(".")[0]
@@ -67,27 +140,156 @@ class DataProcess(QObject):
                 "fileName": file_name,
                 "index": idx + 1,
                 "fileNameClear": file_name.replace("🔒", "").strip()
-            }, orig_comic_info, self.info_editor_input)
+            }, orig_comic_info, template)
 
-            # 寫入 comicInfo
+            # 寫入方式
             if os.path.isdir(src_path):
                 # 資料夾
-                SIGNAL_BUS.writeFile.writeFolderToZip.emit(src_path, dst_path, updated_meta)
-            else:
-                # 檔案
-                write_mode = GLOBAL_DATA_STORE.get("write_mode")
-                if write_mode == 1: # 鋪平寫入
-                    SIGNAL_BUS.writeFile.flatten.emit(src_path, dst_path, updated_meta)
-                else: # 原位置寫入
-                    SIGNAL_BUS.writeFile.inPlace.emit(src_path, dst_path, updated_meta)
-
-            # 更新進度條
-            progress_rate += 1
-            SIGNAL_BUS.ui.setProgressBar.emit(progress_rate, len(self.selected_comic))
-            # 強制刷新
-            QApplication.processEvents()
-
-        SIGNAL_BUS.ui.sendInformation.emit(TR.SEND_MESSAGE["完成"](), TR.SEND_MESSAGE["所有漫畫處理完成！"]())
-
-    
-    
\ No newline at end of file
+                if folder_write_mode == 1: # 僅寫入資料夾內的 ComicInfo.xml
+                    kind = WRITE_SIDECAR
+                    dst_path = sidecar_path(src_path)
+                else:
+                    kind = WRITE_FOLDER_TO_ZIP
+            elif write_mode == 1: # 鋪平寫入
+                kind = WRITE_FLATTEN
+            elif write_mode == 2 and os.path.normcase(os.path.abspath(src_path)) == os.path.normcase(os.path.abspath(dst_path)): # 追加寫入（僅限覆寫原檔）
+                kind = WRITE_APPEND
+            else: # 原位置寫入
+                kind = WRITE_IN_PLACE
+
+            jobs.append(WriteJob(
+                rel_path, kind, src_path, dst_path, updated_meta,
+                buffer_size=self.batch_runner.copy_buffer_size,
+                compact_threshold=GLOBAL_DATA_STORE.get("compact_threshold", 0),
+                compress_level=compress_level,
+                stored_exts=stored_exts,
+                compress_workers=compress_workers,
+                memory_limit=self.batch_runner.job_memory_limit,
+                skip_unchanged=skip_unchanged,
+                patch_comicinfo=patch_comicinfo,
+                cpu_bound=kind == WRITE_FOLDER_TO_ZIP and compress_level > 0, # 資料夾打包時重新壓縮圖片
+            ))
+
+        # 附上次輸出紀錄
+        if skip_unchanged:
+            manifest = self.output_manifest.load([job.dst_path for job in jobs])
+            for job in jobs:
+                job.manifest = manifest.get(job.dst_path)
+        return jobs
+
+    def on_batch_job_finished(self, result: WriteResult) -> None:
+        """ 單一檔案寫入完成 """
+        self.batch_journal.mark_commit(result.rel_path, result.ok)
+        if not result.ok:
+            print(f"❌ {result.rel_path} 寫入錯誤：{result.error}")
+        elif result.src_signature and result.dst_signature:
+            # 與日誌同時逐一記錄，批次中斷後接續時也能略過已完成的檔案
+            self.output_manifest.store({result.dst_path: (*result.src_signature, *result.dst_signature, result.xml_hash, result.profile)})
+
+    def on_batch_job_verified(self, result: VerifyResult) -> None:
+        """ 單一輸出檔驗證完成 """
+        if result.ok:
+            if result.sha256: # 抽樣檢查不計算校驗碼
+                self.checksums[result.dst_path] = result.sha256
+        else:
+            print(f"❌ {result.rel_path} 驗證失敗：{result.error}")
+            self.output_manifest.remove([result.dst_path]) # 下次執行時重新寫入
+
+    def on_batch_finished(self, summary: dict) -> None:
+        """ 批次結束 """
+        self.batch_journal.finish()
+        self.throughput_history.record(summary.get("devices", []))
+        # 更新校驗碼清單
+        if self.checksums:
+            manifest_path = os.path.join(GLOBAL_DATA_STORE.get("output_dir"), "checksums.sha256")
+            try:
+                write_checksum_manifest(manifest_path, self.checksums)
+                print(f"ℹ️ 已驗證 {len(self.checksums)} 個輸出檔，校驗碼寫入 {manifest_path}")
+            except OSError as e:
+                print(f"❌ 校驗碼清單寫入錯誤：{e}")
+            self.checksums = {}
+        if summary["skipped"]:
+            print(f"ℹ️ 略過 {summary['skipped']} 個未變更的檔案")
+        if summary["failed"] or summary.get("verify_failed"):
+            messages = []
+            if summary["failed"]:
+                messages.append(TR.SEND_MESSAGE["處理完成，{failed} / {total} 個檔案失敗"]().format(**summary))
+            if summary.get("verify_failed"):
+                messages.append(TR.SEND_MESSAGE["{verify_failed} 個輸出檔驗證失敗"]().format(**summary))
+            SIGNAL_BUS.ui.sendCritical.emit(TR.SEND_MESSAGE["完成"](), "\n".join(messages))
+        else:
+            SIGNAL_BUS.ui.sendInformation.emit(TR.SEND_MESSAGE["完成"](), TR.SEND_MESSAGE["所有漫畫處理完成！"]())
+
+    def check_interrupted_batch(self) -> None:
+        """ 啟動時檢查上次中斷的批次：清除暫存檔，並詢問是否接續 """
+        state = self.batch_journal.load()
+        if state is None:
+            return
+        jobs, committed = state
+        removed = BatchJournal.clean_temp_files([job for job in jobs if job.rel_path not in committed])
+        if removed:
+            print(f"ℹ️ 已清除 {removed} 個中斷時留下的暫存檔或未完成的追加寫入")
+        self.interrupted_jobs = [job for job in jobs if job.rel_path not in committed]
+        if not self.interrupted_jobs:
+            self.batch_journal.finish()
+            return
+        SIGNAL_BUS.ui.askResumeBatch.emit(len(jobs) - len(self.interrupted_jobs), len(jobs))
+
+    def resume_batch(self, accepted: bool) -> None:
+        """ 接續中斷的批次（已完成的檔案不再處理） """
+        jobs, self.interrupted_jobs = self.interrupted_jobs, []
+        if not accepted:
+            self.batch_journal.finish()
+            return
+        if self.batch_runner.is_running():
+            SIGNAL_BUS.ui.sendInformation.emit(TR.SEND_MESSAGE["提示"](), TR.SEND_MESSAGE["批次處理進行中"]())
+            return
+        # 完成標記可能尚未寫入磁碟，以輸出檢查避免重寫已完成的檔案
+        for job in jobs:
+            job.skip_unchanged = True
+        SIGNAL_BUS.ui.setProgressBar.emit(0, len(jobs))
+        self.batch_journal.begin(jobs)
+        self.batch_runner.start(jobs)
+
+    def plan(self) -> dict:
+        """ 預估目前選取的批次（同步執行、不寫入檔案，可於無介面環境使用；結果格式見 plan_jobs） """
+        return plan_jobs(self.build_jobs(), self.throughput_history.load())
+
+    def start_dry_run(self) -> None:
+        """ 於背景執行緒預估批次，完成後透過 SIGNAL_BUS.batch.planned 回報 """
+        if not self.check_ready():
+            return
+        jobs = self.build_jobs()
+        if self.planner_pool is None:
+            self.planner_pool = ThreadPoolExecutor(max_workers=1)
+        future = self.planner_pool.submit(plan_jobs, jobs, self.throughput_history.load())
+        future.add_done_callback(self.on_plan_future_done)
+
+    def on_plan_future_done(self, future: Future) -> None:
+        """ 預估完成（於預估執行緒呼叫，轉交主執行緒） """
+        if future.cancelled():
+            return
+        try:
+            self._planReady.emit(future.result())
+        except Exception as e:
+            print(f"❌ 預估錯誤：{e}")
+
+    def on_plan_ready(self, plan: dict) -> None:
+        """ 預估完成（主執行緒） """
+        estimate = "?" if plan["estimate"] is None else f"{plan['estimate']:.0f} s"
+        print(
+            f"ℹ️ 預估 {plan['total']} 個檔案 {plan['paths']}，讀取 {plan['bytes_read'] / (1024 * 1024):.1f} MB，"
+            f"寫入 {plan['bytes_written'] / (1024 * 1024):.1f} MB，約 {estimate}"
+        )
+        for device in plan["devices"]:
+            if device["required"] > device["free"]:
+                print(f"⚠️ {device['device']} 空間不足：需要 {device['required'] / (1024 * 1024):.1f} MB，剩餘 {device['free'] / (1024 * 1024):.1f} MB")
+        for rel_path, error in plan["errors"]:
+            print(f"❌ {rel_path} 預估錯誤：{error}")
+        SIGNAL_BUS.batch.planned.emit(plan)
+
+    def shutdown_planner(self) -> None:
+        """ 關閉預估執行緒 """
+        if self.planner_pool is not None:
+            self.planner_pool.shutdown(wait=False, cancel_futures=True)
+            self.planner_pool = None
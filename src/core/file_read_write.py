@@ -1,185 +1,208 @@
 from PySide6.QtCore import QObject, Signal
 import os
-import zipfile
 # 自訂庫
 from src.global_data_store import GLOBAL_DATA_STORE
 from src.signal_bus import SIGNAL_BUS
-from src.function.comicinfo_process import parse_comicinfo, generate_comicinfo
+from src.function.comicinfo_process import parse_comicinfo
+from src.function.zip_process import read_comicinfo_entry
+from src.function.archive_writer import ACTION_SKIPPED
+from src.classes.metadata_index import MetadataIndex
+from src.classes.metadata_record import MetadataRecord
+from src.classes.write_job import WriteResult
+from src.core.comic_scanner import ComicScanner
+from src.core.library_watcher import LibraryWatcher
 
 class FileReadWrite(QObject):
     def __init__(self):
         super().__init__()
+        # metadata 持久化索引
+        self.metadata_index = MetadataIndex()
+        # 掃描執行緒
+        self.scanners: set[ComicScanner] = set()
+        self.scan_generation = 0
+        self.scan_refresh = False
+        self.scan_running = False
+        self.refresh_file_list = []
+        self.refresh_metadata = {}
+        self.streamed = False # 掃描期間以原地追加更新列表，尚未發送整體變更訊號
+        # 資料夾監看
+        self.library_watcher = LibraryWatcher()
+        self.watched_dirs = []
+        self.library_watcher.refreshRequested.connect(self.refresh_comic_folder)
+        SIGNAL_BUS.appSetting.watchModeChanged.connect(self.on_watch_mode_changed)
         # 訊號綁定
         SIGNAL_BUS.dataChange.sourceDirChanged.connect(self.read_comic_folder)
-        ## 寫入檔案
-        ### 原位置寫入
-        SIGNAL_BUS.writeFile.inPlace.connect(self.write_comicinfo_in_place)
-        ### 鋪平寫入
-        SIGNAL_BUS.writeFile.flatten.connect(self.write_comicinfo_flatten)
-        ### 資料夾寫成壓縮檔
-        SIGNAL_BUS.writeFile.writeFolderToZip.connect(self.write_comic_folder_to_zip)
+        SIGNAL_BUS.aboutToQuit.connect(self.stop_scan)
+        ## 批次寫入完成
+        SIGNAL_BUS.batch.jobFinished.connect(self.on_batch_job_finished)
 
     def read_comic_folder(self, path: str) -> None:
-        """ 讀取漫畫資料夾 """
+        """ 讀取漫畫資料夾（於背景執行緒掃描，新的請求會取代尚未完成的掃描） """
         source_dir = GLOBAL_DATA_STORE.get("source_dir")
-        image_exts = tuple(x for x in GLOBAL_DATA_STORE.get("image_exts", []) if x)
-        allow_files = tuple(x for x in GLOBAL_DATA_STORE.get("allow_files", []) if x)
-        file_list = []
-        file_metadata_cache = {}
-        is_comic_folder = True
+
+        # 取消仍在執行的掃描
+        self.stop_scan(wait=False)
+        self.library_watcher.clear()
 
         if not os.path.isdir(source_dir):
+            self.scan_generation += 1
             return
-        
-        for root, dirs, files in os.walk(source_dir):
-            is_comic_folder = True
-            independent_comic_info_path = ""
-
-             # 若包含任何子資料夾，就不是漫畫資料夾
-            if dirs:
-                is_comic_folder = False
-
-            # 處理檔案
-            for f in files:
-                # 壓縮檔
-                if f.lower().endswith((".zip", ".cbz")):
-                    rel_path = os.path.relpath(os.path.join(root, f), source_dir)
-                    file_list.append(rel_path)
-                    full_path = os.path.join(source_dir, rel_path)
-                    file_metadata_cache[rel_path] = self.read_comicinfo_xml(full_path) # 載入 metadata 快取
-                    is_comic_folder = False
-                elif f.lower().endswith(image_exts):
-                    pass
-                elif f.lower() == "comicinfo.xml":
-                    rel_path = os.path.relpath(os.path.join(root, f), source_dir)
-                    independent_comic_info_path = os.path.join(source_dir, rel_path)
-                elif f in allow_files:
-                    pass
-                else:
-                    is_comic_folder = False
-
-            # 漫畫資料夾處理
-            if is_comic_folder:
-                rel_path = os.path.relpath(root, source_dir)
-                file_list.append(rel_path)
-                if independent_comic_info_path != "":
-                    with open(independent_comic_info_path, "rb") as f:
-                        parsed = parse_comicinfo(f.read())
-                else:
-                    parsed = {}
-                file_metadata_cache[rel_path] = parsed
-
 
+        # 清空列表
         GLOBAL_DATA_STORE.update({
-            "file_list": file_list,
-            "file_metadata_cache": file_metadata_cache 
+            "file_list": [],
+            "file_metadata_cache": {},
         })
 
-        SIGNAL_BUS.fileReadReady.emit()
-
-    def read_comicinfo_xml(self, zip_path):
-        """ 讀取 ComicInfo.xml """
-        try:
-            with zipfile.ZipFile(zip_path, 'r') as zf:
-                comicinfo_path = next(
-                    (name for name in zf.namelist() if name.lower().endswith("comicinfo.xml")),
-                    None
-                )
-
-                if not comicinfo_path:
-                    return {}
-
-                with zf.open(comicinfo_path) as f:
-                    parsed = parse_comicinfo(f.read())
-                    parsed["_original_path"] = comicinfo_path  # <--- 記錄原始 ComicInfo.xml 的路徑
-                    return parsed
-
-        except Exception as e:
-            return {}
-        
-    def write_comicinfo_in_place(self, old_zip_path, new_zip_path, data: dict):
-        """ 在原位置寫入 ComicInfo.xml """
-        temp_zip_path = new_zip_path + ".tmp"
-
-        try:
-            with zipfile.ZipFile(old_zip_path, 'r') as zin, zipfile.ZipFile(temp_zip_path, 'w', zipfile.ZIP_STORED) as zout:
-                original_path = data.get("_original_path", "ComicInfo.xml")
-                comicinfo_written = False
-
-                for item in zin.infolist():
-                    if item.filename.lower().endswith("comicinfo.xml"):
-                        if not comicinfo_written:
-                            zout.writestr(original_path, generate_comicinfo(data))
-                            comicinfo_written = True
-                        # skip all ComicInfo.xml
-                        continue
-
-                    with zin.open(item) as f:
-                        zout.writestr(item.filename, f.read())
+        self.start_scanner(refresh=False)
 
-                # 沒找到原來位置 → 新增 ComicInfo.xml 在根目錄
-                if not comicinfo_written:
-                    zout.writestr("ComicInfo.xml", generate_comicinfo(data))
+    def refresh_comic_folder(self) -> None:
+        """ 增量刷新漫畫資料夾（監看觸發；只有大小或修改時間變動的壓縮檔會被重新讀取） """
+        if self.scan_running or not os.path.isdir(GLOBAL_DATA_STORE.get("source_dir")):
+            return
+        self.refresh_file_list = []
+        self.refresh_metadata = {}
+        self.start_scanner(refresh=True)
+
+    def start_scanner(self, refresh: bool) -> None:
+        """ 啟動掃描執行緒 """
+        self.scan_generation += 1
+        self.scan_refresh = refresh
+        self.scan_running = True
+        scanner = ComicScanner(
+            self.scan_generation,
+            GLOBAL_DATA_STORE.get("source_dir"),
+            tuple(x for x in GLOBAL_DATA_STORE.get("image_exts", []) if x),
+            tuple(x for x in GLOBAL_DATA_STORE.get("allow_files", []) if x),
+            tuple(x for x in GLOBAL_DATA_STORE.get("ignore_patterns", []) if x),
+            max(1, int(GLOBAL_DATA_STORE.get("scan_workers", 1))),
+            self.metadata_index,
+            self.read_comicinfo_xml,
+        )
+        scanner.batchReady.connect(self.on_scan_batch)
+        scanner.progress.connect(self.on_scan_progress)
+        scanner.scanDone.connect(self.on_scan_done)
+        scanner.finished.connect(self.on_scanner_finished)
+        self.scanners.add(scanner) # 保留參考直到執行緒結束
+        scanner.start()
+
+    def stop_scan(self, wait: bool = True) -> None:
+        """ 取消掃描 """
+        self.scan_running = False
+        for scanner in list(self.scanners):
+            scanner.requestInterruption()
+            if wait:
+                scanner.wait()
+
+    def on_scan_batch(self, generation: int, rel_paths: list, metadata: dict) -> None:
+        """ 掃描結果批次回傳 """
+        if generation != self.scan_generation:
+            return # 已被取代的掃描
+        if self.scan_refresh:
+            # 刷新時先累積，完成後一次套用
+            self.refresh_file_list.extend(rel_paths)
+            self.refresh_metadata.update(metadata)
+            return
+        self.append_scan_batch(rel_paths, metadata)
 
-            os.replace(temp_zip_path, new_zip_path)
+    def on_scan_progress(self, generation: int, stats: dict) -> None:
+        """ 掃描進度回傳 """
+        if generation != self.scan_generation or self.scan_refresh:
+            return
+        SIGNAL_BUS.scanProgress.emit(stats)
 
-        except Exception as e:
-            print(f"❌ ComicInfo 寫入錯誤：{e}")
-            if os.path.exists(temp_zip_path):
-                os.remove(temp_zip_path)
+    def on_scan_done(self, generation: int, visited_dirs: list | None) -> None:
+        """ 掃描完成（visited_dirs 為 None 表示掃描未完成，刷新結果不套用，監看維持原本的資料夾） """
+        if generation != self.scan_generation:
+            return
+        self.scan_running = False
+        if visited_dirs is not None:
+            self.watched_dirs = visited_dirs
+        if self.scan_refresh:
+            if visited_dirs is not None:
+                self.apply_refresh(self.refresh_file_list, self.refresh_metadata)
+            self.refresh_file_list = []
+            self.refresh_metadata = {}
+        if self.streamed:
+            # 追加期間只發送插入列通知，完成時再發送一次整體變更
+            self.streamed = False
+            SIGNAL_BUS.dataChange.fileListChanged.emit(GLOBAL_DATA_STORE.get("file_list").copy())
+            SIGNAL_BUS.dataChange.fileMetadataCacheChanged.emit(GLOBAL_DATA_STORE.get("file_metadata_cache").copy())
+        if not self.scan_refresh:
+            SIGNAL_BUS.fileReadReady.emit()
+        # 開始（或更新）監看
+        self.library_watcher.watch(GLOBAL_DATA_STORE.get("watch_mode", 0), GLOBAL_DATA_STORE.get("source_dir"), self.watched_dirs)
+
+    def on_watch_mode_changed(self, mode: int) -> None:
+        """ 監看模式改變 """
+        if self.scan_running:
+            return # 掃描完成時會依新模式開始監看
+        self.library_watcher.watch(mode, GLOBAL_DATA_STORE.get("source_dir"), self.watched_dirs)
+
+    def apply_refresh(self, new_file_list: list[str], new_metadata: dict) -> None:
+        """ 將刷新結果與目前列表比對，新增、刪除與修改合併為一次更新（保留目前的排列順序） """
+        file_list = GLOBAL_DATA_STORE.get("file_list")
+        file_metadata_cache = GLOBAL_DATA_STORE.get("file_metadata_cache")
+        new_set = set(new_file_list)
+        kept = [rel_path for rel_path in file_list if rel_path in new_set]
+        kept_set = set(kept)
+        added = [rel_path for rel_path in new_file_list if rel_path not in kept_set]
+        modified = {
+            rel_path: new_metadata[rel_path] for rel_path in kept
+            if file_metadata_cache.get(rel_path) != new_metadata[rel_path]
+        }
+
+        if len(kept) == len(file_list):
+            if added:
+                # 僅新增：以插入列通知
+                self.append_scan_batch(added, {**modified, **{rel_path: new_metadata[rel_path] for rel_path in added}})
+            elif modified:
+                GLOBAL_DATA_STORE.update({
+                    "file_metadata_cache": {**file_metadata_cache, **modified},
+                })
+            return
 
-    def write_comicinfo_flatten(self, old_zip_path, new_zip_path, data: dict):
-        """ 鋪平化寫入 ComicInfo.xml """
-        temp_zip_path = new_zip_path + ".tmp"
-        seen = set()
+        # 有刪除：整體更新
+        new_list = kept + added
+        GLOBAL_DATA_STORE.update({
+            "file_list": new_list,
+            "file_metadata_cache": {rel_path: new_metadata[rel_path] for rel_path in new_list},
+        })
 
+    def on_scanner_finished(self) -> None:
+        """ 掃描執行緒結束，釋放參考 """
+        for scanner in [s for s in self.scanners if s.isFinished()]:
+            self.scanners.discard(scanner)
+            scanner.deleteLater()
+
+    def append_scan_batch(self, rel_paths: list[str], metadata: dict) -> None:
+        """
+        追加一批掃描結果至漫畫列表（以插入列通知 Model）
+        原地追加，不經 GLOBAL_DATA_STORE.update（每批都複製並發送整個列表與快取會使掃描成本隨列表長度平方成長）
+        整體變更訊號於掃描完成時發送一次
+        """
+        SIGNAL_BUS.dataChange.fileListAboutToAppend.emit(len(rel_paths))
+        GLOBAL_DATA_STORE.get("file_list").extend(rel_paths)
+        GLOBAL_DATA_STORE.get("file_metadata_cache").update(metadata)
+        self.streamed = True
+        SIGNAL_BUS.dataChange.fileListAppended.emit(len(rel_paths))
+
+    def read_comicinfo_xml(self, zip_path) -> MetadataRecord:
+        """ 讀取 ComicInfo.xml（以精簡紀錄保存於快取） """
         try:
-            with zipfile.ZipFile(old_zip_path, 'r') as zin, zipfile.ZipFile(temp_zip_path, 'w', zipfile.ZIP_STORED) as zout:
-                for item in zin.infolist():
-                    filename = os.path.basename(item.filename)
-
-                    if filename.lower() == "comicinfo.xml":
-                        continue  # 全部捨棄 ComicInfo.xml，待會重寫
-
-                    if filename in seen:
-                        continue  # 同名檔案 → 跳過
-                    seen.add(filename)
-
-                    with zin.open(item) as f:
-                        zout.writestr(filename, f.read())
-
-                zout.writestr("ComicInfo.xml", generate_comicinfo(data))
+            entry = read_comicinfo_entry(zip_path)
+            if entry is None:
+                return MetadataRecord.EMPTY
 
-            os.replace(temp_zip_path, new_zip_path)
+            comicinfo_path, xml_content = entry
+            parsed = parse_comicinfo(xml_content)
+            parsed["_original_path"] = comicinfo_path  # <--- 記錄原始 ComicInfo.xml 的路徑
+            return MetadataRecord.from_dict(parsed)
 
         except Exception as e:
-            print(f"❌ ComicInfo 寫入錯誤：{e}")
-            if os.path.exists(temp_zip_path):
-                os.remove(temp_zip_path)
+            return MetadataRecord.EMPTY
 
-    def write_comic_folder_to_zip(self, folder_path: str, output_path: str, data: dict):
-        """ 將資料夾打包成壓縮檔並加入 ComicInfo.xml """
-        temp_zip_path = output_path + ".tmp"
-
-        try:
-            with zipfile.ZipFile(temp_zip_path, 'w', zipfile.ZIP_STORED) as zout:
-                # 先寫入 ComicInfo.xml
-                zout.writestr("ComicInfo.xml", generate_comicinfo(data))
-
-                # 走訪整個資料夾結構
-                for root, _, files in os.walk(folder_path):
-                    for file in files:
-                        if file.lower() == "comicinfo.xml":
-                            continue  # 跳過原本的 ComicInfo.xml
-
-                        full_path = os.path.join(root, file)
-                        rel_path = os.path.relpath(full_path, folder_path)
-
-                        zout.write(full_path, arcname=rel_path)
-
-            os.replace(temp_zip_path, output_path)
-
-        except Exception as e:
-            print(f"❌ 資料夾壓縮失敗：{e}")
-            if os.path.exists(temp_zip_path):
-                os.remove(temp_zip_path)
+    def on_batch_job_finished(self, result: WriteResult) -> None:
+        """ 批次寫入完成的檔案，使其索引失效 """
+        if result.ok and result.action != ACTION_SKIPPED:
+            self.metadata_index.invalidate(GLOBAL_DATA_STORE.get("source_dir"), result.dst_path)
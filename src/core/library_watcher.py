@@ -0,0 +1,74 @@
+from PySide6.QtCore import QObject, QDir, QFileSystemWatcher, QTimer, Signal
+import os
+
+# 監看模式
+WATCH_OFF = 0
+WATCH_NOTIFY = 1 # 檔案系統通知 ( inotify 等 )，無法監看全部資料夾時改用輪詢
+WATCH_POLLING = 2
+
+class LibraryWatcher(QObject):
+    """
+    漫畫資料夾監看
+    資料夾變動經防抖合併後發出 refreshRequested，一次突發的大量變動只觸發一次刷新
+    """
+    DEBOUNCE_MS = 1000
+    POLL_INTERVAL_MS = 30000
+    SAFETY_POLL_INTERVAL_MS = 300000
+
+    refreshRequested = Signal()
+
+    def __init__(self):
+        super().__init__()
+        self.mode = WATCH_OFF
+        self.fs_watcher: QFileSystemWatcher | None = None
+        # 防抖計時器
+        self.debounce_timer = QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(self.DEBOUNCE_MS)
+        self.debounce_timer.timeout.connect(self.refreshRequested)
+        # 輪詢計時器
+        self.poll_timer = QTimer(self)
+        self.poll_timer.timeout.connect(self.refreshRequested)
+
+    def clear(self) -> None:
+        """ 停止監看 """
+        self.mode = WATCH_OFF
+        self.debounce_timer.stop()
+        self.poll_timer.stop()
+        if self.fs_watcher is not None:
+            self.fs_watcher.directoryChanged.disconnect(self.on_directory_changed)
+            self.fs_watcher.deleteLater()
+            self.fs_watcher = None
+
+    def watch(self, mode: int, source_dir: str, rel_dirs: list[str]) -> None:
+        """ 依模式開始監看（掃描完成後呼叫，rel_dirs 為掃描走訪過的資料夾） """
+        if mode == WATCH_OFF or not source_dir:
+            self.clear()
+            return
+        if mode == WATCH_NOTIFY:
+            paths = {QDir.cleanPath(QDir.fromNativeSeparators(os.path.join(source_dir, rel_dir))) for rel_dir in rel_dirs}
+            if self.mode == WATCH_NOTIFY and self.fs_watcher is not None:
+                # 僅增減變動的資料夾
+                watched = set(self.fs_watcher.directories())
+                if watched - paths:
+                    self.fs_watcher.removePaths(list(watched - paths))
+                failed = self.fs_watcher.addPaths(list(paths - watched)) if paths - watched else []
+            else:
+                self.clear()
+                self.fs_watcher = QFileSystemWatcher()
+                self.fs_watcher.directoryChanged.connect(self.on_directory_changed)
+                failed = self.fs_watcher.addPaths(list(paths)) if paths else []
+            if not failed:
+                # 通知不涵蓋原地改寫的檔案，保留低頻輪詢作為保險
+                self.mode = mode
+                self.poll_timer.start(self.SAFETY_POLL_INTERVAL_MS)
+                return
+            # 超出系統監看上限，改用輪詢
+            print(f"⚠️ 無法監看 {len(failed)} 個資料夾，改用輪詢")
+        self.clear()
+        self.mode = mode
+        self.poll_timer.start(self.POLL_INTERVAL_MS)
+
+    def on_directory_changed(self, path: str) -> None:
+        """ 資料夾變動（重新計時，合併連續變動） """
+        self.debounce_timer.start()
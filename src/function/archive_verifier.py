@@ -0,0 +1,141 @@
+import hashlib
+import os
+import random
+import struct
+import time
+import zipfile
+# 自訂庫
+from src.classes.write_job import VerifyResult, WriteResult
+from src.function.archive_writer import WRITE_SIDECAR, comicinfo_hash
+from src.function.comicinfo_process import generate_comicinfo, parse_comicinfo
+from src.function.zip_process import COPY_BUFFER_SIZE, read_comicinfo_entry
+
+# 驗證模式
+VERIFY_OFF = 0
+VERIFY_SAMPLED = 1 # 只檢查部分項目的 CRC，不計算整個檔案的校驗碼
+VERIFY_FULL = 2 # 檢查所有項目的 CRC，並計算整個檔案的校驗碼
+
+VERIFY_SAMPLE_SIZE = 8 # 抽樣模式檢查的項目數（另加第一個與最後一個）
+
+_LOCAL_HEADER_STRUCT = struct.Struct("<4sHHHHHIIIHH")
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
+class VerifyError(Exception):
+    """ 輸出驗證失敗 """
+    pass
+
+def file_sha256(path: str, buffer_size: int = COPY_BUFFER_SIZE) -> str:
+    """ 整個檔案的 SHA-256 """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(buffer_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _check_central_directory(zf: zipfile.ZipFile) -> None:
+    """ 中央目錄與本地標頭一致、項目不重疊且都在中央目錄之前 """
+    infos = sorted(zf.infolist(), key=lambda info: info.header_offset)
+    previous_end = 0
+    for info in infos:
+        if info.header_offset < previous_end:
+            raise VerifyError(f"{info.filename} 與前一個項目重疊")
+        zf.fp.seek(info.header_offset)
+        header = zf.fp.read(_LOCAL_HEADER_STRUCT.size)
+        if len(header) != _LOCAL_HEADER_STRUCT.size or header[:4] != _LOCAL_HEADER_SIGNATURE:
+            raise VerifyError(f"{info.filename} 本地標頭異常")
+        name_len, extra_len = _LOCAL_HEADER_STRUCT.unpack(header)[9:]
+        raw_name = zf.fp.read(name_len)
+        if raw_name != info.orig_filename.encode("utf-8" if info.flag_bits & 0x800 else "cp437"):
+            raise VerifyError(f"{info.filename} 本地標頭檔名與中央目錄不符")
+        previous_end = info.header_offset + _LOCAL_HEADER_STRUCT.size + name_len + extra_len + info.compress_size
+    if previous_end > zf.start_dir:
+        raise VerifyError("項目資料超出中央目錄起點")
+
+def _check_crc(zf: zipfile.ZipFile, infos: list[zipfile.ZipInfo], buffer_size: int) -> None:
+    """ 讀完項目資料（zipfile 會在讀到結尾時比對 CRC，不符時拋出 BadZipFile） """
+    for info in infos:
+        if info.is_dir():
+            continue
+        with zf.open(info) as f:
+            while f.read(buffer_size):
+                pass
+
+def _check_comicinfo(xml: bytes, expected_hash: str, canonical: bool = True) -> None:
+    """
+    ComicInfo.xml 與寫入內容相同，且解析後重新產生、再解析的資料不變
+    以解析後的資料比對（解析時會去除文字前後空白，逐位元組比對會誤判含前後空白的欄位）
+    修補模式的輸出保留原始格式與空元素（canonical 為 False），改為檢查重新產生一次後的資料穩定
+    """
+    if expected_hash and comicinfo_hash(xml) != expected_hash:
+        raise VerifyError("ComicInfo.xml 與寫入內容不符")
+    data = parse_comicinfo(xml)
+    if not data:
+        raise VerifyError("ComicInfo.xml 無法解析")
+    reparsed = parse_comicinfo(generate_comicinfo(data))
+    if reparsed != (data if canonical else parse_comicinfo(generate_comicinfo(reparsed))):
+        raise VerifyError("ComicInfo.xml 解析後重新產生的內容不同")
+
+def verify_output(result: WriteResult, mode: int, buffer_size: int = COPY_BUFFER_SIZE, canonical: bool = True) -> VerifyResult:
+    """ 驗證單一輸出檔（不使用 Qt，可於執行緒池中執行），錯誤記錄於結果中；canonical 為 False 表示 ComicInfo 以修補模式寫入 """
+    start = time.perf_counter()
+    checked = 0
+    try:
+        if result.kind == WRITE_SIDECAR:
+            with open(result.dst_path, "rb") as f:
+                _check_comicinfo(f.read(), result.xml_hash, canonical)
+        else:
+            with zipfile.ZipFile(result.dst_path, "r") as zf:
+                _check_central_directory(zf)
+                infos = zf.infolist()
+                if mode != VERIFY_FULL and len(infos) > VERIFY_SAMPLE_SIZE + 2:
+                    # 固定亂數種子，同一個檔案每次抽到相同項目
+                    sample = random.Random(result.rel_path).sample(infos[1:-1], VERIFY_SAMPLE_SIZE)
+                    infos = [infos[0], *sorted(sample, key=lambda info: info.header_offset), infos[-1]]
+                _check_crc(zf, infos, buffer_size)
+                checked = len(infos)
+            entry = read_comicinfo_entry(result.dst_path)
+            if entry is None:
+                raise VerifyError("找不到 ComicInfo.xml")
+            _check_comicinfo(entry[1], result.xml_hash, canonical)
+        # 抽樣模式不讀取整個檔案，校驗碼只在完整檢查時計算
+        sha256 = file_sha256(result.dst_path, buffer_size) if mode == VERIFY_FULL else ""
+        return VerifyResult(result.rel_path, result.dst_path, True, "", time.perf_counter() - start, checked, sha256)
+
+    except Exception as e:
+        return VerifyResult(result.rel_path, result.dst_path, False, str(e), time.perf_counter() - start, checked)
+
+def write_checksum_manifest(manifest_path: str, checksums: dict[str, str]) -> None:
+    """
+    更新校驗碼清單（sha256sum 格式，可用 `sha256sum -c` 檢查）
+    路徑相對於清單所在資料夾（不在其中的檔案使用絕對路徑），保留清單中其他檔案的紀錄
+    """
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+
+    def manifest_name(path: str) -> str:
+        path = os.path.abspath(path)
+        if os.path.commonpath([base_dir, path]) == base_dir:
+            path = os.path.relpath(path, base_dir)
+        return path.replace(os.sep, "/")
+
+    entries = {}
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            for line in f:
+                digest, _, name = line.rstrip("\n").partition("  ")
+                if name:
+                    entries[name] = digest
+    except FileNotFoundError:
+        pass
+    for path, digest in checksums.items():
+        entries[manifest_name(path)] = digest
+
+    temp_path = manifest_path + ".tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8", newline="\n") as f:
+            for name in sorted(entries):
+                f.write(f"{entries[name]}  {name}\n")
+        os.replace(temp_path, manifest_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
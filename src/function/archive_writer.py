@@ -0,0 +1,471 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+import hashlib
+import os
+import shutil
+import threading
+import time
+import zipfile
+# 自訂庫
+from src.classes.memory_budget import MemoryBudget
+from src.classes.write_job import JobState, WriteJob, WriteResult
+from src.function.comicinfo_process import generate_comicinfo, patch_comicinfo
+from src.function.zip_process import (
+    COPY_BUFFER_SIZE, check_entry_size, append_comicinfo, copy_entry, deflate_file, read_comicinfo_entry, write_raw_entry,
+    recover_interrupted_append, zip_orphaned_bytes,
+)
+
+# 寫入方式
+WRITE_IN_PLACE = "in_place"
+WRITE_FLATTEN = "flatten"
+WRITE_APPEND = "append"
+WRITE_FOLDER_TO_ZIP = "folder_to_zip"
+WRITE_SIDECAR = "sidecar"
+
+# 處理結果
+ACTION_WRITTEN = "written"
+ACTION_SKIPPED = "skipped" # 輸出已是最新
+ACTION_COPIED = "copied" # ComicInfo 未變更，直接複製來源
+
+# 資料夾打包壓縮
+COMPRESS_WORKERS = os.cpu_count() or 1 # 整個批次的壓縮執行緒總數（由同時執行的工作分攤）
+PARALLEL_DEFLATE_MAX_SIZE = 64 * 1024 * 1024 # 超過此大小的檔案改為串流壓縮
+_compress_pool: ThreadPoolExecutor | None = None
+_compress_pool_workers = 0
+_compress_pool_lock = threading.Lock()
+
+def _remove_temp(temp_path: str) -> None:
+    """ 移除暫存檔 """
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+
+def write_comicinfo_in_place(
+    old_zip_path: str,
+    new_zip_path: str,
+    xml: bytes,
+    original_path: str = "ComicInfo.xml",
+    buffer_size: int = COPY_BUFFER_SIZE,
+) -> None:
+    """ 在原位置寫入 ComicInfo.xml """
+    temp_zip_path = new_zip_path + ".tmp"
+
+    try:
+        with zipfile.ZipFile(old_zip_path, 'r') as zin, zipfile.ZipFile(temp_zip_path, 'w', zipfile.ZIP_STORED) as zout:
+            comicinfo_written = False
+
+            for item in zin.infolist():
+                if item.filename.lower().endswith("comicinfo.xml"):
+                    if not comicinfo_written:
+                        zout.writestr(original_path, xml)
+                        comicinfo_written = True
+                    # skip all ComicInfo.xml
+                    continue
+
+                copy_entry(zin, zout, item, buffer_size=buffer_size)
+
+            # 沒找到原來位置 → 新增 ComicInfo.xml 在根目錄
+            if not comicinfo_written:
+                zout.writestr("ComicInfo.xml", xml)
+
+        os.replace(temp_zip_path, new_zip_path)
+
+    except BaseException:
+        _remove_temp(temp_zip_path)
+        raise
+
+def write_comicinfo_flatten(old_zip_path: str, new_zip_path: str, xml: bytes, buffer_size: int = COPY_BUFFER_SIZE) -> None:
+    """ 鋪平化寫入 ComicInfo.xml """
+    temp_zip_path = new_zip_path + ".tmp"
+    seen = set()
+
+    try:
+        with zipfile.ZipFile(old_zip_path, 'r') as zin, zipfile.ZipFile(temp_zip_path, 'w', zipfile.ZIP_STORED) as zout:
+            for item in zin.infolist():
+                filename = os.path.basename(item.filename)
+
+                if filename.lower() == "comicinfo.xml":
+                    continue  # 全部捨棄 ComicInfo.xml，待會重寫
+
+                if filename in seen:
+                    continue  # 同名檔案 → 跳過
+                seen.add(filename)
+
+                copy_entry(zin, zout, item, filename, buffer_size)
+
+            zout.writestr("ComicInfo.xml", xml)
+
+        os.replace(temp_zip_path, new_zip_path)
+
+    except BaseException:
+        _remove_temp(temp_zip_path)
+        raise
+
+def write_comicinfo_append(
+    zip_path: str,
+    xml: bytes,
+    original_path: str = "ComicInfo.xml",
+    compact_threshold: int = 0,
+    buffer_size: int = COPY_BUFFER_SIZE,
+) -> None:
+    """ 追加寫入 ComicInfo.xml（輸出與來源為同一檔案；孤立資料超過整理門檻 (%) 時改為完整重寫） """
+    recover_interrupted_append(zip_path) # 先復原上次中斷的追加，再判斷是否需要整理
+    if compact_threshold > 0:
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            orphaned = zip_orphaned_bytes(zf)
+        if orphaned * 100 > os.path.getsize(zip_path) * compact_threshold:
+            write_comicinfo_in_place(zip_path, zip_path, xml, original_path, buffer_size)
+            return
+
+    append_comicinfo(zip_path, xml, original_path)
+
+def _get_compress_pool(workers: int) -> ThreadPoolExecutor:
+    """
+    行程內共用的壓縮執行緒池
+    行程池中每個子行程各有一個執行緒池，workers 由批次依並行工作數分攤 CPU 核心數，壓縮的總並行數不超過核心數
+    """
+    global _compress_pool, _compress_pool_workers
+    with _compress_pool_lock:
+        if _compress_pool is None or _compress_pool_workers != workers:
+            if _compress_pool is not None:
+                _compress_pool.shutdown(wait=False) # 前一批次的設定，執行中的壓縮仍會完成
+            _compress_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="deflate")
+            _compress_pool_workers = workers
+        return _compress_pool
+
+def write_comic_folder_to_zip(
+    folder_path: str,
+    output_path: str,
+    xml: bytes,
+    compress_level: int = 0,
+    stored_exts: tuple[str, ...] = (),
+    buffer_size: int = COPY_BUFFER_SIZE,
+    workers: int = COMPRESS_WORKERS,
+    budget: MemoryBudget | None = None,
+) -> None:
+    """
+    將資料夾打包成壓縮檔並加入 ComicInfo.xml
+    compress_level 為 0 時不壓縮，否則以 deflate 壓縮（stored_exts 中的副檔名保持不壓縮）
+    壓縮以 workers 個執行緒同時進行，寫入仍依固定順序，輸出內容可重現
+    交給壓縮執行緒的檔案在寫入前整個留在記憶體（原始大小加一個讀取緩衝），送出前向 budget 登記；
+    登記不下時等待前面的項目寫入，沒有其他項目可等待時改為串流壓縮
+    """
+    temp_zip_path = output_path + ".tmp"
+    stored_exts = {ext.lower() for ext in stored_exts}
+    window = max(1, workers) * 2 # 同時在記憶體中的壓縮項目數
+    if budget is None:
+        budget = MemoryBudget()
+
+    # 走訪整個資料夾結構（排序後順序固定）
+    entries = []
+    for root, dirs, files in os.walk(folder_path):
+        dirs.sort()
+        for file in sorted(files):
+            if file.lower() == "comicinfo.xml":
+                continue  # 跳過原本的 ComicInfo.xml
+            full_path = os.path.join(root, file)
+            deflate = compress_level > 0 and os.path.splitext(file)[1].lower() not in stored_exts
+            entries.append((full_path, os.path.relpath(full_path, folder_path), deflate, os.path.getsize(full_path)))
+
+    def parallel(index: int) -> bool:
+        """ 是否交給壓縮執行緒（過大的檔案改為串流壓縮，避免整個檔案留在記憶體） """
+        _, _, deflate, size = entries[index]
+        return deflate and size <= PARALLEL_DEFLATE_MAX_SIZE
+
+    futures: dict[int, Future] = {}
+    reserved: dict[int, int] = {} # 已送出、尚未寫入的項目登記的記憶體
+    try:
+        with zipfile.ZipFile(temp_zip_path, 'w', zipfile.ZIP_STORED) as zout:
+            # 先寫入 ComicInfo.xml
+            zout.writestr("ComicInfo.xml", xml)
+
+            pool = _get_compress_pool(max(1, workers)) if compress_level > 0 else None
+            next_submit = 0
+            for index, (full_path, rel_path, deflate, size) in enumerate(entries):
+                # 預先送出後續項目的壓縮工作（限制數量與記憶體用量）
+                while pool is not None and next_submit < len(entries) and next_submit < index + window:
+                    if parallel(next_submit):
+                        need = entries[next_submit][3] + buffer_size
+                        if budget.try_reserve(need):
+                            futures[next_submit] = pool.submit(deflate_file, entries[next_submit][0], compress_level, buffer_size)
+                            reserved[next_submit] = need
+                        elif futures:
+                            break # 等待前面的項目寫入後再送出
+                    next_submit += 1
+
+                future = futures.pop(index, None)
+                if future is not None:
+                    compressed, crc, file_size = future.result()
+                    if len(compressed) < file_size:
+                        zinfo = zipfile.ZipInfo.from_file(full_path, rel_path)
+                        zinfo.compress_type = zipfile.ZIP_DEFLATED
+                        zinfo.CRC = crc
+                        zinfo.file_size = file_size
+                        zinfo.compress_size = len(compressed)
+                        write_raw_entry(zout, zinfo, (compressed,))
+                        del compressed
+                        budget.release(reserved.pop(index))
+                        continue
+                    del compressed
+                    budget.release(reserved.pop(index))
+                    deflate = False # 壓縮後沒有變小 → 不壓縮
+
+                zout.write(
+                    full_path, arcname=rel_path,
+                    compress_type=zipfile.ZIP_DEFLATED if deflate else zipfile.ZIP_STORED,
+                    compresslevel=compress_level if deflate else None,
+                )
+
+        os.replace(temp_zip_path, output_path)
+
+    except BaseException:
+        for future in futures.values():
+            future.cancel()
+        for need in reserved.values():
+            budget.release(need)
+        _remove_temp(temp_zip_path)
+        raise
+
+def sidecar_path(folder_path: str) -> str:
+    """ 資料夾內 ComicInfo.xml 的路徑（沿用既有檔名的大小寫） """
+    try:
+        with os.scandir(folder_path) as it:
+            for entry in it:
+                if entry.name.lower() == "comicinfo.xml" and entry.is_file():
+                    return entry.path
+    except OSError:
+        pass
+    return os.path.join(folder_path, "ComicInfo.xml")
+
+def write_comicinfo_sidecar(sidecar_path: str, xml: bytes) -> None:
+    """ 在漫畫資料夾內寫入 ComicInfo.xml（先寫暫存檔再取代，不會留下寫到一半的檔案） """
+    temp_path = sidecar_path + ".tmp"
+
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(xml)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, sidecar_path)
+
+    except BaseException:
+        _remove_temp(temp_path)
+        raise
+
+def comicinfo_hash(xml: bytes) -> str:
+    """ ComicInfo XML 雜湊 """
+    return hashlib.sha256(xml).hexdigest()
+
+def file_signature(path: str) -> tuple[int, int] | None:
+    """ 檔案簽章 ( 大小, 修改時間 )，不存在時回傳 None """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+def source_signature(path: str) -> tuple[int, int] | None:
+    """ 來源簽章；資料夾為所有檔案大小總和與其中最新的修改時間（含資料夾本身，可察覺刪除） """
+    if not os.path.isdir(path):
+        return file_signature(path)
+    total_size = 0
+    latest_mtime = 0
+    for root, _, files in os.walk(path):
+        latest_mtime = max(latest_mtime, os.stat(root).st_mtime_ns)
+        for file in files:
+            stat = os.stat(os.path.join(root, file))
+            total_size += stat.st_size
+            latest_mtime = max(latest_mtime, stat.st_mtime_ns)
+    return total_size, latest_mtime
+
+def _archive_comicinfo_hash(zip_path: str, max_size: int = 0) -> str | None:
+    """ 壓縮檔內既有 ComicInfo.xml 的雜湊（超過 max_size 時拋出 MemoryLimitError） """
+    try:
+        entry = read_comicinfo_entry(zip_path, max_size)
+    except (OSError, zipfile.BadZipFile):
+        return None
+    return comicinfo_hash(entry[1]) if entry else None
+
+def _read_sidecar(sidecar_path: str, max_size: int = 0) -> bytes:
+    """ 讀取資料夾內的 ComicInfo.xml（超過 max_size 時拋出 MemoryLimitError，0 為不限制） """
+    with open(sidecar_path, "rb") as f:
+        check_entry_size(os.path.basename(sidecar_path), os.fstat(f.fileno()).st_size, max_size)
+        return f.read()
+
+def _sidecar_comicinfo_hash(sidecar_path: str, max_size: int = 0) -> str | None:
+    """ 資料夾內既有 ComicInfo.xml 的雜湊 """
+    try:
+        return comicinfo_hash(_read_sidecar(sidecar_path, max_size))
+    except OSError:
+        return None
+
+def _prefetch(path: str) -> None:
+    """ 請作業系統預先讀取檔案（非同步，不支援的平台略過） """
+    if not hasattr(os, "posix_fadvise") or os.path.isdir(path):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+def _source_comicinfo(job: WriteJob) -> bytes | None:
+    """ 來源的 ComicInfo.xml 內容（資料夾為其中的 ComicInfo.xml），不存在時回傳 None """
+    try:
+        if os.path.isdir(job.src_path):
+            return _read_sidecar(sidecar_path(job.src_path), job.memory_limit)
+        entry = read_comicinfo_entry(job.src_path, job.memory_limit)
+    except (OSError, zipfile.BadZipFile):
+        return None
+    return entry[1] if entry else None
+
+def _same_file(job: WriteJob) -> bool:
+    """ 輸出是否覆寫來源本身 """
+    return os.path.normcase(os.path.abspath(job.src_path)) == os.path.normcase(os.path.abspath(job.dst_path))
+
+def output_profile(job: WriteJob) -> str:
+    """
+    輸出方式（寫入方式與影響輸出內容的設定），記錄於輸出紀錄
+    寫入方式或資料夾打包的壓縮設定改變後，ComicInfo 相同的輸出也需要重新寫入
+    """
+    if job.kind == WRITE_FOLDER_TO_ZIP:
+        return f"{job.kind}:{job.compress_level}:{','.join(job.stored_exts)}"
+    return job.kind
+
+def read_job_state(job: WriteJob, src_signature: tuple[int, int] | None = None, prefetch: bool = False) -> JobState:
+    """
+    讀取判斷是否需要寫入所需的檔案狀態（簽章與既有 ComicInfo 雜湊；修補模式另讀取來源的 ComicInfo.xml）
+    來源與輸出簽章符合上次輸出紀錄時不開啟檔案，輸出的 ComicInfo 雜湊即為紀錄中的雜湊
+    prefetch 時請作業系統預先讀取需要重寫的來源
+    """
+    if src_signature is None:
+        src_signature = source_signature(job.src_path)
+    dst_signature = file_signature(job.dst_path)
+    state = JobState(src_signature, dst_signature)
+    if job.patch_comicinfo:
+        state.src_comicinfo = _source_comicinfo(job)
+    if not job.skip_unchanged:
+        if prefetch:
+            _prefetch(job.src_path)
+        return state
+
+    same_file = _same_file(job)
+    if dst_signature and src_signature:
+        if job.manifest and tuple(job.manifest[:4]) == (*src_signature, *dst_signature):
+            # 輸出為上次由同一來源寫入，紀錄中的雜湊即為輸出的 ComicInfo
+            state.dst_comicinfo_hash = job.manifest[4]
+            prefetch = False
+        elif job.kind == WRITE_SIDECAR:
+            state.dst_comicinfo_hash = _sidecar_comicinfo_hash(job.dst_path, job.memory_limit)
+            return state
+        # 輸出不舊於來源時才比對 ComicInfo
+        elif same_file or dst_signature[1] >= src_signature[1]:
+            state.dst_comicinfo_hash = _archive_comicinfo_hash(job.dst_path, job.memory_limit)
+    if job.kind == WRITE_IN_PLACE and not same_file:
+        if job.patch_comicinfo: # 已讀取
+            state.src_comicinfo_hash = comicinfo_hash(state.src_comicinfo) if state.src_comicinfo is not None else None
+        else:
+            state.src_comicinfo_hash = _archive_comicinfo_hash(job.src_path, job.memory_limit)
+    if prefetch:
+        _prefetch(job.src_path)
+    return state
+
+def build_comicinfo(job: WriteJob, state: JobState | None = None) -> bytes:
+    """ 產生工作的 ComicInfo.xml（修補模式且來源有 ComicInfo.xml 時只改寫變更的欄位，無法修補時完整產生） """
+    if job.patch_comicinfo and state is not None and state.src_comicinfo is not None:
+        patched = patch_comicinfo(state.src_comicinfo, job.data)
+        if patched is not None:
+            return patched
+    return generate_comicinfo(job.data)
+
+def decide_action(job: WriteJob, state: JobState, xml_hash: str) -> str:
+    """
+    判斷是否可略過寫入（類似 make 的增量建置，只比對已讀取的狀態）
+    回傳 ACTION_SKIPPED（輸出已是最新）、ACTION_COPIED（可直接複製來源）或 ACTION_WRITTEN（需要寫入）
+    """
+    if not job.skip_unchanged:
+        return ACTION_WRITTEN
+    if state.dst_signature and state.src_signature:
+        profile = output_profile(job)
+        # 上次輸出紀錄相符
+        if job.manifest == (*state.src_signature, *state.dst_signature, xml_hash, profile):
+            return ACTION_SKIPPED
+        # 輸出的 ComicInfo 已相同，且輸出方式相同（覆寫原檔與 ComicInfo.xml 檔案不受輸出方式影響）
+        if state.dst_comicinfo_hash == xml_hash and (
+            job.kind == WRITE_SIDECAR or _same_file(job)
+            or (job.manifest is not None and job.manifest[5:] == (profile,))
+        ):
+            return ACTION_SKIPPED
+        if job.kind == WRITE_SIDECAR:
+            return ACTION_WRITTEN
+    # 來源的 ComicInfo 已相同，原位置寫入的結果等同來源 → 直接複製
+    if job.kind == WRITE_IN_PLACE and state.src_comicinfo_hash == xml_hash:
+        return ACTION_COPIED
+    return ACTION_WRITTEN
+
+def _copy_source(job: WriteJob) -> None:
+    """ 直接複製來源為輸出 """
+    temp_path = job.dst_path + ".tmp"
+    try:
+        shutil.copyfile(job.src_path, temp_path)
+        os.replace(temp_path, job.dst_path)
+    except BaseException:
+        _remove_temp(temp_path)
+        raise
+
+def run_write_job(job: WriteJob, state: JobState | None = None, xml: bytes | None = None) -> WriteResult:
+    """
+    執行單一寫入工作（不使用 Qt，可於執行緒池或子行程中執行），錯誤記錄於結果中
+    state、xml 為管線前段已讀取的狀態與已產生的 ComicInfo，未提供時在此讀取與產生
+    緩衝記憶體（ComicInfo、複製緩衝、壓縮視窗）登記於工作的 MemoryBudget，超過 job.memory_limit 時工作失敗，峰值記錄於結果
+    """
+    start = time.perf_counter()
+    budget = MemoryBudget(job.memory_limit)
+    try:
+        os.makedirs(os.path.dirname(job.dst_path), exist_ok=True)
+        if state is None:
+            state = read_job_state(job)
+        if xml is None:
+            xml = build_comicinfo(job, state)
+        budget.reserve(len(xml) + len(state.src_comicinfo or b""), "ComicInfo.xml")
+        xml_hash = comicinfo_hash(xml)
+        original_path = job.data.get("_original_path", "ComicInfo.xml")
+        src_signature = state.src_signature
+
+        action = decide_action(job, state, xml_hash)
+        if action == ACTION_COPIED:
+            with budget.hold(job.buffer_size, "複製緩衝"):
+                _copy_source(job)
+        elif action == ACTION_WRITTEN:
+            if job.kind == WRITE_FOLDER_TO_ZIP:
+                write_comic_folder_to_zip(
+                    job.src_path, job.dst_path, xml, job.compress_level, tuple(job.stored_exts), job.buffer_size,
+                    job.compress_workers, budget,
+                )
+            elif job.kind == WRITE_SIDECAR:
+                write_comicinfo_sidecar(job.dst_path, xml)
+            else:
+                with budget.hold(job.buffer_size, "複製緩衝"):
+                    if job.kind == WRITE_FLATTEN:
+                        write_comicinfo_flatten(job.src_path, job.dst_path, xml, job.buffer_size)
+                    elif job.kind == WRITE_APPEND:
+                        write_comicinfo_append(job.dst_path, xml, original_path, job.compact_threshold, job.buffer_size)
+                    else:
+                        write_comicinfo_in_place(job.src_path, job.dst_path, xml, original_path, job.buffer_size)
+
+        dst_signature = file_signature(job.dst_path)
+        if job.kind == WRITE_SIDECAR:
+            src_signature = source_signature(job.src_path) # 資料夾內容包含剛寫入的 ComicInfo.xml
+        elif _same_file(job):
+            src_signature = dst_signature # 覆寫原檔
+        return WriteResult(
+            job.rel_path, job.kind, job.dst_path, True, "", time.perf_counter() - start,
+            dst_signature[0] if action != ACTION_SKIPPED else 0,
+            action, xml_hash, src_signature, dst_signature, output_profile(job), budget.peak,
+        )
+
+    except Exception as e:
+        return WriteResult(
+            job.rel_path, job.kind, job.dst_path, False, str(e), time.perf_counter() - start, 0, peak_memory=budget.peak,
+        )
@@ -0,0 +1,138 @@
+import os
+import shutil
+import zipfile
+from collections import Counter
+# 自訂庫
+from src.classes.write_job import WriteJob
+from src.function.archive_writer import (
+    ACTION_COPIED, ACTION_SKIPPED,
+    WRITE_APPEND, WRITE_FOLDER_TO_ZIP, WRITE_SIDECAR,
+    build_comicinfo, comicinfo_hash, decide_action, read_job_state,
+)
+from src.function.device_info import describe_devices, device_id
+from src.function.zip_process import zip_orphaned_bytes
+
+# 預估處理方式（寫入方式之外的兩種）
+PLAN_SKIPPED = ACTION_SKIPPED
+PLAN_COPIED = ACTION_COPIED
+
+def _append_needs_compaction(zip_path: str, compact_threshold: int) -> bool:
+    """ 追加寫入是否會觸發完整重寫（與 write_comicinfo_append 的判斷相同） """
+    if compact_threshold <= 0:
+        return False
+    with zipfile.ZipFile(zip_path, 'r') as zf:
+        orphaned = zip_orphaned_bytes(zf)
+    return orphaned * 100 > os.path.getsize(zip_path) * compact_threshold
+
+def plan_job(job: WriteJob) -> dict:
+    """
+    預估單一工作（不寫入任何檔案）
+    回傳 { rel_path, path: 處理方式, bytes_read, bytes_written, growth: 輸出裝置增加的空間 }
+    """
+    state = read_job_state(job)
+    xml = build_comicinfo(job, state)
+    action = decide_action(job, state, comicinfo_hash(xml))
+    src_size = state.src_signature[0] if state.src_signature else 0
+    dst_size = state.dst_signature[0] if state.dst_signature else 0
+
+    path = job.kind
+    if action == ACTION_SKIPPED:
+        path, bytes_read, bytes_written = PLAN_SKIPPED, 0, 0
+    elif action == ACTION_COPIED:
+        path, bytes_read, bytes_written = PLAN_COPIED, src_size, src_size
+    elif job.kind == WRITE_SIDECAR:
+        bytes_read, bytes_written = 0, len(xml)
+    elif job.kind == WRITE_FOLDER_TO_ZIP:
+        bytes_read, bytes_written = src_size, src_size + len(xml)
+    elif job.kind == WRITE_APPEND and not _append_needs_compaction(job.dst_path, job.compact_threshold):
+        bytes_read, bytes_written = 0, len(xml)
+        dst_size = 0 # 追加寫入不會釋放原檔空間
+    else: # 原位置、鋪平寫入或追加寫入觸發整理，皆為完整重寫
+        bytes_read, bytes_written = src_size, src_size
+
+    return {
+        "rel_path": job.rel_path,
+        "path": path,
+        "bytes_read": bytes_read,
+        "bytes_written": bytes_written,
+        "growth": bytes_written - dst_size if bytes_written else 0,
+    }
+
+def _free_space(path: str) -> int:
+    """ 路徑所在裝置的剩餘空間（以最近的既有上層資料夾查詢） """
+    path = os.path.abspath(path)
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    try:
+        return shutil.disk_usage(path).free
+    except OSError:
+        return 0
+
+def plan_jobs(jobs: list[WriteJob], throughput: dict[str, float] | None = None) -> dict:
+    """
+    預估整個批次（不寫入任何檔案，不使用 Qt，可於背景執行緒或命令列執行）
+    throughput 為各裝置過去量測的吞吐量 { 裝置名稱: MB/s }，用於估計時間
+    回傳 {
+        total, paths: { 處理方式: 數量 }, bytes_read, bytes_written,
+        devices: [{ device, kind, bytes_read, bytes_written, required, free, throughput, estimate }],
+        estimate: 預估秒數（有裝置缺少紀錄時為 None）, jobs: [逐檔預估], errors: [(相對路徑, 錯誤)]
+    }
+    """
+    throughput = throughput or {}
+    planned = []
+    errors = []
+    device_paths: dict[int, str] = {}
+    device_totals: dict[int, dict] = {}
+
+    def totals(dev: int, path: str) -> dict:
+        device_paths.setdefault(dev, path)
+        return device_totals.setdefault(dev, {"bytes_read": 0, "bytes_written": 0, "growth": 0, "largest": 0})
+
+    for job in jobs:
+        try:
+            plan = plan_job(job)
+        except Exception as e:
+            errors.append((job.rel_path, str(e)))
+            continue
+        planned.append(plan)
+        src_totals = totals(device_id(job.src_path), job.src_path)
+        dst_totals = totals(device_id(job.dst_path), job.dst_path)
+        src_totals["bytes_read"] += plan["bytes_read"]
+        dst_totals["bytes_written"] += plan["bytes_written"]
+        dst_totals["growth"] += plan["growth"]
+        dst_totals["largest"] = max(dst_totals["largest"], plan["bytes_written"]) # 暫存檔與原檔同時存在
+
+    devices = []
+    estimate = 0.0
+    for dev, (name, kind) in describe_devices(device_paths).items():
+        dev_totals = device_totals[dev]
+        required = max(0, dev_totals["growth"]) + dev_totals["largest"] if dev_totals["bytes_written"] else 0
+        dev_bytes = dev_totals["bytes_read"] + dev_totals["bytes_written"]
+        dev_throughput = throughput.get(name)
+        dev_estimate = dev_bytes / (dev_throughput * 1024 * 1024) if dev_throughput else (0.0 if not dev_bytes else None)
+        # 各裝置同時處理，以最慢的裝置為準
+        estimate = None if estimate is None or dev_estimate is None else max(estimate, dev_estimate)
+        devices.append({
+            "device": name,
+            "kind": kind,
+            "bytes_read": dev_totals["bytes_read"],
+            "bytes_written": dev_totals["bytes_written"],
+            "required": required,
+            "free": _free_space(device_paths[dev]) if required else 0,
+            "throughput": dev_throughput,
+            "estimate": dev_estimate,
+        })
+
+    return {
+        "total": len(jobs),
+        "paths": dict(Counter(plan["path"] for plan in planned)),
+        "bytes_read": sum(plan["bytes_read"] for plan in planned),
+        "bytes_written": sum(plan["bytes_written"] for plan in planned),
+        "devices": devices,
+        "estimate": estimate,
+        "jobs": planned,
+        "errors": errors,
+    }
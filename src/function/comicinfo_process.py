@@ -1,55 +1,78 @@
+from collections.abc import Mapping
 import lxml.etree as ET
 import os
+import re
+import threading
 import zipfile
 from lxml.builder import ElementMaker
+from xml.sax.saxutils import escape
 
 from lxml.etree import QName  # 用於強制指定前綴
+# 自訂庫
+from src.classes.metadata_record import MetadataRecord
+from src.classes.metadata_template import MetadataTemplate, PlaceholderTemplate
+
+_parser_local = threading.local() # lxml 解析器不可跨執行緒共用，每個執行緒各自重複使用一個
+
+def _get_parser() -> ET.XMLParser:
+    """ 取得目前執行緒的解析器（略過空白、註解與處理指令） """
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = _parser_local.parser = ET.XMLParser(remove_blank_text=True, remove_comments=True, remove_pis=True)
+    return parser
+
+def _split_tag(tag: str) -> tuple[str | None, str]:
+    """ 拆分 "{namespace}localname" 為 ( namespace, localname )（比 ET.QName 快） """
+    if tag[0] == "{":
+        namespace_uri, _, localname = tag[1:].partition("}")
+        return namespace_uri, localname
+    return None, tag
 
 def parse_comicinfo(xml_content: bytes) -> dict:
-    """ 解析 ComicInfo XML """
+    """ 解析 ComicInfo XML（單次走訪，同時收集 namespace、單值欄位與複合欄位） """
     try:
-        tree = ET.fromstring(xml_content)
+        tree = ET.fromstring(xml_content, _get_parser())
     except Exception as e:
         return {}
 
-    nsmap = tree.nsmap.copy() if tree.nsmap else {}
-    data = {'_nsmap': nsmap, '_fields': {}, '_complex': {}}
+    nsmap = dict(tree.nsmap)
+    fields = {}
+    complex_fields = {}
+    data = {'_nsmap': nsmap, '_fields': fields, '_complex': complex_fields}
 
-    # 額外補漏 prefix → URI（在 XML 內部宣告，但 root 沒宣告的）
-    for elem in tree.iter():
+    def add_namespace(elem, namespace_uri: str | None) -> None:
+        """ 額外補漏 prefix → URI（在 XML 內部宣告，但 root 沒宣告的） """
         prefix = elem.prefix
-        namespace_uri = ET.QName(elem).namespace
+        if prefix and namespace_uri and prefix not in nsmap:
+            nsmap[prefix] = namespace_uri
 
-        if prefix and namespace_uri and prefix not in data['_nsmap']:
-            data['_nsmap'][prefix] = namespace_uri
-
-    for elem in tree.iterchildren():
+    add_namespace(tree, _split_tag(tree.tag)[0])
+    for elem in tree.iterchildren(ET.Element):
+        namespace_uri, tag = _split_tag(elem.tag)
+        add_namespace(elem, namespace_uri)
         prefix = elem.prefix or 'base'
-        tag = ET.QName(elem).localname
-        text = elem.text.strip() if elem.text else ''
+        attrib = elem.attrib
 
         # 複合型元素
-        if len(elem.attrib) > 0 or len(elem):
-            if prefix not in data['_complex']:
-                data['_complex'][prefix] = {}
-            if tag not in data['_complex'][prefix]:
-                data['_complex'][prefix][tag] = []
-
-            entry = {'_attrs': dict(elem.attrib), '_children': []}
-            for child in elem:
-                child_tag = ET.QName(child).localname
-                child_entry = {
+        if attrib or len(elem):
+            entry = {'_attrs': dict(elem.items()), '_children': []}
+            for child in elem.iterchildren(ET.Element):
+                child_namespace_uri, child_tag = _split_tag(child.tag)
+                add_namespace(child, child_namespace_uri)
+                # 更深層的元素只收集 namespace
+                if len(child):
+                    for descendant in child.iterdescendants(ET.Element):
+                        add_namespace(descendant, _split_tag(descendant.tag)[0])
+                text = child.text
+                entry['_children'].append({
                     'tag': child_tag,
-                    'text': child.text.strip() if child.text else '',
-                    'attrib': dict(child.attrib)
-                }
-                entry['_children'].append(child_entry)
-
-            data['_complex'][prefix][tag].append(entry)
+                    'text': text.strip() if text else '',
+                    'attrib': dict(child.items())
+                })
+            complex_fields.setdefault(prefix, {}).setdefault(tag, []).append(entry)
         else:
-            if prefix not in data['_fields']:
-                data['_fields'][prefix] = {}
-            data['_fields'][prefix][tag] = text
+            text = elem.text
+            fields.setdefault(prefix, {})[tag] = text.strip() if text else ''
 
     return data
 
@@ -98,30 +121,212 @@ def generate_comicinfo(data: dict) -> bytes:
 
     return ET.tostring(root, pretty_print=True, encoding="utf-8", xml_declaration=True)
 
+# ComicInfo 結構定義的元素順序（v2.1），修補模式依此決定新增欄位的位置
+COMICINFO_SCHEMA_ORDER = {
+    tag: rank for rank, tag in enumerate((
+        "Title", "Series", "Number", "Count", "Volume", "AlternateSeries", "AlternateNumber", "AlternateCount",
+        "Summary", "Notes", "Year", "Month", "Day", "Writer", "Penciller", "Inker", "Colorist", "Letterer",
+        "CoverArtist", "Editor", "Translator", "Publisher", "Imprint", "Genre", "Tags", "Web", "PageCount",
+        "LanguageISO", "Format", "BlackAndWhite", "Manga", "Characters", "Teams", "Locations", "ScanInformation",
+        "StoryArc", "StoryArcNumber", "SeriesGroup", "AgeRating", "Pages", "CommunityRating",
+        "MainCharacterOrTeam", "Review", "GTIN",
+    ))
+}
+
+# 修補模式的標記掃描（標籤、註解、CDATA、處理指令）
+_TOKEN_RE = re.compile(
+    r"<!--.*?-->|<!\[CDATA\[.*?\]\]>|<\?.*?\?>"
+    r"|<(/?)([^\s/>!?]+)((?:\s+[^\s=/>]+\s*=\s*(?:\"[^\"]*\"|'[^']*'))*)\s*(/?)>",
+    re.S,
+)
+_ENCODING_RE = re.compile(r"""^\s*<\?xml[^>]*?encoding\s*=\s*["']([^"']+)["']""")
+_REFERENCE_RE = re.compile(r"&#(\d+);|&#x([0-9a-fA-F]+);|&(lt|gt|amp|quot|apos);")
+_INVALID_XML_CHAR_RE = re.compile("[^\t\n\r\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]")
+_CDATA_SPLIT_RE = re.compile(r"(<!\[CDATA\[.*?\]\]>)", re.S)
+_ENTITIES = {"lt": "<", "gt": ">", "amp": "&", "quot": '"', "apos": "'"}
+
+def _unescape_text(content: str) -> str | None:
+    """ 單值元素內容轉為文字（處理字元參照與 CDATA），含其他標記時回傳 None """
+    if "&" not in content and "<" not in content:
+        return content
+    parts = []
+    for piece in _CDATA_SPLIT_RE.split(content):
+        if piece.startswith("<![CDATA["):
+            parts.append(piece[9:-3])
+        elif "<" in piece:
+            return None
+        else:
+            parts.append(_REFERENCE_RE.sub(
+                lambda m: chr(int(m.group(1))) if m.group(1) else chr(int(m.group(2), 16)) if m.group(2) else _ENTITIES[m.group(3)],
+                piece,
+            ))
+    return "".join(parts)
+
+def _scan_children(text: str) -> tuple[int, int, list[dict]] | None:
+    """
+    掃描根元素的直接子元素
+    回傳 ( 根開始標籤起點, 根開始標籤結尾, 根結束標籤起點, [{ name, start, end, content_start, content_end, simple, self_closing }] )
+    結構無法處理時回傳 None
+    """
+    stack = []
+    children = []
+    root_open_start = root_open_end = None
+    for m in _TOKEN_RE.finditer(text):
+        closing, name, attrs, self_closing = m.groups()
+        if name is None: # 註解、CDATA、處理指令
+            continue
+        if closing: # 結束標籤
+            if not stack or stack.pop() != name:
+                return None
+            if len(stack) == 1:
+                child = children[-1]
+                child["content_end"], child["end"] = m.start(), m.end()
+            elif not stack:
+                return root_open_start, root_open_end, m.start(), children
+            continue
+        if not stack:
+            if self_closing:
+                return None
+            root_open_start, root_open_end = m.start(), m.end()
+        elif len(stack) == 1:
+            children.append({
+                "name": name, "start": m.start(), "end": m.end(),
+                "content_start": m.end(), "content_end": m.end(),
+                "simple": not attrs.strip(), "self_closing": bool(self_closing),
+            })
+        else:
+            children[-1]["simple"] = False
+        if not self_closing:
+            stack.append(name)
+    return None
+
+def _escape_text(value: str) -> str:
+    """ 文字轉為元素內容（與 lxml 相同，CR 以字元參照保留） """
+    return escape(value, {"\r": "&#13;"})
+
+def _line_start(text: str, position: int) -> int:
+    """ 位置前方的縮排起點（含前一個換行），用於移除整行 """
+    start = position
+    while start > 0 and text[start - 1] in " \t":
+        start -= 1
+    if start > 0 and text[start - 1] == "\n":
+        start -= 1
+        if start > 0 and text[start - 1] == "\r":
+            start -= 1
+    return start
+
+def patch_comicinfo(original: bytes, data: dict) -> bytes | None:
+    """
+    以原始 ComicInfo.xml 為基礎，只改寫值有變更的單值欄位（新增的欄位依結構順序插入，清空的欄位移除）
+    其他內容（排列、註解、處理指令、複合欄位）保持位元組不變；欄位內容與 generate_comicinfo 相同
+    無法安全修補時（非 UTF-8、DOCTYPE、重複欄位、未宣告的前綴等）回傳 None，改用 generate_comicinfo
+    """
+    bom = b"\xef\xbb\xbf" if original.startswith(b"\xef\xbb\xbf") else b""
+    try:
+        text = original[len(bom):].decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    encoding = _ENCODING_RE.match(text)
+    if encoding and encoding.group(1).lower().replace("_", "-") not in ("utf-8", "utf8"):
+        return None
+    if "<!DOCTYPE" in text:
+        return None # 可能定義實體，不處理
+    scanned = _scan_children(text)
+    if scanned is None:
+        return None
+    root_open_start, root_open_end, root_close_start, children = scanned
+    root_tag = text[root_open_start:root_open_end]
+
+    # 新的欄位值（與 generate_comicinfo 相同，略過空白值）
+    wanted: dict[tuple[str, str], str] = {}
+    for prefix, fields in data.get('_fields', {}).items():
+        for tag, value in fields.items():
+            value_str = str(value)
+            if value_str.strip():
+                if _INVALID_XML_CHAR_RE.search(value_str):
+                    return None
+                wanted[(prefix, tag)] = value_str
+
+    edits: list[tuple[int, int, str]] = [] # ( 起點, 終點, 取代內容 )
+    seen = set()
+    kept = [] # 保留的子元素 ( 結構順序, 子元素 )
+    for child in children:
+        prefix, _, tag = child["name"].rpartition(":")
+        key = child["key"] = (prefix or 'base', tag)
+        if not child["simple"]:
+            if key in wanted:
+                return None # 單值欄位與複合欄位同名
+            kept.append(child)
+            continue
+        if key in seen:
+            return None # 重複欄位
+        seen.add(key)
+        current = _unescape_text(text[child["content_start"]:child["content_end"]])
+        if current is None:
+            return None
+        value = wanted.get(key)
+        if value is None:
+            if current.strip(): # 欄位已清空
+                edits.append((_line_start(text, child["start"]), child["end"], ""))
+                continue
+        elif child["self_closing"]:
+            edits.append((child["start"], child["end"], f"<{child['name']}>{_escape_text(value)}</{child['name']}>"))
+        elif current.strip() != value:
+            edits.append((child["content_start"], child["content_end"], _escape_text(value)))
+        kept.append(child)
+
+    # 新增欄位：插入在結構順序較後的第一個既有元素之前
+    added = [key for key in wanted if key not in seen]
+    if added:
+        newline = "\r\n" if "\r\n" in text else "\n"
+        if children:
+            first = children[0]["start"]
+            indent = text[_line_start(text, first):first].lstrip("\r\n") or "  "
+        else:
+            indent = "  "
+        for prefix, tag in added:
+            if prefix != 'base' and not re.search(rf"\sxmlns:{re.escape(prefix)}\s*=", root_tag):
+                return None # 前綴未在根元素宣告
+        added.sort(key=lambda key: COMICINFO_SCHEMA_ORDER.get(key[1], len(COMICINFO_SCHEMA_ORDER)))
+        insertions: dict[int, list[str]] = {}
+        kept_ranks = [(COMICINFO_SCHEMA_ORDER.get(child["key"][1], -1), child) for child in kept]
+        for prefix, tag in added:
+            rank = COMICINFO_SCHEMA_ORDER.get(tag, len(COMICINFO_SCHEMA_ORDER))
+            name = tag if prefix == 'base' else f"{prefix}:{tag}"
+            element = f"<{name}>{_escape_text(wanted[(prefix, tag)])}</{name}>"
+            anchor = next((child for child_rank, child in kept_ranks if child_rank > rank), None)
+            if anchor is not None:
+                insertions.setdefault(anchor["start"], []).append(f"{element}{newline}{indent}")
+            elif kept:
+                insertions.setdefault(kept[-1]["end"], []).append(f"{newline}{indent}{element}")
+            else:
+                insertions.setdefault(root_open_end, []).append(f"{newline}{indent}{element}")
+        if not kept and not text[root_open_end:root_close_start].strip("\t "):
+            insertions.setdefault(root_open_end, []).append(newline) # 結束標籤換行
+        for position, parts in insertions.items():
+            edits.append((position, position, "".join(parts)))
+
+    if not edits:
+        return original
+    # 由後往前套用（同位置先刪除後插入）
+    edits.sort(key=lambda edit: (edit[0], edit[1]), reverse=True)
+    for start, end, replacement in edits:
+        text = text[:start] + replacement + text[end:]
+    return bom + text.encode("utf-8")
+
 def resolve_placeholders(template: str, context: dict) -> str:
-        """ 解析佔位符模板內容 """
+        """ 解析佔位符模板內容（單一欄位；批次套用請先以 MetadataTemplate 編譯） """
         if not isinstance(template, str):
             return template
-        for key, value in context.items():
-            placeholder = f"{{{key}}}"
-            template = template.replace(placeholder, str(value))
-        return template
+        return PlaceholderTemplate(template).render(context)
 
-def update_comicinfo_data(context: dict, original: dict, updated: dict) -> dict:
+def update_comicinfo_data(context: dict, original: Mapping, updated: dict | MetadataTemplate) -> MetadataRecord:
         """
         將 get_metadata() 的資料更新回 parse_comicinfo() 的結果中
-        僅針對 _fields/base 做更新
+        僅針對 _fields 做更新，回傳新的紀錄；原資料（快取中的紀錄）不會被修改
+        未變更的 prefix、_nsmap 與 _complex 與原資料共用，只複製有變更的 prefix
+        updated 可傳入已編譯的 MetadataTemplate，批次中只需編譯一次
         """
-        data = original.copy()
-        # 預設值
-        data.setdefault('_fields', {'base': {}})
-        data.setdefault('_complex', {})
-        data.setdefault('_nsmap', {})
-        # 處理
-        for prefix, fields in updated.get('_fields', {}).items():
-            if prefix not in data['_fields']:
-                data['_fields'][prefix] = {}
-            for key, val in fields.items():
-                data['_fields'][prefix][key] = resolve_placeholders(val, context)
-
-        return data
\ No newline at end of file
+        if not isinstance(updated, MetadataTemplate):
+            updated = MetadataTemplate(updated)
+        return MetadataRecord.from_dict(original).updated(updated.render(context))
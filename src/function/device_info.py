@@ -0,0 +1,73 @@
+import os
+import sys
+
+# 裝置類型
+DEVICE_SSD = "ssd"
+DEVICE_HDD = "hdd"
+DEVICE_NETWORK = "network"
+DEVICE_UNKNOWN = "unknown"
+
+_NETWORK_FS_TYPES = {"nfs", "nfs4", "cifs", "smb3", "smbfs", "sshfs", "fuse.sshfs", "9p", "afs", "glusterfs", "ceph", "fuse.rclone"}
+
+def device_id(path: str) -> int:
+    """ 取得路徑所在裝置（尚不存在的路徑以最近的既有上層資料夾為準） """
+    path = os.path.abspath(path)
+    while True:
+        try:
+            return os.stat(path).st_dev
+        except OSError:
+            parent = os.path.dirname(path)
+            if parent == path:
+                return -1
+            path = parent
+
+def _linux_mounts() -> dict[str, tuple[str, str]]:
+    """ 讀取 /proc/self/mountinfo：{ "major:minor": (掛載點, 檔案系統類型) } """
+    mounts = {}
+    try:
+        with open("/proc/self/mountinfo", encoding="utf-8") as f:
+            for line in f:
+                fields, _, fs_fields = line.partition(" - ")
+                fields = fields.split()
+                if len(fields) >= 5 and fs_fields:
+                    mounts.setdefault(fields[2], (fields[4], fs_fields.split()[0]))
+    except OSError:
+        pass
+    return mounts
+
+def _linux_rotational(major: int, minor: int) -> bool | None:
+    """ 由 sysfs 判斷是否為傳統硬碟（分割區會往上找所屬磁碟） """
+    try:
+        block_dir = os.path.realpath(f"/sys/dev/block/{major}:{minor}")
+    except OSError:
+        return None
+    for candidate in (block_dir, os.path.dirname(block_dir)):
+        try:
+            with open(os.path.join(candidate, "queue", "rotational"), encoding="utf-8") as f:
+                return f.read().strip() == "1"
+        except OSError:
+            continue
+    return None
+
+def describe_devices(paths: dict[int, str]) -> dict[int, tuple[str, str]]:
+    """
+    取得裝置說明 { 裝置: (名稱, 類型) }，paths 為每個裝置的任一路徑
+    目前僅 Linux 能判斷類型，其他平台回傳 DEVICE_UNKNOWN
+    """
+    mounts = _linux_mounts() if sys.platform.startswith("linux") else {}
+    devices = {}
+    for dev, path in paths.items():
+        if dev < 0:
+            devices[dev] = (path, DEVICE_UNKNOWN)
+            continue
+        key = f"{os.major(dev)}:{os.minor(dev)}" if hasattr(os, "major") else ""
+        mount_point, fs_type = mounts.get(key, (os.path.splitdrive(os.path.abspath(path))[0] or path, ""))
+        if fs_type in _NETWORK_FS_TYPES:
+            kind = DEVICE_NETWORK
+        elif mounts:
+            rotational = _linux_rotational(os.major(dev), os.minor(dev))
+            kind = DEVICE_UNKNOWN if rotational is None else DEVICE_HDD if rotational else DEVICE_SSD
+        else:
+            kind = DEVICE_UNKNOWN
+        devices[dev] = (mount_point, kind)
+    return devices
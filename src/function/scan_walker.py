@@ -0,0 +1,105 @@
+from typing import Callable, Iterator
+import fnmatch
+import os
+import re
+
+# 檔案分類
+FILE_OTHER = 0
+FILE_ARCHIVE = 1
+FILE_IMAGE = 2
+FILE_COMICINFO = 3
+FILE_ALLOWED = 4
+
+ARCHIVE_EXTS = (".zip", ".cbz")
+
+class FileClassifier:
+    """ 以預先建立的副檔名查找表分類檔案 """
+    def __init__(self, image_exts: tuple[str, ...], allow_files: tuple[str, ...]):
+        # 分類順序同原本的判斷順序：壓縮檔 > 圖片 > ComicInfo.xml > 允許檔案
+        self.ext_table: dict[str, int] = {}
+        odd_image_exts = []
+        for ext in image_exts:
+            ext = ext.lower()
+            if ext.startswith(".") and ext.count(".") == 1:
+                self.ext_table[ext] = FILE_IMAGE
+            else:
+                odd_image_exts.append(ext) # 非單純副檔名，保留 endswith 判斷
+        for ext in ARCHIVE_EXTS:
+            self.ext_table[ext] = FILE_ARCHIVE
+        self.odd_image_exts = tuple(odd_image_exts)
+        self.allow_files = frozenset(allow_files)
+
+    def classify(self, name: str) -> int:
+        """ 分類檔案 """
+        lower_name = name.lower()
+        dot = lower_name.rfind(".")
+        kind = self.ext_table.get(lower_name[dot:]) if dot >= 0 else None
+        if kind is not None:
+            return kind
+        if self.odd_image_exts and lower_name.endswith(self.odd_image_exts):
+            return FILE_IMAGE
+        if lower_name == "comicinfo.xml":
+            return FILE_COMICINFO
+        if name in self.allow_files:
+            return FILE_ALLOWED
+        return FILE_OTHER
+
+def compile_ignore_patterns(patterns: list[str] | tuple[str, ...]) -> Callable[[str, str], bool] | None:
+    """
+    將忽略規則 ( glob ) 編譯為單一比對函式 (名稱, 相對路徑) -> 是否忽略
+    不含 / 的規則比對名稱，含 / 的規則比對以 / 分隔的相對路徑
+    """
+    name_patterns = [fnmatch.translate(p) for p in patterns if p and "/" not in p]
+    path_patterns = [fnmatch.translate(p.strip("/")) for p in patterns if p and "/" in p]
+    if not name_patterns and not path_patterns:
+        return None
+    name_match = re.compile("|".join(name_patterns), re.IGNORECASE).match if name_patterns else None
+    path_match = re.compile("|".join(path_patterns), re.IGNORECASE).match if path_patterns else None
+
+    def is_ignored(name: str, rel_path: str) -> bool:
+        if name_match and name_match(name):
+            return True
+        if path_match and path_match(rel_path.replace(os.sep, "/")):
+            return True
+        return False
+
+    return is_ignored
+
+def walk_comic_tree(
+    source_dir: str,
+    classifier: FileClassifier,
+    is_ignored: Callable[[str, str], bool] | None = None,
+) -> Iterator[tuple[str, bool, list[tuple[os.DirEntry, int]]]]:
+    """
+    以 os.scandir 走訪資料夾（順序同 os.walk 由上而下）
+    每個資料夾回傳 ( 相對路徑, 是否含子資料夾, [(檔案, 分類)] )；被忽略的項目整個略過，不會進入子樹
+    """
+    stack = [""]
+    while stack:
+        rel_root = stack.pop()
+        try:
+            with os.scandir(os.path.join(source_dir, rel_root) if rel_root else source_dir) as it:
+                entries = list(it)
+        except OSError:
+            continue # 同 os.walk 忽略無法讀取的資料夾
+
+        has_subdirs = False
+        subdirs = []
+        files = []
+        for entry in entries:
+            rel_path = os.path.join(rel_root, entry.name) if rel_root else entry.name
+            if is_ignored and is_ignored(entry.name, rel_path):
+                continue
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                has_subdirs = True
+                if not entry.is_symlink(): # 同 os.walk 不進入符號連結資料夾
+                    subdirs.append(rel_path)
+            else:
+                files.append((entry, classifier.classify(entry.name)))
+
+        yield rel_root or ".", has_subdirs, files
+        stack.extend(reversed(subdirs))
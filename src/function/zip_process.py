@@ -0,0 +1,366 @@
+from collections.abc import Iterable
+import os
+import shutil
+import struct
+import zipfile
+import zlib
+# 自訂庫
+from src.classes.memory_budget import MemoryLimitError
+
+# ZIP 結構定義
+_EOCD_SIGNATURE = b"PK\x05\x06"
+_EOCD_STRUCT = struct.Struct("<4sHHHHIIH")
+_ZIP64_LOCATOR_SIGNATURE = b"PK\x06\x07"
+_CENTRAL_DIR_SIGNATURE = b"PK\x01\x02"
+_CENTRAL_DIR_STRUCT = struct.Struct("<4sHHHHHHIIIHHHHHII")
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+_LOCAL_HEADER_STRUCT = struct.Struct("<4sHHHHHIIIHH")
+_MAX_COMMENT = 0xFFFF
+
+_FLAG_ENCRYPTED = 0x01
+_FLAG_DATA_DESCRIPTOR = 0x08
+_FLAG_UTF8 = 0x800
+
+_EXTRA_HEADER_STRUCT = struct.Struct("<HH")
+_ZIP64_EXTRA_ID = 0x0001
+
+_COMICINFO_NAME = b"comicinfo.xml"
+
+class ZipFastPathError(Exception):
+    """ 快速路徑無法處理的壓縮檔（zip64、加密、非常見壓縮方式等），應改用 zipfile """
+
+def _decode_name(raw: bytes, flags: int) -> str:
+    """ 依 zipfile 規則解碼檔名 """
+    return raw.decode("utf-8") if flags & _FLAG_UTF8 else raw.decode("cp437")
+
+def check_entry_size(name: str, size: int, max_size: int) -> None:
+    """ 讀入記憶體的項目不超過 max_size（0 為不限制） """
+    if max_size and size > max_size:
+        raise MemoryLimitError(f"{name} 需要 {size / (1024 * 1024):.1f} MB，超過單一工作記憶體上限 {max_size / (1024 * 1024):.0f} MB")
+
+def read_comicinfo_entry_fast(zip_path: str, max_size: int = 0) -> tuple[str, bytes] | None:
+    """
+    僅讀取中央目錄尋找 ComicInfo.xml（不為每個項目建立 ZipInfo）
+    回傳 ( 原始路徑, XML 內容 )，找不到時回傳 None；遇到非常見格式時拋出 ZipFastPathError
+    壓縮與解壓後的資料合計超過 max_size 時拋出 MemoryLimitError（0 為不限制）
+    """
+    with open(zip_path, "rb") as fp:
+        # 讀取 End of Central Directory
+        fp.seek(0, os.SEEK_END)
+        archive_size = fp.tell()
+        tail_size = min(archive_size, _EOCD_STRUCT.size + _MAX_COMMENT)
+        fp.seek(archive_size - tail_size)
+        tail = fp.read(tail_size)
+        eocd_pos = tail.rfind(_EOCD_SIGNATURE)
+        if eocd_pos < 0 or eocd_pos + _EOCD_STRUCT.size > len(tail):
+            raise ZipFastPathError("找不到 End of Central Directory")
+        (
+            _, disk_no, cd_disk_no, disk_entries, total_entries, cd_size, cd_offset, comment_len,
+        ) = _EOCD_STRUCT.unpack_from(tail, eocd_pos)
+        if eocd_pos + _EOCD_STRUCT.size + comment_len != len(tail):
+            raise ZipFastPathError("End of Central Directory 位置異常")
+        if disk_no != 0 or cd_disk_no != 0 or disk_entries != total_entries:
+            raise ZipFastPathError("不支援分割壓縮檔")
+        if 0xFFFF in (disk_entries, total_entries) or 0xFFFFFFFF in (cd_size, cd_offset):
+            raise ZipFastPathError("不支援 zip64")
+        if eocd_pos >= 20 and tail[eocd_pos - 20:eocd_pos - 16] == _ZIP64_LOCATOR_SIGNATURE:
+            raise ZipFastPathError("不支援 zip64")
+
+        # 前置資料（如自解壓檔）偏移
+        eocd_offset = archive_size - tail_size + eocd_pos
+        concat = eocd_offset - cd_size - cd_offset
+        if concat < 0:
+            raise ZipFastPathError("中央目錄位置異常")
+
+        # 讀取中央目錄
+        if eocd_offset - cd_size >= archive_size - tail_size:
+            central_dir = tail[eocd_pos - cd_size:eocd_pos]
+        else:
+            fp.seek(cd_offset + concat)
+            central_dir = fp.read(cd_size)
+        if len(central_dir) != cd_size:
+            raise ZipFastPathError("中央目錄長度異常")
+
+        # 整段轉小寫搜尋，沒有出現即可直接回傳
+        lowered = central_dir.lower()
+        match_pos = lowered.find(_COMICINFO_NAME)
+        if match_pos < 0:
+            return None
+
+        # 由命中位置回推所屬紀錄，取第一個以 comicinfo.xml 結尾的項目
+        header_size = _CENTRAL_DIR_STRUCT.size
+        while match_pos >= 0:
+            pos = central_dir.rfind(_CENTRAL_DIR_SIGNATURE, 0, match_pos)
+            if pos < 0 or pos + header_size > cd_size:
+                raise ZipFastPathError("中央目錄紀錄異常")
+            (
+                _, _, _, flags, method, _, _, crc, compress_size, file_size,
+                name_len, extra_len, comment_len, _, _, _, header_offset,
+            ) = _CENTRAL_DIR_STRUCT.unpack_from(central_dir, pos)
+            name_start = pos + header_size
+            name_end = name_start + name_len
+            record_end = name_end + extra_len + comment_len
+            if record_end > cd_size or (record_end < cd_size and central_dir[record_end:record_end + 4] != _CENTRAL_DIR_SIGNATURE):
+                raise ZipFastPathError("中央目錄紀錄異常")
+            if name_start <= match_pos and match_pos + len(_COMICINFO_NAME) == name_end:
+                raw_name = central_dir[name_start:name_end]
+                break
+            match_pos = lowered.find(_COMICINFO_NAME, match_pos + 1)
+        else:
+            return None
+
+        if 0xFFFFFFFF in (compress_size, file_size, header_offset):
+            raise ZipFastPathError("不支援 zip64")
+        if flags & _FLAG_ENCRYPTED:
+            raise ZipFastPathError("不支援加密項目")
+        if method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            raise ZipFastPathError("不支援的壓縮方式")
+        check_entry_size("ComicInfo.xml", compress_size + file_size, max_size)
+
+        # 讀取本地標頭與資料
+        fp.seek(header_offset + concat)
+        local_header = fp.read(_LOCAL_HEADER_STRUCT.size)
+        if len(local_header) != _LOCAL_HEADER_STRUCT.size or local_header[:4] != _LOCAL_HEADER_SIGNATURE:
+            raise ZipFastPathError("本地標頭異常")
+        local_name_len, local_extra_len = _LOCAL_HEADER_STRUCT.unpack(local_header)[9:]
+        fp.seek(local_name_len + local_extra_len, os.SEEK_CUR)
+        data = fp.read(compress_size)
+
+    if method == zipfile.ZIP_DEFLATED:
+        try:
+            decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+            data = decompressor.decompress(data) + decompressor.flush()
+        except zlib.error as e:
+            raise ZipFastPathError(f"解壓縮失敗：{e}")
+    if len(data) != file_size or zlib.crc32(data) != crc:
+        raise ZipFastPathError("CRC 驗證失敗")
+    try:
+        return _decode_name(raw_name, flags), data
+    except UnicodeDecodeError as e:
+        raise ZipFastPathError(f"檔名解碼失敗：{e}")
+
+def read_comicinfo_entry_zipfile(zip_path: str, max_size: int = 0) -> tuple[str, bytes] | None:
+    """ 以 zipfile 尋找並讀取 ComicInfo.xml（解壓後超過 max_size 時拋出 MemoryLimitError，0 為不限制） """
+    with zipfile.ZipFile(zip_path, 'r') as zf:
+        comicinfo_path = next(
+            (name for name in zf.namelist() if name.lower().endswith("comicinfo.xml")),
+            None
+        )
+
+        if not comicinfo_path:
+            return None
+        check_entry_size("ComicInfo.xml", zf.getinfo(comicinfo_path).file_size, max_size)
+
+        with zf.open(comicinfo_path) as f:
+            return comicinfo_path, f.read()
+
+def read_comicinfo_entry(zip_path: str, max_size: int = 0) -> tuple[str, bytes] | None:
+    """ 讀取壓縮檔內的 ComicInfo.xml（優先使用快速路徑；超過 max_size 時拋出 MemoryLimitError，0 為不限制） """
+    try:
+        return read_comicinfo_entry_fast(zip_path, max_size)
+    except ZipFastPathError:
+        return read_comicinfo_entry_zipfile(zip_path, max_size)
+
+COPY_BUFFER_SIZE = 1024 * 1024
+
+def _strip_zip64_extra(extra: bytes) -> bytes:
+    """ 移除 extra 欄位中的 zip64 資訊（寫入時由 zipfile 依實際大小重新產生） """
+    result = []
+    pos = 0
+    while pos + _EXTRA_HEADER_STRUCT.size <= len(extra):
+        header_id, size = _EXTRA_HEADER_STRUCT.unpack_from(extra, pos)
+        end = pos + _EXTRA_HEADER_STRUCT.size + size
+        if header_id != _ZIP64_EXTRA_ID:
+            result.append(extra[pos:end])
+        pos = end
+    return b"".join(result)
+
+def copy_entry_raw(
+    zin: zipfile.ZipFile,
+    zout: zipfile.ZipFile,
+    info: zipfile.ZipInfo,
+    arcname: str | None = None,
+    buffer_size: int = COPY_BUFFER_SIZE,
+) -> None:
+    """
+    直接複製項目的壓縮資料（不解壓縮再重新壓縮），保留原本的壓縮方式、CRC 與大小
+    以固定大小的緩衝分段複製；寫入前發現無法處理的項目時拋出 ZipFastPathError（此時尚未寫入任何資料）
+    """
+    # 讀取來源本地標頭，取得資料起點
+    with zin._lock:
+        zin.fp.seek(info.header_offset)
+        local_header = zin.fp.read(_LOCAL_HEADER_STRUCT.size)
+    if len(local_header) != _LOCAL_HEADER_STRUCT.size or local_header[:4] != _LOCAL_HEADER_SIGNATURE:
+        raise ZipFastPathError("本地標頭異常")
+    local_name_len, local_extra_len = _LOCAL_HEADER_STRUCT.unpack(local_header)[9:]
+    data_offset = info.header_offset + _LOCAL_HEADER_STRUCT.size + local_name_len + local_extra_len
+
+    zinfo = zipfile.ZipInfo(arcname if arcname is not None else info.filename, info.date_time)
+    zinfo.compress_type = info.compress_type
+    zinfo.comment = info.comment
+    zinfo.extra = _strip_zip64_extra(info.extra)
+    zinfo.create_system = info.create_system
+    zinfo.create_version = info.create_version
+    zinfo.extract_version = info.extract_version
+    zinfo.internal_attr = info.internal_attr
+    zinfo.external_attr = info.external_attr
+    zinfo.flag_bits = info.flag_bits & ~_FLAG_DATA_DESCRIPTOR # 大小已知，直接寫入本地標頭
+    zinfo.CRC = info.CRC
+    zinfo.compress_size = info.compress_size
+    zinfo.file_size = info.file_size
+
+    def chunks():
+        """ 分段讀取壓縮資料 """
+        remaining = info.compress_size
+        position = data_offset
+        while remaining > 0:
+            with zin._lock:
+                zin.fp.seek(position)
+                chunk = zin.fp.read(min(buffer_size, remaining))
+            if not chunk:
+                raise EOFError(f"{info.filename} 資料不完整")
+            yield chunk
+            position += len(chunk)
+            remaining -= len(chunk)
+
+    write_raw_entry(zout, zinfo, chunks())
+
+def write_raw_entry(zout: zipfile.ZipFile, zinfo: zipfile.ZipInfo, chunks: Iterable[bytes]) -> None:
+    """
+    寫入已壓縮的項目資料（zinfo 需已設定壓縮方式、CRC 與大小）
+    寫入前發現無法處理的項目時拋出 ZipFastPathError（此時尚未寫入任何資料）
+    """
+    with zout._lock:
+        if zout._writing:
+            raise ZipFastPathError("目標壓縮檔正在寫入其他項目")
+        try:
+            zout._writecheck(zinfo)
+        except NotImplementedError as e:
+            raise ZipFastPathError(f"不支援的壓縮方式：{e}")
+        zout._didModify = True
+        zinfo.header_offset = zout.fp.tell()
+        zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+        zout.fp.write(zinfo.FileHeader(zip64))
+        for chunk in chunks:
+            zout.fp.write(chunk)
+
+        zout.filelist.append(zinfo)
+        zout.NameToInfo[zinfo.filename] = zinfo
+        zout.start_dir = zout.fp.tell()
+
+def deflate_file(path: str, level: int, buffer_size: int = COPY_BUFFER_SIZE) -> tuple[bytes, int, int]:
+    """ 以 raw deflate 壓縮整個檔案，回傳 ( 壓縮資料, CRC, 原始大小 )（zlib 會釋放 GIL，可於多個執行緒同時執行） """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    parts = []
+    crc = 0
+    size = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(buffer_size):
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+            parts.append(compressor.compress(chunk))
+    parts.append(compressor.flush())
+    return b"".join(parts), crc, size
+
+def copy_entry(
+    zin: zipfile.ZipFile,
+    zout: zipfile.ZipFile,
+    info: zipfile.ZipInfo,
+    arcname: str | None = None,
+    buffer_size: int = COPY_BUFFER_SIZE,
+) -> None:
+    """ 複製壓縮檔項目（優先直接複製壓縮資料，否則解壓縮後串流寫入；記憶體用量不隨項目大小增加） """
+    try:
+        copy_entry_raw(zin, zout, info, arcname, buffer_size)
+    except ZipFastPathError:
+        zinfo = zipfile.ZipInfo(arcname if arcname is not None else info.filename, info.date_time)
+        zinfo.external_attr = info.external_attr
+        zinfo.file_size = info.file_size # 供判斷是否需要 zip64
+        with zin.open(info) as src, zout.open(zinfo, 'w', force_zip64=info.file_size > zipfile.ZIP64_LIMIT) as dst:
+            shutil.copyfileobj(src, dst, buffer_size)
+
+_DATA_DESCRIPTOR_SIZE = 16
+_ZIP64_DATA_DESCRIPTOR_SIZE = 24
+
+def zip_orphaned_bytes(zf: zipfile.ZipFile) -> int:
+    """ 估算資料區中不屬於任何項目的位元組數（追加寫入遺留的舊資料），以中央目錄資訊推算 """
+    used = 0
+    for info in zf.infolist():
+        used += _LOCAL_HEADER_STRUCT.size + len(info.filename.encode("utf-8")) + len(info.extra) + info.compress_size
+        if info.flag_bits & _FLAG_DATA_DESCRIPTOR:
+            used += _ZIP64_DATA_DESCRIPTOR_SIZE if info.compress_size > zipfile.ZIP64_LIMIT else _DATA_DESCRIPTOR_SIZE
+    return max(0, zf.start_dir - used) # 前置資料（如自解壓檔）也視為孤立資料
+
+APPEND_MARKER_SUFFIX = ".append" # 追加寫入進行中的標記檔（內容為追加前的檔案長度）
+
+def _archive_end(fp) -> int:
+    """ 最後一個 End of Central Directory（含註解）的結束位置，之後的資料不屬於壓縮檔 """
+    fp.seek(0, os.SEEK_END)
+    archive_size = fp.tell()
+    tail_size = min(archive_size, _EOCD_STRUCT.size + _MAX_COMMENT)
+    fp.seek(archive_size - tail_size)
+    tail = fp.read(tail_size)
+    eocd_pos = tail.rfind(_EOCD_SIGNATURE)
+    while eocd_pos >= 0:
+        if eocd_pos + _EOCD_STRUCT.size <= len(tail):
+            comment_len = _EOCD_STRUCT.unpack_from(tail, eocd_pos)[-1]
+            if eocd_pos + _EOCD_STRUCT.size + comment_len <= len(tail):
+                return archive_size - tail_size + eocd_pos + _EOCD_STRUCT.size + comment_len
+        eocd_pos = tail.rfind(_EOCD_SIGNATURE, 0, eocd_pos)
+    raise zipfile.BadZipFile("找不到 End of Central Directory")
+
+def recover_interrupted_append(zip_path: str) -> bool:
+    """ 中斷的追加寫入：截斷回追加前的長度（舊中央目錄仍完整），回傳是否有復原 """
+    marker_path = zip_path + APPEND_MARKER_SUFFIX
+    try:
+        with open(marker_path, encoding="ascii") as f:
+            original_size = int(f.read())
+    except FileNotFoundError:
+        return False
+    except (OSError, ValueError):
+        os.remove(marker_path) # 標記本身沒寫完，此時尚未開始追加
+        return False
+    with open(zip_path, "r+b") as fp:
+        if os.fstat(fp.fileno()).st_size > original_size:
+            fp.truncate(original_size)
+            os.fsync(fp.fileno())
+    os.remove(marker_path)
+    return True
+
+def append_comicinfo(zip_path: str, xml: bytes, comicinfo_path: str = "ComicInfo.xml") -> None:
+    """
+    追加寫入 ComicInfo.xml：新項目、新中央目錄與 End of Central Directory 接在原壓縮檔結尾之後
+    原本的中央目錄不被覆寫，新目錄寫入並 fsync 前壓縮檔都能以舊目錄讀取；舊目錄與舊 ComicInfo.xml 成為孤立區段（待整理時回收）
+    追加前先寫入標記檔記錄原長度，寫入失敗時截斷回原長度；程式中斷時由 recover_interrupted_append 復原
+    壓縮檔中沒有 ComicInfo.xml 時寫入根目錄
+    """
+    recover_interrupted_append(zip_path)
+    if not zipfile.is_zipfile(zip_path):
+        raise zipfile.BadZipFile(f"不是有效的壓縮檔：{zip_path}") # 避免 'a' 模式在檔案尾端另建壓縮檔
+
+    marker_path = zip_path + APPEND_MARKER_SUFFIX
+    with open(zip_path, "r+b") as fp:
+        archive_end = _archive_end(fp)
+        with open(marker_path, "w", encoding="ascii") as marker:
+            marker.write(str(archive_end))
+            marker.flush()
+            os.fsync(marker.fileno())
+        try:
+            with zipfile.ZipFile(fp, "a", zipfile.ZIP_STORED) as zf:
+                old_infos = [info for info in zf.filelist if info.filename.lower().endswith("comicinfo.xml")]
+                if not old_infos:
+                    comicinfo_path = "ComicInfo.xml"
+                zf.filelist = [info for info in zf.filelist if info not in old_infos]
+                zf.NameToInfo = {info.filename: info for info in zf.filelist}
+                zf.start_dir = archive_end # 新項目寫在原壓縮檔之後
+                zf.writestr(comicinfo_path, xml)
+            fp.flush()
+            os.fsync(fp.fileno())
+        except BaseException:
+            # 截斷回原長度（原中央目錄未被改動）
+            fp.truncate(archive_end)
+            fp.flush()
+            os.fsync(fp.fileno())
+            os.remove(marker_path)
+            raise
+    os.remove(marker_path)
@@ -1,11 +1,14 @@
 from PySide6.QtCore import QObject, Signal
 from typing import Dict
 
-class _WriteFileSignal(QObject):
-    """ 介面變更訊號 """
-    inPlace = Signal(str, str, dict)
-    flatten = Signal(str, str, dict)
-    writeFolderToZip = Signal(str, str, dict)
+class _BatchSignals(QObject):
+    """ 批次寫入訊號 """
+    started = Signal(int) # 工作數
+    jobStarted = Signal(object) # WriteJob
+    jobFinished = Signal(object) # WriteResult
+    jobVerified = Signal(object) # VerifyResult
+    finished = Signal(object) # 統計 dict
+    planned = Signal(object) # 預估 dict（見 batch_planner.plan_jobs）
 
     def __init__(self):
         super().__init__()
@@ -17,6 +20,7 @@ class _UiSignal(QObject):
     setProgressBar = Signal(int, int)
     sendCritical = Signal(str, str)
     sendInformation = Signal(str, str)
+    askResumeBatch = Signal(int, int) # (已完成, 總數)
     retranslateUi = Signal()
     comicListSelectRows = Signal(list)
 
@@ -27,9 +31,28 @@ class _AppSettingSignals(QObject):
     """ 應用設定訊號 """
     fontSizeChanged = Signal(int)
     writeModeChanged = Signal(int)
+    folderWriteModeChanged = Signal(int)
+    compressionProfileChanged = Signal(int)
+    compressionLevelChanged = Signal(int)
+    storedExtsChanged = Signal(list)
+    compactThresholdChanged = Signal(int)
+    skipUnchangedChanged = Signal(bool)
+    patchComicinfoChanged = Signal(bool)
+    verifyModeChanged = Signal(int)
+    copyBufferSizeChanged = Signal(int)
+    jobMemoryLimitChanged = Signal(int)
     imageExtChanged = Signal(list)
     allowFilesChanged = Signal(list)
+    ignorePatternsChanged = Signal(list)
+    filenamePatternChanged = Signal(str)
     langChanged = Signal(str)
+    scanWorkersChanged = Signal(int)
+    batchWorkersChanged = Signal(int)
+    hddWorkersChanged = Signal(int)
+    networkWorkersChanged = Signal(int)
+    readQueueDepthChanged = Signal(int)
+    writeQueueDepthChanged = Signal(int)
+    watchModeChanged = Signal(int)
 
     def __init__(self):
         super().__init__()
@@ -40,6 +63,8 @@ class _DataChangeSignals(QObject):
     outputDirChanged = Signal(str)
     outputExtChanged = Signal(str)
     fileListChanged = Signal(list)
+    fileListAboutToAppend = Signal(int)
+    fileListAppended = Signal(int)
     fileMetadataCacheChanged = Signal(dict)
 
     def __init__(self):
@@ -48,6 +73,8 @@ class _DataChangeSignals(QObject):
 class _SignalBus(QObject):
     """ 信號總線 """
     fileReadReady = Signal()
+    scanProgress = Signal(dict)
+    aboutToQuit = Signal()
     comicListSort = Signal(int)
     selectedComicPath = Signal(list)
     requireInfoEditorInput = Signal()
@@ -55,12 +82,15 @@ class _SignalBus(QObject):
     requireSelectedComic = Signal()
     returnSelectedComic = Signal(dict)
     startProcess = Signal()
+    startDryRun = Signal()
+    appStarted = Signal()
+    resumeBatch = Signal(bool) # 是否接續中斷的批次
 
     def __init__(self):
         super().__init__()
         self.appSetting = _AppSettingSignals()
         self.dataChange = _DataChangeSignals()
         self.ui = _UiSignal()
-        self.writeFile = _WriteFileSignal()
+        self.batch = _BatchSignals()
 
 SIGNAL_BUS = _SignalBus()
@@ -83,9 +83,40 @@ class _tr:
             "寫入模式：": LazyStr("寫入模式：", "ui_constants"),
             "原位置寫入": LazyStr("原位置寫入", "ui_constants"),
             "鋪平寫入": LazyStr("鋪平寫入", "ui_constants"),
+            "追加寫入": LazyStr("追加寫入", "ui_constants"),
+            "資料夾寫入模式：": LazyStr("資料夾寫入模式：", "ui_constants"),
+            "打包為壓縮檔": LazyStr("打包為壓縮檔", "ui_constants"),
+            "僅寫入 ComicInfo.xml": LazyStr("僅寫入 ComicInfo.xml", "ui_constants"),
+            "打包壓縮：": LazyStr("打包壓縮：", "ui_constants"),
+            "不壓縮": LazyStr("不壓縮", "ui_constants"),
+            "全部壓縮": LazyStr("全部壓縮", "ui_constants"),
+            "依副檔名壓縮": LazyStr("依副檔名壓縮", "ui_constants"),
+            "壓縮等級：": LazyStr("壓縮等級：", "ui_constants"),
+            "不壓縮副檔名：": LazyStr("不壓縮副檔名：", "ui_constants"),
+            "整理門檻（%）：": LazyStr("整理門檻（%）：", "ui_constants"),
+            "略過未變更的檔案": LazyStr("略過未變更的檔案", "ui_constants"),
+            "保留 ComicInfo 原始格式（只修改有變更的欄位）": LazyStr("保留 ComicInfo 原始格式（只修改有變更的欄位）", "ui_constants"),
+            "輸出驗證：": LazyStr("輸出驗證：", "ui_constants"),
+            "抽樣檢查": LazyStr("抽樣檢查", "ui_constants"),
+            "完整檢查": LazyStr("完整檢查", "ui_constants"),
+            "複製緩衝（KB）：": LazyStr("複製緩衝（KB）：", "ui_constants"),
+            "單一工作記憶體上限（MB）：": LazyStr("單一工作記憶體上限（MB）：", "ui_constants"),
             "圖片附檔名：": LazyStr("圖片附檔名：", "ui_constants"),
             "允許檔案：": LazyStr("允許檔案：", "ui_constants"),
+            "忽略項目：": LazyStr("忽略項目：", "ui_constants"),
+            "檔名規則：": LazyStr("檔名規則：", "ui_constants"),
+            "正規表示式，編輯欄位中以 {match:1} 或 {match:名稱} 取用擷取群組": LazyStr("正規表示式，編輯欄位中以 {match:1} 或 {match:名稱} 取用擷取群組", "ui_constants"),
             "語言選擇：": LazyStr("語言選擇：", "ui_constants"),
+            "讀取執行緒數：": LazyStr("讀取執行緒數：", "ui_constants"),
+            "批次處理執行緒數：": LazyStr("批次處理執行緒數：", "ui_constants"),
+            "傳統硬碟並行數：": LazyStr("傳統硬碟並行數：", "ui_constants"),
+            "網路磁碟並行數：": LazyStr("網路磁碟並行數：", "ui_constants"),
+            "預讀深度：": LazyStr("預讀深度：", "ui_constants"),
+            "寫入佇列深度：": LazyStr("寫入佇列深度：", "ui_constants"),
+            "監看模式：": LazyStr("監看模式：", "ui_constants"),
+            "關閉": LazyStr("關閉", "ui_constants"),
+            "檔案系統通知": LazyStr("檔案系統通知", "ui_constants"),
+            "定時輪詢": LazyStr("定時輪詢", "ui_constants"),
             # comics_list_tab
             "選擇漫畫資料夾": LazyStr("選擇漫畫資料夾", "ui_constants"),
             "尚未選擇": LazyStr("尚未選擇", "ui_constants"),
@@ -98,6 +129,14 @@ class _tr:
             "尚未選擇": LazyStr("尚未選擇", "ui_constants"),
             "輸出副檔名：": LazyStr("輸出副檔名：", "ui_constants"),
             "開始處理": LazyStr("開始處理", "ui_constants"),
+            "掃描中… 資料夾 {dirs} / 壓縮檔 {archives}（共 {size} MB）": LazyStr("掃描中… 資料夾 {dirs} / 壓縮檔 {archives}（共 {size} MB）", "ui_constants"),
+            "預估": LazyStr("預估", "ui_constants"),
+            "直接複製": LazyStr("直接複製", "ui_constants"),
+            "略過": LazyStr("略過", "ui_constants"),
+            "未知": LazyStr("未知", "ui_constants"),
+            "預估：{paths}｜讀取 {read} MB，寫入 {written} MB，約需 {time}": LazyStr("預估：{paths}｜讀取 {read} MB，寫入 {written} MB，約需 {time}", "ui_constants"),
+            "{device} 空間不足：需要 {required} MB，剩餘 {free} MB": LazyStr("{device} 空間不足：需要 {required} MB，剩餘 {free} MB", "ui_constants"),
+            "{errors} 個檔案無法讀取": LazyStr("{errors} 個檔案無法讀取", "ui_constants"),
             "選擇漫畫資料夾": LazyStr("選擇漫畫資料夾", "ui_constants"),
             "選擇輸出資料夾": LazyStr("選擇輸出資料夾", "ui_constants"),
         }
@@ -110,6 +149,10 @@ class _tr:
             "請選擇漫畫資料夾": LazyStr("請選擇漫畫資料夾", "send_message"),
             "請至少選擇一個檔案進行處理": LazyStr("請至少選擇一個檔案進行處理", "send_message"),
             "所有漫畫處理完成！": LazyStr("所有漫畫處理完成！", "send_message"),
+            "批次處理進行中": LazyStr("批次處理進行中", "send_message"),
+            "上次的批次處理未完成（已完成 {done} / {total} 個檔案），是否繼續處理剩餘的檔案？": LazyStr("上次的批次處理未完成（已完成 {done} / {total} 個檔案），是否繼續處理剩餘的檔案？", "send_message"),
+            "處理完成，{failed} / {total} 個檔案失敗": LazyStr("處理完成，{failed} / {total} 個檔案失敗", "send_message"),
+            "{verify_failed} 個輸出檔驗證失敗": LazyStr("{verify_failed} 個輸出檔驗證失敗", "send_message"),
         }
 
         # 固定
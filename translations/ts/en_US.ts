@@ -1,339 +1,511 @@
-<?xml version="1.0" encoding="utf-8"?>
-<!DOCTYPE TS>
-<TS version="2.1">
-<context>
-    <name>schema_config</name>
-    <message>
-        <source>書籍資訊</source>
-        <translation>Book Info</translation>
-    </message>
-    <message>
-        <source>標題</source>
-        <translation>Title</translation>
-    </message>
-    <message>
-        <source>系列名稱</source>
-        <translation>Series Name</translation>
-    </message>
-    <message>
-        <source>系列分組</source>
-        <translation>Series Group</translation>
-    </message>
-    <message>
-        <source>風格類型</source>
-        <translation>Genre</translation>
-    </message>
-    <message>
-        <source>集數編號</source>
-        <translation>Issue Number</translation>
-    </message>
-    <message>
-        <source>總集數</source>
-        <translation>Total Issues</translation>
-    </message>
-    <message>
-        <source>卷/冊號</source>
-        <translation>Volume</translation>
-    </message>
-    <message>
-        <source>頁數</source>
-        <translation>Page Count</translation>
-    </message>
-    <message>
-        <source>格式描述</source>
-        <translation>Format</translation>
-    </message>
-    <message>
-        <source>語言 (ISO 639)</source>
-        <translation>Language (ISO 639)</translation>
-    </message>
-    <message>
-        <source>替代版本</source>
-        <translation>Alternate Version</translation>
-    </message>
-    <message>
-        <source>替代系列名稱</source>
-        <translation>Alternate Series Name</translation>
-    </message>
-    <message>
-        <source>替代集數</source>
-        <translation>Alternate Number</translation>
-    </message>
-    <message>
-        <source>替代總集數</source>
-        <translation>Alternate Count</translation>
-    </message>
-    <message>
-        <source>內容摘要</source>
-        <translation>Summary</translation>
-    </message>
-    <message>
-        <source>簡介</source>
-        <translation>Description</translation>
-    </message>
-    <message>
-        <source>備註</source>
-        <translation>Notes</translation>
-    </message>
-    <message>
-        <source>評論</source>
-        <translation>Review</translation>
-    </message>
-    <message>
-        <source>角色與劇情</source>
-        <translation>Characters &amp; Plot</translation>
-    </message>
-    <message>
-        <source>登場角色</source>
-        <translation>Characters</translation>
-    </message>
-    <message>
-        <source>主角或主團隊</source>
-        <translation>Main Character / Team</translation>
-    </message>
-    <message>
-        <source>故事主軸</source>
-        <translation>Story Arc</translation>
-    </message>
-    <message>
-        <source>地點</source>
-        <translation>Locations</translation>
-    </message>
-    <message>
-        <source>出場團隊</source>
-        <translation>Teams</translation>
-    </message>
-    <message>
-        <source>內容屬性</source>
-        <translation>Content Attributes</translation>
-    </message>
-    <message>
-        <source>黑白色彩</source>
-        <translation>Black &amp; White</translation>
-    </message>
-    <message>
-        <source>是否為漫畫</source>
-        <translation>Is Manga</translation>
-    </message>
-    <message>
-        <source>年齡分級</source>
-        <translation>Age Rating</translation>
-    </message>
-    <message>
-        <source>創作團隊</source>
-        <translation>Creative Team</translation>
-    </message>
-    <message>
-        <source>作者</source>
-        <translation>Writer</translation>
-    </message>
-    <message>
-        <source>畫者 (鉛筆)</source>
-        <translation>Penciller</translation>
-    </message>
-    <message>
-        <source>墨線師</source>
-        <translation>Inker</translation>
-    </message>
-    <message>
-        <source>上色師</source>
-        <translation>Colorist</translation>
-    </message>
-    <message>
-        <source>字體設計</source>
-        <translation>Letterer</translation>
-    </message>
-    <message>
-        <source>封面設計</source>
-        <translation>Cover Artist</translation>
-    </message>
-    <message>
-        <source>編輯</source>
-        <translation>Editor</translation>
-    </message>
-    <message>
-        <source>出版資訊</source>
-        <translation>Publishing Info</translation>
-    </message>
-    <message>
-        <source>出版社</source>
-        <translation>Publisher</translation>
-    </message>
-    <message>
-        <source>品牌 / 出版系列</source>
-        <translation>Imprint / Label</translation>
-    </message>
-    <message>
-        <source>網站</source>
-        <translation>Website</translation>
-    </message>
-    <message>
-        <source>出版年</source>
-        <translation>Year</translation>
-    </message>
-    <message>
-        <source>出版月</source>
-        <translation>Month</translation>
-    </message>
-    <message>
-        <source>出版日</source>
-        <translation>Day</translation>
-    </message>
-    <message>
-        <source>掃描資訊</source>
-        <translation>Scan Info</translation>
-    </message>
-</context>
-<context>
-    <name>send_message</name>
-    <message>
-        <source>錯誤</source>
-        <translation>Error</translation>
-    </message>
-    <message>
-        <source>提示</source>
-        <translation>Notice</translation>
-    </message>
-    <message>
-        <source>完成</source>
-        <translation>Done</translation>
-    </message>
-    <message>
-        <source>請選擇輸出資料夾</source>
-        <translation>Please select an output folder</translation>
-    </message>
-    <message>
-        <source>請選擇漫畫資料夾</source>
-        <translation>Please select a comics folder</translation>
-    </message>
-    <message>
-        <source>請至少選擇一個檔案進行處理</source>
-        <translation>Please select at least one file to process</translation>
-    </message>
-    <message>
-        <source>所有漫畫處理完成！</source>
-        <translation>All comics processed!</translation>
-    </message>
-</context>
-<context>
-    <name>ui_constants</name>
-    <message>
-        <source>ComicInfo 編輯器</source>
-        <translation>ComicInfo Editor</translation>
-    </message>
-    <message>
-        <source>列表</source>
-        <translation>List</translation>
-    </message>
-    <message>
-        <source>編輯</source>
-        <translation>Edit</translation>
-    </message>
-    <message>
-        <source>設定</source>
-        <translation>Settings</translation>
-    </message>
-    <message>
-        <source>關於</source>
-        <translation>About</translation>
-    </message>
-    <message>
-        <source>👻 作者資訊</source>
-        <translation>👻 Author Info</translation>
-    </message>
-    <message>
-        <source>逍遙 ( Xiao Yao )
-觀繁花而不與其爭艷
-處江湖而不染其煙塵</source>
-        <translation>逍遙 ( Xiao Yao )
-觀繁花而不與其爭艷
-處江湖而不染其煙塵</translation>
-    </message>
-    <message>
-        <source>作者 Github 連結</source>
-        <translation>Author GitHub Link</translation>
-    </message>
-    <message>
-        <source>📦 軟體資訊</source>
-        <translation>📦 Software Info</translation>
-    </message>
-    <message>
-        <source>版本: {version}
-一款用於編輯漫畫 ComicInfo 的編輯器</source>
-        <translation>Version: {version}  
-A tool for editing ComicInfo metadata</translation>
-    </message>
-    <message>
-        <source>GitHub 專案連結</source>
-        <translation>GitHub Project Link</translation>
-    </message>
-    <message>
-        <source>字體大小：</source>
-        <translation>Font Size:</translation>
-    </message>
-    <message>
-        <source>寫入模式：</source>
-        <translation>Write Mode:</translation>
-    </message>
-    <message>
-        <source>原位置寫入</source>
-        <translation>Write In Place</translation>
-    </message>
-    <message>
-        <source>鋪平寫入</source>
-        <translation>Flatten and Write</translation>
-    </message>
-    <message>
-        <source>圖片附檔名：</source>
-        <translation>Image Extensions:</translation>
-    </message>
-    <message>
-        <source>允許檔案：</source>
-        <translation>Allowed Files:</translation>
-    </message>
-    <message>
-        <source>選擇漫畫資料夾</source>
-        <translation>Select Comic Folder</translation>
-    </message>
-    <message>
-        <source>尚未選擇</source>
-        <translation>Not Selected</translation>
-    </message>
-    <message>
-        <source>手動</source>
-        <translation>Manual</translation>
-    </message>
-    <message>
-        <source>檔名</source>
-        <translation>Filename</translation>
-    </message>
-    <message>
-        <source>編號</source>
-        <translation>Index</translation>
-    </message>
-    <message>
-        <source>排序依據：</source>
-        <translation>Sort By:</translation>
-    </message>
-    <message>
-        <source>已選中 {selected} / 共 {total} 本漫畫</source>
-        <translation>Selected {selected} / Total {total} Comics</translation>
-    </message>
-    <message>
-        <source>選擇輸出資料夾</source>
-        <translation>Select Output Folder</translation>
-    </message>
-    <message>
-        <source>輸出副檔名：</source>
-        <translation>Output Extension:</translation>
-    </message>
-    <message>
-        <source>開始處理</source>
-        <translation>Start Processing</translation>
-    </message>
-    <message>
-        <source>語言選擇：</source>
-        <translation>language:</translation>
-    </message>
-</context>
-</TS>
+<?xml version="1.0" encoding="utf-8"?>
+<!DOCTYPE TS>
+<TS version="2.1">
+<context>
+    <name>schema_config</name>
+    <message>
+        <source>書籍資訊</source>
+        <translation>Book Info</translation>
+    </message>
+    <message>
+        <source>標題</source>
+        <translation>Title</translation>
+    </message>
+    <message>
+        <source>系列名稱</source>
+        <translation>Series Name</translation>
+    </message>
+    <message>
+        <source>系列分組</source>
+        <translation>Series Group</translation>
+    </message>
+    <message>
+        <source>風格類型</source>
+        <translation>Genre</translation>
+    </message>
+    <message>
+        <source>集數編號</source>
+        <translation>Issue Number</translation>
+    </message>
+    <message>
+        <source>總集數</source>
+        <translation>Total Issues</translation>
+    </message>
+    <message>
+        <source>卷/冊號</source>
+        <translation>Volume</translation>
+    </message>
+    <message>
+        <source>頁數</source>
+        <translation>Page Count</translation>
+    </message>
+    <message>
+        <source>格式描述</source>
+        <translation>Format</translation>
+    </message>
+    <message>
+        <source>語言 (ISO 639)</source>
+        <translation>Language (ISO 639)</translation>
+    </message>
+    <message>
+        <source>替代版本</source>
+        <translation>Alternate Version</translation>
+    </message>
+    <message>
+        <source>替代系列名稱</source>
+        <translation>Alternate Series Name</translation>
+    </message>
+    <message>
+        <source>替代集數</source>
+        <translation>Alternate Number</translation>
+    </message>
+    <message>
+        <source>替代總集數</source>
+        <translation>Alternate Count</translation>
+    </message>
+    <message>
+        <source>內容摘要</source>
+        <translation>Summary</translation>
+    </message>
+    <message>
+        <source>簡介</source>
+        <translation>Description</translation>
+    </message>
+    <message>
+        <source>備註</source>
+        <translation>Notes</translation>
+    </message>
+    <message>
+        <source>評論</source>
+        <translation>Review</translation>
+    </message>
+    <message>
+        <source>角色與劇情</source>
+        <translation>Characters &amp; Plot</translation>
+    </message>
+    <message>
+        <source>登場角色</source>
+        <translation>Characters</translation>
+    </message>
+    <message>
+        <source>主角或主團隊</source>
+        <translation>Main Character / Team</translation>
+    </message>
+    <message>
+        <source>故事主軸</source>
+        <translation>Story Arc</translation>
+    </message>
+    <message>
+        <source>地點</source>
+        <translation>Locations</translation>
+    </message>
+    <message>
+        <source>出場團隊</source>
+        <translation>Teams</translation>
+    </message>
+    <message>
+        <source>內容屬性</source>
+        <translation>Content Attributes</translation>
+    </message>
+    <message>
+        <source>黑白色彩</source>
+        <translation>Black &amp; White</translation>
+    </message>
+    <message>
+        <source>是否為漫畫</source>
+        <translation>Is Manga</translation>
+    </message>
+    <message>
+        <source>年齡分級</source>
+        <translation>Age Rating</translation>
+    </message>
+    <message>
+        <source>創作團隊</source>
+        <translation>Creative Team</translation>
+    </message>
+    <message>
+        <source>作者</source>
+        <translation>Writer</translation>
+    </message>
+    <message>
+        <source>畫者 (鉛筆)</source>
+        <translation>Penciller</translation>
+    </message>
+    <message>
+        <source>墨線師</source>
+        <translation>Inker</translation>
+    </message>
+    <message>
+        <source>上色師</source>
+        <translation>Colorist</translation>
+    </message>
+    <message>
+        <source>字體設計</source>
+        <translation>Letterer</translation>
+    </message>
+    <message>
+        <source>封面設計</source>
+        <translation>Cover Artist</translation>
+    </message>
+    <message>
+        <source>編輯</source>
+        <translation>Editor</translation>
+    </message>
+    <message>
+        <source>出版資訊</source>
+        <translation>Publishing Info</translation>
+    </message>
+    <message>
+        <source>出版社</source>
+        <translation>Publisher</translation>
+    </message>
+    <message>
+        <source>品牌 / 出版系列</source>
+        <translation>Imprint / Label</translation>
+    </message>
+    <message>
+        <source>網站</source>
+        <translation>Website</translation>
+    </message>
+    <message>
+        <source>出版年</source>
+        <translation>Year</translation>
+    </message>
+    <message>
+        <source>出版月</source>
+        <translation>Month</translation>
+    </message>
+    <message>
+        <source>出版日</source>
+        <translation>Day</translation>
+    </message>
+    <message>
+        <source>掃描資訊</source>
+        <translation>Scan Info</translation>
+    </message>
+</context>
+<context>
+    <name>send_message</name>
+    <message>
+        <source>錯誤</source>
+        <translation>Error</translation>
+    </message>
+    <message>
+        <source>提示</source>
+        <translation>Notice</translation>
+    </message>
+    <message>
+        <source>完成</source>
+        <translation>Done</translation>
+    </message>
+    <message>
+        <source>請選擇輸出資料夾</source>
+        <translation>Please select an output folder</translation>
+    </message>
+    <message>
+        <source>請選擇漫畫資料夾</source>
+        <translation>Please select a comics folder</translation>
+    </message>
+    <message>
+        <source>請至少選擇一個檔案進行處理</source>
+        <translation>Please select at least one file to process</translation>
+    </message>
+    <message>
+        <source>所有漫畫處理完成！</source>
+        <translation>All comics processed!</translation>
+    </message>
+    <message>
+        <source>批次處理進行中</source>
+        <translation>A batch is already running</translation>
+    </message>
+    <message>
+        <source>處理完成，{failed} / {total} 個檔案失敗</source>
+        <translation>Finished: {failed} of {total} files failed</translation>
+    </message>
+    <message>
+        <source>上次的批次處理未完成（已完成 {done} / {total} 個檔案），是否繼續處理剩餘的檔案？</source>
+        <translation>The last batch did not finish ({done} / {total} files done). Continue with the remaining files?</translation>
+    </message>
+    <message>
+        <source>{verify_failed} 個輸出檔驗證失敗</source>
+        <translation>{verify_failed} output files failed verification</translation>
+    </message>
+</context>
+<context>
+    <name>ui_constants</name>
+    <message>
+        <source>ComicInfo 編輯器</source>
+        <translation>ComicInfo Editor</translation>
+    </message>
+    <message>
+        <source>列表</source>
+        <translation>List</translation>
+    </message>
+    <message>
+        <source>編輯</source>
+        <translation>Edit</translation>
+    </message>
+    <message>
+        <source>設定</source>
+        <translation>Settings</translation>
+    </message>
+    <message>
+        <source>關於</source>
+        <translation>About</translation>
+    </message>
+    <message>
+        <source>👻 作者資訊</source>
+        <translation>👻 Author Info</translation>
+    </message>
+    <message>
+        <source>逍遙 ( Xiao Yao )
+觀繁花而不與其爭艷
+處江湖而不染其煙塵</source>
+        <translation>逍遙 ( Xiao Yao )
+觀繁花而不與其爭艷
+處江湖而不染其煙塵</translation>
+    </message>
+    <message>
+        <source>作者 Github 連結</source>
+        <translation>Author GitHub Link</translation>
+    </message>
+    <message>
+        <source>📦 軟體資訊</source>
+        <translation>📦 Software Info</translation>
+    </message>
+    <message>
+        <source>版本: {version}
+一款用於編輯漫畫 ComicInfo 的編輯器</source>
+        <translation>Version: {version}  
+A tool for editing ComicInfo metadata</translation>
+    </message>
+    <message>
+        <source>GitHub 專案連結</source>
+        <translation>GitHub Project Link</translation>
+    </message>
+    <message>
+        <source>字體大小：</source>
+        <translation>Font Size:</translation>
+    </message>
+    <message>
+        <source>寫入模式：</source>
+        <translation>Write Mode:</translation>
+    </message>
+    <message>
+        <source>原位置寫入</source>
+        <translation>Write In Place</translation>
+    </message>
+    <message>
+        <source>鋪平寫入</source>
+        <translation>Flatten and Write</translation>
+    </message>
+    <message>
+        <source>圖片附檔名：</source>
+        <translation>Image Extensions:</translation>
+    </message>
+    <message>
+        <source>允許檔案：</source>
+        <translation>Allowed Files:</translation>
+    </message>
+    <message>
+        <source>選擇漫畫資料夾</source>
+        <translation>Select Comic Folder</translation>
+    </message>
+    <message>
+        <source>尚未選擇</source>
+        <translation>Not Selected</translation>
+    </message>
+    <message>
+        <source>手動</source>
+        <translation>Manual</translation>
+    </message>
+    <message>
+        <source>檔名</source>
+        <translation>Filename</translation>
+    </message>
+    <message>
+        <source>編號</source>
+        <translation>Index</translation>
+    </message>
+    <message>
+        <source>排序依據：</source>
+        <translation>Sort By:</translation>
+    </message>
+    <message>
+        <source>已選中 {selected} / 共 {total} 本漫畫</source>
+        <translation>Selected {selected} / Total {total} Comics</translation>
+    </message>
+    <message>
+        <source>選擇輸出資料夾</source>
+        <translation>Select Output Folder</translation>
+    </message>
+    <message>
+        <source>輸出副檔名：</source>
+        <translation>Output Extension:</translation>
+    </message>
+    <message>
+        <source>開始處理</source>
+        <translation>Start Processing</translation>
+    </message>
+    <message>
+        <source>語言選擇：</source>
+        <translation>language:</translation>
+    </message>
+    <message>
+        <source>讀取執行緒數：</source>
+        <translation>Scan Threads:</translation>
+    </message>
+    <message>
+        <source>掃描中… 資料夾 {dirs} / 壓縮檔 {archives}（共 {size} MB）</source>
+        <translation>Scanning… folders {dirs} / archives {archives} ({size} MB total)</translation>
+    </message>
+    <message>
+        <source>忽略項目：</source>
+        <translation>Ignore Patterns:</translation>
+    </message>
+    <message>
+        <source>監看模式：</source>
+        <translation>Watch Mode:</translation>
+    </message>
+    <message>
+        <source>關閉</source>
+        <translation>Off</translation>
+    </message>
+    <message>
+        <source>檔案系統通知</source>
+        <translation>File System Notifications</translation>
+    </message>
+    <message>
+        <source>定時輪詢</source>
+        <translation>Periodic Polling</translation>
+    </message>
+    <message>
+        <source>追加寫入</source>
+        <translation>Append Write</translation>
+    </message>
+    <message>
+        <source>整理門檻（%）：</source>
+        <translation>Compaction Threshold (%):</translation>
+    </message>
+    <message>
+        <source>複製緩衝（KB）：</source>
+        <translation>Copy Buffer (KB):</translation>
+    </message>
+    <message>
+        <source>單一工作記憶體上限（MB）：</source>
+        <translation>Per-Job Memory Limit (MB):</translation>
+    </message>
+    <message>
+        <source>批次處理執行緒數：</source>
+        <translation>Batch Workers:</translation>
+    </message>
+    <message>
+        <source>略過未變更的檔案</source>
+        <translation>Skip unchanged files</translation>
+    </message>
+    <message>
+        <source>資料夾寫入模式：</source>
+        <translation>Folder Write Mode:</translation>
+    </message>
+    <message>
+        <source>打包為壓縮檔</source>
+        <translation>Pack into archive</translation>
+    </message>
+    <message>
+        <source>僅寫入 ComicInfo.xml</source>
+        <translation>Write ComicInfo.xml only</translation>
+    </message>
+    <message>
+        <source>傳統硬碟並行數：</source>
+        <translation>HDD concurrency:</translation>
+    </message>
+    <message>
+        <source>網路磁碟並行數：</source>
+        <translation>Network drive concurrency:</translation>
+    </message>
+    <message>
+        <source>預估</source>
+        <translation>Dry run</translation>
+    </message>
+    <message>
+        <source>直接複製</source>
+        <translation>Copy</translation>
+    </message>
+    <message>
+        <source>略過</source>
+        <translation>Skip</translation>
+    </message>
+    <message>
+        <source>未知</source>
+        <translation>unknown</translation>
+    </message>
+    <message>
+        <source>預估：{paths}｜讀取 {read} MB，寫入 {written} MB，約需 {time}</source>
+        <translation>Estimate: {paths} | read {read} MB, write {written} MB, about {time}</translation>
+    </message>
+    <message>
+        <source>{device} 空間不足：需要 {required} MB，剩餘 {free} MB</source>
+        <translation>Not enough space on {device}: {required} MB needed, {free} MB free</translation>
+    </message>
+    <message>
+        <source>{errors} 個檔案無法讀取</source>
+        <translation>{errors} files could not be read</translation>
+    </message>
+    <message>
+        <source>打包壓縮：</source>
+        <translation>Folder compression:</translation>
+    </message>
+    <message>
+        <source>不壓縮</source>
+        <translation>Stored</translation>
+    </message>
+    <message>
+        <source>全部壓縮</source>
+        <translation>Deflate all</translation>
+    </message>
+    <message>
+        <source>依副檔名壓縮</source>
+        <translation>Deflate by extension</translation>
+    </message>
+    <message>
+        <source>壓縮等級：</source>
+        <translation>Compression level:</translation>
+    </message>
+    <message>
+        <source>不壓縮副檔名：</source>
+        <translation>Stored extensions:</translation>
+    </message>
+    <message>
+        <source>輸出驗證：</source>
+        <translation>Verify output:</translation>
+    </message>
+    <message>
+        <source>抽樣檢查</source>
+        <translation>Sampled</translation>
+    </message>
+    <message>
+        <source>完整檢查</source>
+        <translation>Full</translation>
+    </message>
+    <message>
+        <source>預讀深度：</source>
+        <translation>Read-ahead depth:</translation>
+    </message>
+    <message>
+        <source>寫入佇列深度：</source>
+        <translation>Write queue depth:</translation>
+    </message>
+    <message>
+        <source>檔名規則：</source>
+        <translation>Filename pattern:</translation>
+    </message>
+    <message>
+        <source>正規表示式，編輯欄位中以 {match:1} 或 {match:名稱} 取用擷取群組</source>
+        <translation>Regular expression; use {match:1} or {match:name} in editor fields to insert captured groups</translation>
+    </message>
+    <message>
+        <source>保留 ComicInfo 原始格式（只修改有變更的欄位）</source>
+        <translation>Preserve original ComicInfo formatting (rewrite changed fields only)</translation>
+    </message>
+</context>
+</TS>
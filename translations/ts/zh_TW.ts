@@ -214,6 +214,22 @@
         <source>所有漫畫處理完成！</source>
         <translation type="unfinished"></translation>
     </message>
+    <message>
+        <source>批次處理進行中</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>處理完成，{failed} / {total} 個檔案失敗</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>上次的批次處理未完成（已完成 {done} / {total} 個檔案），是否繼續處理剩餘的檔案？</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>{verify_failed} 個輸出檔驗證失敗</source>
+        <translation type="unfinished"></translation>
+    </message>
 </context>
 <context>
     <name>ui_constants</name>
@@ -332,5 +348,161 @@
         <source>語言選擇：</source>
         <translation type="unfinished"></translation>
     </message>
+    <message>
+        <source>讀取執行緒數：</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>掃描中… 資料夾 {dirs} / 壓縮檔 {archives}（共 {size} MB）</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>忽略項目：</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>監看模式：</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>關閉</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>檔案系統通知</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>定時輪詢</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>追加寫入</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>整理門檻（%）：</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>複製緩衝（KB）：</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>單一工作記憶體上限（MB）：</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>批次處理執行緒數：</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>略過未變更的檔案</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>資料夾寫入模式：</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>打包為壓縮檔</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>僅寫入 ComicInfo.xml</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>傳統硬碟並行數：</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>網路磁碟並行數：</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>預估</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>直接複製</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>略過</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>未知</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>預估：{paths}｜讀取 {read} MB，寫入 {written} MB，約需 {time}</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>{device} 空間不足：需要 {required} MB，剩餘 {free} MB</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>{errors} 個檔案無法讀取</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>打包壓縮：</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>不壓縮</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>全部壓縮</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>依副檔名壓縮</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>壓縮等級：</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>不壓縮副檔名：</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>輸出驗證：</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>抽樣檢查</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>完整檢查</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>預讀深度：</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>寫入佇列深度：</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>檔名規則：</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>正規表示式，編輯欄位中以 {match:1} 或 {match:名稱} 取用擷取群組</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>保留 ComicInfo 原始格式（只修改有變更的欄位）</source>
+        <translation type="unfinished"></translation>
+    </message>
 </context>
 </TS>